@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Browser Backends
+
+Compares the Selenium (undetected-chromedriver) and Playwright backends of
+browser_backend.py on a local fixture site with a meeting list and N
+meeting pages:
+
+- startup:    browser launch until the first page can be opened
+- navigation: loading the meeting list page until its links are rendered
+- extraction: serializing one meeting's transcript in the page
+- batch:      fetching every meeting page with the given concurrency
+
+Both backends start without a tldv session and without resource blocking.
+
+Usage:
+    python benchmarks/bench_backends.py
+    python benchmarks/bench_backends.py --meetings 8 --segments 600 --concurrency 4
+    python benchmarks/bench_backends.py --backend playwright
+"""
+
+import argparse
+import asyncio
+import functools
+import http.server
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import browser_backend
+from browser_backend import (
+    BACKENDS,
+    PlaywrightBackend,
+    SeleniumBackend,
+    extract_transcript,
+    fetch_transcripts,
+)
+from tldv_scraper import MEETING_LIST_SCRIPT, TldvScraper
+
+SPEAKERS = ["山中", "田中", "佐藤", "鈴木"]
+
+
+def meeting_id(i: int) -> str:
+    """Return a meeting ID that looks like tldv's."""
+    return f"65f0c0ffee{i:014d}"
+
+
+def build_meeting(segments: int) -> str:
+    """Build a meeting page with a transcript tab and rendered segments."""
+    rows = []
+    for i in range(segments):
+        seconds = i * 4
+        rows.append(
+            f'<div class="segment" data-segment-id="s{i}">'
+            f'<span class="speaker">{SPEAKERS[(i // 3) % len(SPEAKERS)]}</span>'
+            f'<span class="timestamp">{seconds // 60}:{seconds % 60:02d}</span>'
+            f'<p class="text">セグメント {i}: 議事録の自動生成と MCP サーバーの設定について話しました。</p></div>'
+        )
+    return ("<html><body><main><button>Transcript</button>"
+            f"<div data-testid='transcript'>{''.join(rows)}</div></main></body></html>")
+
+
+def build_site(root: Path, meetings: int, segments: int) -> None:
+    """Write the meeting list and meeting pages."""
+    links = "".join(
+        f"<a href='/app/meetings/{meeting_id(i)}'>AI定例 #{meetings - i}"
+        f"<time datetime='2026-02-{(i % 28) + 1:02d}'></time></a>"
+        for i in range(meetings)
+    )
+    (root / "app" / "meetings").mkdir(parents=True)
+    (root / "app" / "meetings" / "index.html").write_text(
+        f"<html><body><main>{links}</main></body></html>", encoding="utf-8")
+    page = build_meeting(segments)
+    for i in range(meetings):
+        (root / "app" / "meetings" / meeting_id(i)).write_text(page, encoding="utf-8")
+
+
+def serve(root: Path) -> http.server.ThreadingHTTPServer:
+    """Serve the fixture site on a free local port (meeting pages have no extension)."""
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        extensions_map = {"": "text/html; charset=utf-8", ".html": "text/html; charset=utf-8"}
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(Handler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def create(name: str):
+    """Create a backend without a tldv session or blocking."""
+    if name == "playwright":
+        return PlaywrightBackend(headless=True, snapshot=None, block_resources=False,
+                                 login=False)
+    scraper = TldvScraper(headless=True, capture_network=False, use_http=False,
+                          use_cache=False, block_resources=False)
+    return SeleniumBackend(scraper, login=False)
+
+
+async def measure(name: str, base: str, meetings: list, concurrency: int) -> dict:
+    """Run every phase once on one backend."""
+    backend = create(name)
+    result = {"name": name}
+    started = time.perf_counter()
+    await backend.start()
+    try:
+        page = await backend.new_page()
+        result["startup"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        await page.goto(f"{base}/app/meetings/", "meeting_list")
+        while not await page.evaluate(MEETING_LIST_SCRIPT):
+            await asyncio.sleep(0.01)
+        result["navigation"] = time.perf_counter() - started
+
+        await page.goto(f"{base}/app/meetings/{meetings[0]}", "meeting_detail")
+        while not await page.evaluate("return !!document.querySelector('.segment');"):
+            await asyncio.sleep(0.01)
+        started = time.perf_counter()
+        transcript = await extract_transcript(page)
+        result["extraction"] = time.perf_counter() - started
+        result["chars"] = len(transcript or "")
+        await page.close()
+
+        urls = [f"{base}/app/meetings/{m}" for m in meetings]
+        started = time.perf_counter()
+        fetched = [r async for r in fetch_transcripts(backend, urls, concurrency)]
+        result["batch"] = time.perf_counter() - started
+        result["ok"] = sum(1 for r in fetched if r["transcript"])
+    finally:
+        await backend.close()
+    return result
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Browser backend benchmark")
+    parser.add_argument("--backend", choices=BACKENDS, action="append",
+                        help="Backend to measure (repeatable, default: both)")
+    parser.add_argument("--meetings", type=int, default=6, help="Meeting pages on the site")
+    parser.add_argument("--segments", type=int, default=600, help="Transcript segments per page")
+    parser.add_argument("--concurrency", type=int, default=3,
+                        help="Meeting pages open at the same time in the batch phase")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp())
+    build_site(root, args.meetings, args.segments)
+    server = serve(root)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    meetings = [meeting_id(i) for i in range(args.meetings)]
+
+    # The fixture has no transcript stability delay worth waiting for
+    browser_backend.TRANSCRIPT_STABLE_WINDOW = 0.05
+
+    results = []
+    try:
+        for name in args.backend or BACKENDS:
+            results.append(asyncio.run(measure(name, base, meetings, args.concurrency)))
+    finally:
+        server.shutdown()
+
+    print(f"\nBrowser backends ({args.meetings} meetings x {args.segments} segments, "
+          f"concurrency {args.concurrency})")
+    print(f"{'backend':<12}{'startup':>10}{'navigation':>12}{'extraction':>12}"
+          f"{'batch':>10}{'fetched':>9}")
+    for r in results:
+        print(f"{r['name']:<12}{r['startup'] * 1000:>8.0f}ms{r['navigation'] * 1000:>10.0f}ms"
+              f"{r['extraction'] * 1000:>10.0f}ms{r['batch'] * 1000:>8.0f}ms"
+              f"{r['ok']:>5}/{args.meetings}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Headless Modes
+
+Launches Chrome the way TldvScraper._create_driver does in each headless
+mode and compares them:
+
+- startup:  browser launch until the WebDriver session is ready
+- RSS:      resident memory of the Chrome process tree after loading the
+            test page (plus Xvfb, if the offscreen window runs on one)
+- signals:  automation signals checked by the local test page, the way a
+            bot-detection script would see them
+
+Offscreen mode needs a display; it is skipped on Linux without DISPLAY
+(run under `xvfb-run` to compare the two).
+
+Usage:
+    python benchmarks/bench_headless.py
+    python benchmarks/bench_headless.py --mode new --repeat 3
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from headless import resolve_mode
+from process_memory import process_tree_rss
+from tldv_scraper import TldvScraper
+
+MODES = ("offscreen", "new")
+
+# Runs in the test page like a bot-detection script; True means "looks automated"
+SIGNALS_PAGE = """<html><head><script>
+(function () {
+    var s = {};
+    s.webdriver = navigator.webdriver === true;
+    s.headless_user_agent = /HeadlessChrome/.test(navigator.userAgent);
+    s.headless_client_hints = !!(navigator.userAgentData && navigator.userAgentData.brands.some(
+        function (b) { return /Headless/.test(b.brand); }));
+    s.no_languages = !navigator.languages || navigator.languages.length === 0;
+    s.no_plugins = navigator.plugins.length === 0;
+    s.no_window_chrome = !window.chrome || !window.chrome.runtime;
+    s.zero_outer_size = window.outerWidth === 0 || window.outerHeight === 0;
+    s.small_screen = screen.width < window.innerWidth || screen.height < window.innerHeight;
+    var gl = document.createElement('canvas').getContext('webgl');
+    var info = gl && gl.getExtension('WEBGL_debug_renderer_info');
+    s.software_webgl = !!(info && /SwiftShader|llvmpipe/i.test(
+        gl.getParameter(info.UNMASKED_RENDERER_WEBGL)));
+    navigator.permissions.query({name: 'notifications'}).then(function (p) {
+        s.permission_mismatch = Notification.permission === 'denied' && p.state === 'prompt';
+        window.__signals = s;
+    });
+})();
+</script></head><body><main>signals</main></body></html>"""
+
+
+def xvfb_rss() -> int:
+    """Return the RSS of running Xvfb servers in bytes (0 if none)."""
+    try:
+        output = subprocess.run(["ps", "-A", "-o", "rss=,comm="], capture_output=True,
+                                text=True, check=True).stdout
+    except (OSError, subprocess.SubprocessError):
+        return 0
+    return sum(int(line.split()[0]) * 1024 for line in output.splitlines()
+               if line.strip().endswith("Xvfb"))
+
+
+def measure_once(mode: str, url: str) -> dict:
+    """Launch Chrome in one mode, load the test page and collect the results."""
+    scraper = TldvScraper(headless=True, capture_network=False, use_http=False,
+                          use_cache=False, block_resources=False, headless_mode=mode)
+    scraper.driver = scraper._create_driver(use_profile=False)
+    try:
+        scraper.driver.get(url)
+        signals = None
+        deadline = time.monotonic() + 10
+        while signals is None and time.monotonic() < deadline:
+            signals = scraper.driver.execute_script("return window.__signals || null;")
+            time.sleep(0.05)
+        tree = process_tree_rss(scraper.driver.browser_pid) or {"rss": 0, "processes": 0}
+    finally:
+        scraper.driver.quit()
+
+    display = xvfb_rss() if mode == "offscreen" else 0
+    return {"startup": scraper.startup_seconds, "rss": tree["rss"] + display,
+            "xvfb": display, "processes": tree["processes"], "signals": signals or {}}
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Headless mode benchmark")
+    parser.add_argument("--mode", choices=MODES, action="append",
+                        help="Mode to measure (repeatable, default: both)")
+    parser.add_argument("--repeat", type=int, default=1, help="Launches per mode")
+    args = parser.parse_args()
+
+    page = Path(tempfile.mkdtemp()) / "signals.html"
+    page.write_text(SIGNALS_PAGE, encoding="utf-8")
+
+    results = {}
+    for mode in args.mode or MODES:
+        if mode == "offscreen" and resolve_mode("auto") == "new":
+            print("offscreen: skipped (no display; run under xvfb-run to compare)")
+            continue
+        results[mode] = [measure_once(mode, page.as_uri()) for _ in range(args.repeat)]
+
+    print(f"\nHeadless modes (median of {args.repeat} launches)")
+    print(f"{'mode':<12}{'startup (ms)':>14}{'RSS (MB)':>10}{'Xvfb (MB)':>11}{'processes':>11}")
+    for mode, runs in results.items():
+        print(f"{mode:<12}"
+              f"{statistics.median(r['startup'] for r in runs) * 1000:>14.0f}"
+              f"{statistics.median(r['rss'] for r in runs) / 2**20:>10.0f}"
+              f"{statistics.median(r['xvfb'] for r in runs) / 2**20:>11.0f}"
+              f"{runs[0]['processes']:>11}")
+
+    print("\nAutomation signals (x = detected)")
+    names = sorted({name for runs in results.values() for name in runs[0]["signals"]})
+    print(f"{'signal':<24}" + "".join(f"{mode:>12}" for mode in results))
+    for name in names:
+        print(f"{name:<24}" + "".join(
+            f"{'x' if runs[0]['signals'].get(name) else '-':>12}" for runs in results.values()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
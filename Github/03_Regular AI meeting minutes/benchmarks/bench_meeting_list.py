@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Meeting List Extraction
+
+Compares the per-anchor WebDriver approach (find_elements, then
+get_attribute("href") and .text for every link) with the single in-page
+script used by TldvScraper._collect_meeting_links, on a local fixture page
+with N meeting links. Reports wall time and WebDriver round-trips.
+
+Usage:
+    python benchmarks/bench_meeting_list.py
+    python benchmarks/bench_meeting_list.py --meetings 500 --repeat 10
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from selenium.webdriver.common.by import By
+
+from tldv_scraper import TldvScraper
+
+
+def build_fixture(count: int) -> str:
+    """Build a meeting list page with the given number of meetings."""
+    rows = []
+    for i in range(count):
+        meeting_id = f"{i:024x}"
+        rows.append(
+            f'<li><a href="https://tldv.io/app/meetings/{meeting_id}">'
+            f'<div class="title">AI定例MTG #{i}</div>'
+            f'<time datetime="2026-01-{i % 28 + 1:02d}">2026年1月{i % 28 + 1}日</time>'
+            f'<span class="duration">{30 + i % 60}分</span></a></li>'
+        )
+    return f"<html><body><main><ul>{''.join(rows)}</ul></main></body></html>"
+
+
+class RoundTripCounter:
+    """Counts WebDriver commands sent by a driver."""
+
+    def __init__(self, driver):
+        self.count = 0
+        self._execute = driver.execute
+        driver.execute = self._counted
+
+    def _counted(self, *args, **kwargs):
+        self.count += 1
+        return self._execute(*args, **kwargs)
+
+
+def legacy_extract(driver) -> list:
+    """Per-anchor extraction as previously done by find_target_meeting."""
+    meetings = []
+    for link in driver.find_elements(By.CSS_SELECTOR, "a[href*='/app/meetings/']"):
+        href = link.get_attribute("href") or ""
+        meeting_id = href.split("/")[-1]
+        if len(meeting_id) < 10:
+            continue
+        meetings.append((meeting_id, link.text.strip()))
+    return meetings
+
+
+def measure(name: str, func, counter: RoundTripCounter, repeat: int) -> dict:
+    """Run an extraction repeatedly and collect timings and round-trips."""
+    times = []
+    trips = 0
+    found = 0
+    for _ in range(repeat):
+        counter.count = 0
+        started = time.perf_counter()
+        found = len(func())
+        times.append(time.perf_counter() - started)
+        trips = counter.count
+    return {
+        "name": name,
+        "median_ms": statistics.median(times) * 1000,
+        "round_trips": trips,
+        "meetings": found,
+    }
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Meeting list extraction benchmark")
+    parser.add_argument("--meetings", type=int, default=300, help="Meetings on the fixture page")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per approach")
+    args = parser.parse_args()
+
+    fixture = Path(tempfile.mkdtemp()) / "meetings.html"
+    fixture.write_text(build_fixture(args.meetings), encoding="utf-8")
+
+    scraper = TldvScraper(headless=True, capture_network=False, use_http=False, use_cache=False)
+    scraper.driver = scraper._create_driver(use_profile=False)
+    try:
+        scraper.driver.get(fixture.as_uri())
+        counter = RoundTripCounter(scraper.driver)
+
+        results = [
+            measure("per-anchor (legacy)", lambda: legacy_extract(scraper.driver),
+                    counter, args.repeat),
+            measure("in-page script", scraper._collect_meeting_links, counter, args.repeat),
+        ]
+    finally:
+        scraper.driver.quit()
+
+    print(f"\nMeeting list extraction ({args.meetings} meetings, median of {args.repeat})")
+    print(f"{'approach':<22}{'time (ms)':>12}{'round-trips':>14}{'meetings':>10}")
+    for r in results:
+        print(f"{r['name']:<22}{r['median_ms']:>12.1f}{r['round_trips']:>14}{r['meetings']:>10}")
+
+    legacy, bulk = results
+    print(f"\nRound-trip reduction: {legacy['round_trips']} -> {bulk['round_trips']} "
+          f"({legacy['median_ms'] / max(bulk['median_ms'], 0.001):.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
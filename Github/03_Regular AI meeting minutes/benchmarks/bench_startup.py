@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Browser Startup
+
+Measures the cold-start phases of TldvScraper._create_driver:
+
+- version:    Chrome version detection
+- driver:     patched chromedriver lookup (or download and patch when cold)
+- spawn:      Chrome process launch by undetected-chromedriver
+- handshake:  chromedriver start and WebDriver session creation
+- navigation: first page load (local fixture page unless --url is given)
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 5 --cold
+    python benchmarks/bench_startup.py --url https://tldv.io/app/signin
+"""
+
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
+
+import driver_cache
+import tldv_scraper
+from tldv_scraper import TldvScraper
+
+PHASES = ("version", "driver", "spawn", "handshake", "navigation")
+
+
+class PhaseTimer:
+    """Times the startup phases by wrapping the functions _create_driver calls."""
+
+    def __init__(self):
+        self.marks = {}
+        self._detect = tldv_scraper.detect_chrome_version
+        self._ensure = tldv_scraper.ensure_driver
+        self._session_init = ChromeWebDriver.__init__
+
+    def _timed(self, name, func):
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.marks[name] = time.perf_counter() - started
+        return wrapper
+
+    def install(self) -> None:
+        """Wrap version detection, driver lookup and the WebDriver session setup."""
+        tldv_scraper.detect_chrome_version = self._timed("version", self._detect)
+        tldv_scraper.ensure_driver = self._timed("driver", self._ensure)
+        # undetected-chromedriver launches Chrome, then calls the Selenium
+        # constructor, which starts chromedriver and creates the session
+        ChromeWebDriver.__init__ = self._timed("handshake", self._session_init)
+
+    def uninstall(self) -> None:
+        """Restore the wrapped functions."""
+        tldv_scraper.detect_chrome_version = self._detect
+        tldv_scraper.ensure_driver = self._ensure
+        ChromeWebDriver.__init__ = self._session_init
+
+
+def measure_once(timer: PhaseTimer, url: str) -> dict:
+    """Start a browser, load one page, and return the phase timings."""
+    timer.marks = {}
+    scraper = TldvScraper(headless=True, capture_network=False, use_http=False,
+                          use_cache=False, block_resources=False)
+    started = time.perf_counter()
+    scraper.driver = scraper._create_driver(use_profile=False)
+    total = time.perf_counter() - started
+    try:
+        started = time.perf_counter()
+        scraper.driver.get(url)
+        timer.marks["navigation"] = time.perf_counter() - started
+    finally:
+        scraper.driver.quit()
+
+    known = sum(timer.marks.get(name, 0) for name in ("version", "driver", "handshake"))
+    timer.marks["spawn"] = max(total - known, 0)
+    return dict(timer.marks)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Browser startup benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Browser launches")
+    parser.add_argument("--cold", action="store_true",
+                        help="Clear the chromedriver cache before the first launch")
+    parser.add_argument("--url", type=str, help="First page to load (default: local fixture)")
+    args = parser.parse_args()
+
+    url = args.url
+    if not url:
+        fixture = Path(tempfile.mkdtemp()) / "blank.html"
+        fixture.write_text("<html><body><main>startup</main></body></html>", encoding="utf-8")
+        url = fixture.as_uri()
+
+    if args.cold:
+        shutil.rmtree(driver_cache.DRIVER_CACHE_DIR, ignore_errors=True)
+
+    timer = PhaseTimer()
+    timer.install()
+    runs = []
+    try:
+        for i in range(args.repeat):
+            runs.append(measure_once(timer, url))
+            print(f"run {i + 1}: " + ", ".join(
+                f"{name}={runs[-1].get(name, 0) * 1000:.0f}ms" for name in PHASES))
+    finally:
+        timer.uninstall()
+
+    print(f"\nBrowser startup (median of {len(runs)} launches"
+          f"{', first launch cold' if args.cold else ''})")
+    print(f"{'phase':<12}{'median (ms)':>14}{'first (ms)':>14}")
+    for name in PHASES:
+        values = [run.get(name, 0) * 1000 for run in runs]
+        print(f"{name:<12}{statistics.median(values):>14.0f}{values[0]:>14.0f}")
+    totals = [sum(run.values()) * 1000 for run in runs]
+    print(f"{'total':<12}{statistics.median(totals):>14.0f}{totals[0]:>14.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Transcript Extraction
+
+Compares element.text on the transcript container (layout-dependent
+innerText returned as one flattened string) with the in-page serializer used
+by TldvScraper._extract_transcript (read_rendered_segments), on a local
+fixture page with N transcript segments. Reports latency, payload size and
+how many segments keep their speaker and timestamp.
+
+Usage:
+    python benchmarks/bench_transcript_extract.py
+    python benchmarks/bench_transcript_extract.py --segments 3000 --repeat 10
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from selenium.webdriver.common.by import By
+
+from tldv_scraper import TRANSCRIPT_SELECTORS, TldvScraper
+from transcript_stream import read_rendered_segments
+
+SPEAKERS = ["山中", "田中", "佐藤", "鈴木"]
+
+
+def build_fixture(count: int) -> str:
+    """Build a meeting page with a transcript of the given number of segments."""
+    rows = []
+    for i in range(count):
+        seconds = i * 4
+        speaker = SPEAKERS[(i // 3) % len(SPEAKERS)]
+        rows.append(
+            f'<div class="segment" data-segment-id="s{i}">'
+            f'<span class="speaker">{speaker}</span>'
+            f'<span class="timestamp">{seconds // 60}:{seconds % 60:02d}</span>'
+            f'<p class="text">Claude Code の使い方について、実際に試した結果を共有します。'
+            f'セグメント {i} では MCP サーバーの設定と権限の扱いを説明しています。</p></div>'
+        )
+    return ("<html><body><main><div data-testid='transcript'>"
+            f"{''.join(rows)}</div></main></body></html>")
+
+
+def element_text(driver) -> dict:
+    """Extract the container's innerText as a single string."""
+    element = driver.find_element(By.CSS_SELECTOR, "[data-testid='transcript']")
+    text = element.text
+    return {"bytes": len(text.encode("utf-8")), "segments": None}
+
+
+def serialized(driver) -> dict:
+    """Extract structured segments with one injected script."""
+    _, segments, size = read_rendered_segments(driver, TRANSCRIPT_SELECTORS)
+    structured = sum(1 for s in segments if s.speaker and s.start_ms is not None)
+    return {"bytes": size, "segments": len(segments), "structured": structured}
+
+
+def measure(name: str, func, driver, repeat: int) -> dict:
+    """Run an extraction repeatedly and collect timings and payload size."""
+    times = []
+    result = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(driver)
+        times.append(time.perf_counter() - started)
+    return {"name": name, "median_ms": statistics.median(times) * 1000, **result}
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Transcript extraction benchmark")
+    parser.add_argument("--segments", type=int, default=1500,
+                        help="Transcript segments on the fixture page (about 90 minutes)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per approach")
+    args = parser.parse_args()
+
+    fixture = Path(tempfile.mkdtemp()) / "meeting.html"
+    fixture.write_text(build_fixture(args.segments), encoding="utf-8")
+
+    scraper = TldvScraper(headless=True, capture_network=False, use_http=False,
+                          use_cache=False, block_resources=False)
+    scraper.driver = scraper._create_driver(use_profile=False)
+    try:
+        scraper.driver.get(fixture.as_uri())
+        results = [
+            measure("element.text", element_text, scraper.driver, args.repeat),
+            measure("in-page JSON", serialized, scraper.driver, args.repeat),
+        ]
+    finally:
+        scraper.driver.quit()
+
+    print(f"\nTranscript extraction ({args.segments} segments, median of {args.repeat})")
+    print(f"{'approach':<16}{'time (ms)':>12}{'payload (KB)':>15}{'segments':>10}")
+    for r in results:
+        segments = r["segments"] if r["segments"] is not None else "-"
+        print(f"{r['name']:<16}{r['median_ms']:>12.1f}{r['bytes'] / 1024:>15.1f}{segments:>10}")
+
+    text, json_ = results
+    print(f"\nSpeaker and timestamp kept for {json_['structured']} of {json_['segments']} segments; "
+          f"{text['median_ms'] / max(json_['median_ms'], 0.001):.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
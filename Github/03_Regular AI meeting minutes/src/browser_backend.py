@@ -0,0 +1,625 @@
+"""
+Pluggable Browser Backends
+
+Puts the browser operations the scraper needs (open a page, navigate, run a
+script, close) behind one async interface with two implementations:
+
+- SeleniumBackend:   the existing undetected-chromedriver session. Every
+                     command is a blocking WebDriver HTTP call, so calls run
+                     in a worker thread, one at a time.
+- PlaywrightBackend: Playwright's async API over the DevTools protocol.
+                     Several pages load and extract concurrently in one
+                     browser context that reuses the saved session snapshot.
+
+Page scripts are written for Selenium's execute_script (arguments[...] and
+return), so the same scripts run unchanged on both backends.
+
+fetch_transcripts(), list_meetings() and fetch_latest() implement the
+meeting page flow on top of any backend.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from meeting_index import MeetingIndex, parse_meeting_date
+from page_waits import (
+    MEETING_LIST_TIMEOUT,
+    MEETING_PAGE_TIMEOUT,
+    MIN_TRANSCRIPT_LENGTH,
+    POLL_INTERVAL,
+    TRANSCRIPT_STABLE_WINDOW,
+)
+from headless import fingerprint_script, resolve_mode, user_agent_override
+from low_memory import LOW_MEMORY_WINDOW, low_memory_arguments
+from resource_blocking import BLOCK_PROFILES, resource_class
+from session_store import playwright_storage_state, restore_storage_script
+from transcript import format_segments
+from transcript_stream import SERIALIZE_SEGMENTS_SCRIPT, decode_rendered_segments
+from tldv_scraper import (
+    BATCH_MAX_TABS,
+    MEETING_LIST_SCRIPT,
+    MEETINGS_URL,
+    TRANSCRIPT_SELECTORS,
+    TRANSCRIPT_TAB_XPATHS,
+    TldvScraper,
+    meeting_url_for,
+)
+
+# Available backends
+BACKENDS = ("selenium", "playwright")
+
+# Playwright resource types blocked along with the URL patterns of a class
+_RESOURCE_TYPES = {"images": "image", "media": "media", "fonts": "font"}
+
+# Returns "signin", "ready" (transcript tab or container rendered) or null
+_MEETING_STATE_SCRIPT = """
+if (/signin|login/.test(location.href)) { return 'signin'; }
+var xpaths = arguments[0], selectors = arguments[1];
+for (var i = 0; i < xpaths.length; i++) {
+    if (document.evaluate(xpaths[i], document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue) { return 'ready'; }
+}
+for (var j = 0; j < selectors.length; j++) {
+    if (document.querySelector(selectors[j])) { return 'ready'; }
+}
+return null;
+"""
+
+# Clicks the first visible transcript tab; returns its index or null
+_CLICK_TAB_SCRIPT = """
+var xpaths = arguments[0];
+for (var i = 0; i < xpaths.length; i++) {
+    var el = document.evaluate(xpaths[i], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (el && el.getClientRects().length) { el.click(); return i; }
+}
+return null;
+"""
+
+
+class BackendPage(ABC):
+    """One browser tab."""
+
+    @abstractmethod
+    async def goto(self, url: str, page_type: str) -> None:
+        """Navigate to a URL using the blocking profile of the page type."""
+
+    @abstractmethod
+    async def url(self) -> str:
+        """Return the current URL."""
+
+    @abstractmethod
+    async def evaluate(self, script: str, *args: Any) -> Any:
+        """Run a Selenium-style script (arguments[...], return) and return its result."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the tab."""
+
+
+class BrowserBackend(ABC):
+    """A browser with an authenticated tldv session."""
+
+    name = ""
+
+    def __init__(self):
+        self.startup_seconds: Optional[float] = None
+        self.navigations: List[str] = []
+        # Meeting list read by the login check on start, for fetch_latest to reuse
+        self.listed_meetings: Optional[List[Dict]] = None
+
+    @abstractmethod
+    async def start(self) -> bool:
+        """Launch the browser. Returns False if no usable session is available."""
+
+    @abstractmethod
+    async def new_page(self) -> BackendPage:
+        """Open a new tab."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Shut down the browser."""
+
+    async def __aenter__(self) -> "BrowserBackend":
+        if not await self.start():
+            await self.close()
+            raise RuntimeError(f"{self.name} backend could not start a tldv session")
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+class _SeleniumPage(BackendPage):
+    """A window handle of the shared WebDriver session."""
+
+    def __init__(self, backend: "SeleniumBackend", handle: str):
+        self.backend = backend
+        self.handle = handle
+
+    def _switch(self) -> None:
+        driver = self.backend.scraper.driver
+        if driver.current_window_handle != self.handle:
+            driver.switch_to.window(self.handle)
+
+    async def goto(self, url: str, page_type: str) -> None:
+        def run():
+            self._switch()
+            self.backend.scraper._block_for(page_type)
+            # Assigning location returns immediately, unlike driver.get()
+            self.backend.scraper.driver.execute_script("window.location.href = arguments[0];", url)
+        await self.backend._call(run)
+        self.backend.navigations.append(page_type)
+
+    async def url(self) -> str:
+        def run():
+            self._switch()
+            return self.backend.scraper.driver.current_url
+        return await self.backend._call(run)
+
+    async def evaluate(self, script: str, *args: Any) -> Any:
+        def run():
+            self._switch()
+            return self.backend.scraper.driver.execute_script(script, *args)
+        return await self.backend._call(run)
+
+    async def close(self) -> None:
+        def run():
+            driver = self.backend.scraper.driver
+            if len(driver.window_handles) > 1:
+                self._switch()
+                driver.close()
+                driver.switch_to.window(driver.window_handles[0])
+        await self.backend._call(run)
+
+
+class SeleniumBackend(BrowserBackend):
+    """The undetected-chromedriver session of a TldvScraper behind the async interface."""
+
+    name = "selenium"
+
+    def __init__(self, scraper: TldvScraper, login: bool = True):
+        """
+        Initialize the backend.
+
+        Args:
+            scraper: Scraper whose driver, session restore and blocking are used
+            login: Restore or check the tldv session on start; False starts a
+                plain browser without the profile (benchmarks on local pages)
+        """
+        super().__init__()
+        self.scraper = scraper
+        self.login = login
+        self._lock = asyncio.Lock()
+        self._first_page = True
+
+    async def _call(self, func):
+        """Run a blocking WebDriver call in a worker thread; the driver is not thread-safe."""
+        async with self._lock:
+            return await asyncio.to_thread(func)
+
+    async def start(self) -> bool:
+        started = time.monotonic()
+        if self.login:
+            ok = await asyncio.to_thread(self.scraper.start_session)
+        else:
+            self.scraper.driver = await asyncio.to_thread(
+                lambda: self.scraper._create_driver(use_profile=False)
+            )
+            ok = True
+        self.startup_seconds = time.monotonic() - started
+        return ok
+
+    async def new_page(self) -> BackendPage:
+        def run():
+            driver = self.scraper.driver
+            # The first page reuses the window the driver opened with
+            if self._first_page:
+                self._first_page = False
+            else:
+                self.scraper._open_tab()
+            return driver.current_window_handle
+        return _SeleniumPage(self, await self._call(run))
+
+    async def close(self) -> None:
+        if self.scraper.driver:
+            await asyncio.to_thread(self.scraper.close)
+
+
+class _PlaywrightPage(BackendPage):
+    """A Playwright page."""
+
+    def __init__(self, backend: "PlaywrightBackend", page):
+        self.backend = backend
+        self.page = page
+
+    async def goto(self, url: str, page_type: str) -> None:
+        self.backend.page_types[self.page] = page_type
+        # Only wait for the HTML; the app renders the page after that
+        await self.page.goto(url, wait_until="commit")
+        self.backend.navigations.append(page_type)
+
+    async def url(self) -> str:
+        return self.page.url
+
+    async def evaluate(self, script: str, *args: Any) -> Any:
+        # Playwright passes one argument; spread it into Selenium's arguments[...]
+        return await self.page.evaluate(
+            f"args => (function () {{ {script} }}).apply(null, args)", list(args)
+        )
+
+    async def close(self) -> None:
+        self.backend.page_types.pop(self.page, None)
+        await self.page.close()
+
+
+class PlaywrightBackend(BrowserBackend):
+    """Chromium driven by Playwright's async API, reusing the saved session snapshot."""
+
+    name = "playwright"
+
+    def __init__(self, headless: bool = True, snapshot: Optional[Dict] = None,
+                 block_resources: bool = True, headless_mode: str = "auto",
+                 low_memory: bool = False, login: bool = True):
+        """
+        Initialize the backend.
+
+        Args:
+            headless: Hide the browser window
+            snapshot: Session snapshot from SessionStore.load()
+            block_resources: Block request classes per page type (BLOCK_PROFILES)
+            headless_mode: "offscreen", "new" or "auto" (see headless.py)
+            low_memory: Use the low-memory Chrome options (see low_memory.py)
+            login: Check on start that the snapshot is a logged-in tldv
+                session; False starts without one (benchmarks on local pages)
+        """
+        super().__init__()
+        self.login = login
+        self.headless = headless
+        self.headless_mode = headless_mode
+        self.low_memory = low_memory
+        self.snapshot = snapshot
+        self.block_resources = block_resources
+        self.page_types: Dict[Any, str] = {}
+        self.blocked = 0
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._stealth_page: Optional[Callable] = None
+
+    async def start(self) -> bool:
+        # Imported here so the Selenium backend works without Playwright installed
+        from playwright.async_api import async_playwright
+
+        if self.login and not self.snapshot:
+            return False
+
+        started = time.monotonic()
+        args = ["--disable-blink-features=AutomationControlled", "--lang=ja-JP"]
+        args += low_memory_arguments() if self.low_memory else ["--window-size=1920,1080"]
+        width, height = LOW_MEMORY_WINDOW if self.low_memory else (1920, 1080)
+        mode = resolve_mode(self.headless_mode) if self.headless else "window"
+        if mode == "offscreen":
+            args.append("--window-position=-10000,-10000")
+
+        self._playwright = await async_playwright().start()
+        # channel="chromium" is the full browser in the new headless mode
+        # (Playwright's default headless build is the detectable headless shell)
+        self._browser = await self._playwright.chromium.launch(
+            headless=mode == "new", channel="chromium" if mode == "new" else None, args=args
+        )
+        user_agent = None
+        if mode == "new":
+            cdp = await self._browser.new_browser_cdp_session()
+            version = await cdp.send("Browser.getVersion")
+            user_agent = user_agent_override(version["userAgent"])["userAgent"]
+        self._context = await self._browser.new_context(
+            storage_state=playwright_storage_state(self.snapshot) if self.snapshot else None,
+            locale="ja-JP",
+            viewport={"width": width, "height": height},
+            user_agent=user_agent,
+        )
+        if mode == "new":
+            await self._context.add_init_script(script=fingerprint_script())
+        if self.snapshot:
+            # sessionStorage is not part of Playwright's storage state
+            await self._context.add_init_script(script=restore_storage_script(self.snapshot))
+        self._stealth_page = await self._apply_stealth()
+        if self.block_resources:
+            await self._context.route("**/*", self._route)
+        self.startup_seconds = time.monotonic() - started
+
+        if self.login:
+            self.listed_meetings = await list_meetings(self)
+        if self.login and self.listed_meetings is None:
+            print("Saved session was not accepted by tldv. "
+                  "Please run with --login option to authenticate first.")
+            return False
+        return True
+
+    async def _apply_stealth(self) -> Optional[Callable]:
+        """
+        Apply playwright-stealth if it is installed.
+
+        Returns:
+            The per-page patch function of playwright-stealth 1.x, or None
+            (2.x patches the whole context here)
+        """
+        try:
+            from playwright_stealth import Stealth
+        except ImportError:
+            pass
+        else:
+            await Stealth().apply_stealth_async(self._context)
+            return None
+        try:
+            from playwright_stealth import stealth_async
+        except ImportError:
+            return None
+        return stealth_async
+
+    async def _route(self, route) -> None:
+        """Abort requests of the classes blocked on the requesting page's type."""
+        request = route.request
+        try:
+            page_type = self.page_types.get(request.frame.page)
+        except Exception:
+            # Service worker requests have no frame
+            page_type = None
+        blocked = BLOCK_PROFILES.get(page_type, [])
+        name = resource_class(request.url)
+        if name is None:
+            name = next((n for n, t in _RESOURCE_TYPES.items() if t == request.resource_type),
+                        None)
+        if name in blocked:
+            self.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def new_page(self) -> BackendPage:
+        page = await self._context.new_page()
+        if self._stealth_page:
+            await self._stealth_page(page)
+        return _PlaywrightPage(self, page)
+
+    async def close(self) -> None:
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+def create_backend(name: str, scraper: TldvScraper) -> BrowserBackend:
+    """
+    Create the backend a scraper is configured for.
+
+    Args:
+        name: "selenium" or "playwright"
+        scraper: Scraper providing the headless, blocking and session settings
+    """
+    if name == "playwright":
+        snapshot = scraper._session_snapshot()
+        if not scraper.sessions.is_valid(snapshot):
+            print("No valid saved session. Please run with --login option to authenticate first.")
+            snapshot = None
+        return PlaywrightBackend(headless=scraper.headless, snapshot=snapshot,
+                                 block_resources=scraper.block_resources,
+                                 headless_mode=scraper.headless_mode,
+                                 low_memory=scraper.low_memory)
+    if name == "selenium":
+        return SeleniumBackend(scraper)
+    raise ValueError(f"Unknown browser backend: {name} (choose from {', '.join(BACKENDS)})")
+
+
+async def _wait_for(page: BackendPage, script: str, args: List, timeout: float) -> Any:
+    """Poll a script until it returns a truthy value or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = await page.evaluate(script, *args)
+        except Exception:
+            # The document is being replaced by the navigation
+            result = None
+        if result or time.monotonic() >= deadline:
+            return result
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+async def _read_transcript(page: BackendPage, timeout: float) -> Tuple[Optional[str], bool]:
+    """
+    Click the transcript tab and serialize the rendered segments until they settle.
+
+    Returns:
+        (transcript text or None, True if two reads TRANSCRIPT_STABLE_WINDOW
+        apart returned the same rows)
+    """
+    await page.evaluate(_CLICK_TAB_SCRIPT, TRANSCRIPT_TAB_XPATHS)
+
+    deadline = time.monotonic() + timeout
+    previous = None
+    stable = False
+    while True:
+        payload = await page.evaluate(SERIALIZE_SEGMENTS_SCRIPT, TRANSCRIPT_SELECTORS)
+        if payload and payload == previous:
+            stable = True
+            break
+        if time.monotonic() >= deadline:
+            break
+        previous = payload
+        await asyncio.sleep(TRANSCRIPT_STABLE_WINDOW if payload else POLL_INTERVAL)
+
+    _, segments, _ = decode_rendered_segments(payload)
+    text = format_segments(segments)
+    return (text, stable) if len(text) > 50 else (None, False)
+
+
+async def extract_transcript(page: BackendPage, timeout: float = MEETING_PAGE_TIMEOUT
+                             ) -> Optional[str]:
+    """
+    Extract the transcript from an open meeting page.
+
+    Clicks the transcript tab, then serializes the rendered segments in the
+    page until two reads TRANSCRIPT_STABLE_WINDOW apart return the same rows.
+    """
+    text, _ = await _read_transcript(page, timeout)
+    return text
+
+
+async def fetch_meeting(backend: BrowserBackend, meeting: str) -> Dict:
+    """
+    Open one meeting in a new page and extract its transcript.
+
+    Returns:
+        Dict with meeting, url, transcript (or None), seconds, error and
+        cacheable (the transcript settled and is long enough to cache)
+    """
+    url = meeting_url_for(meeting)
+    result = {"meeting": meeting, "url": url, "transcript": None, "error": None,
+              "cacheable": False}
+    started = time.monotonic()
+    page = await backend.new_page()
+    try:
+        await page.goto(url, "meeting_detail")
+        state = await _wait_for(page, _MEETING_STATE_SCRIPT,
+                                [TRANSCRIPT_TAB_XPATHS, TRANSCRIPT_SELECTORS],
+                                MEETING_PAGE_TIMEOUT)
+        if state == "signin":
+            result["error"] = "Not logged in to tldv"
+        elif state != "ready":
+            result["error"] = f"Page not ready after {MEETING_PAGE_TIMEOUT}s"
+        else:
+            text, stable = await _read_transcript(page, MEETING_PAGE_TIMEOUT)
+            result["transcript"] = text
+            result["cacheable"] = stable and len(text or "") >= MIN_TRANSCRIPT_LENGTH
+            if not text:
+                result["error"] = "Transcript not found"
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        await page.close()
+    result["seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+async def fetch_transcripts(backend: BrowserBackend, meetings: List[str],
+                            concurrency: int = BATCH_MAX_TABS) -> AsyncIterator[Dict]:
+    """
+    Fetch many meetings with at most `concurrency` pages open at a time.
+
+    Yields:
+        Result dicts (see fetch_meeting) in completion order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(meeting: str) -> Dict:
+        async with semaphore:
+            return await fetch_meeting(backend, meeting)
+
+    for task in asyncio.as_completed([bounded(m) for m in meetings]):
+        yield await task
+
+
+async def list_meetings(backend: BrowserBackend) -> Optional[List[Dict]]:
+    """
+    Read the meetings rendered on the first page of the meeting list.
+
+    Returns:
+        Dicts with id, title and date (newest first), or None if the session
+        is not logged in
+    """
+    page = await backend.new_page()
+    try:
+        await page.goto(MEETINGS_URL, "meeting_list")
+        deadline = time.monotonic() + MEETING_LIST_TIMEOUT
+        rows = []
+        while not rows and time.monotonic() < deadline:
+            if "signin" in await page.url():
+                return None
+            try:
+                rows = await page.evaluate(MEETING_LIST_SCRIPT)
+            except Exception:
+                # The document is being replaced by the navigation
+                rows = []
+            if not rows:
+                await asyncio.sleep(POLL_INTERVAL)
+    finally:
+        await page.close()
+
+    return [{"id": meeting_id, "title": title, "date": date or parse_meeting_date(title)}
+            for meeting_id, title, date in rows]
+
+
+async def fetch_latest(backend: BrowserBackend, index: MeetingIndex,
+                       meeting_name: Optional[str] = None,
+                       cached: Optional[Callable[[str], Optional[str]]] = None
+                       ) -> AsyncIterator[Dict]:
+    """
+    Update the index from the meeting list and fetch the latest matching meeting.
+
+    Args:
+        backend: Started backend
+        index: Meeting index to update and search
+        meeting_name: Name to search for in meeting titles (None: latest meeting)
+        cached: Returns the cached transcript of a meeting ID, if any
+
+    Yields:
+        One result dict (see fetch_meeting), with an error if nothing matched
+    """
+    meetings = backend.listed_meetings or await list_meetings(backend)
+    if meetings is None:
+        yield {"meeting": meeting_name, "url": None, "transcript": None,
+               "seconds": 0.0, "error": "Not logged in to tldv"}
+        return
+    index.upsert(meetings, crawl_started=time.time())
+
+    latest = index.find_latest(meeting_name)
+    if not latest:
+        yield {"meeting": meeting_name, "url": None, "transcript": None,
+               "seconds": 0.0, "error": f"No meeting found containing: {meeting_name or ''}"}
+        return
+    print(f"Found matching meeting: {latest['title']}")
+    transcript = cached(latest["id"]) if cached else None
+    if transcript:
+        yield {"meeting": latest["id"], "url": meeting_url_for(latest["id"]),
+               "transcript": transcript, "seconds": 0.0, "error": None}
+        return
+    yield await fetch_meeting(backend, latest["id"])
+
+
+def run_sync(backend: BrowserBackend, work: Callable[[BrowserBackend], AsyncIterator[Dict]],
+             meetings: Optional[List[str]] = None) -> Iterator[Dict]:
+    """
+    Drive an async backend flow from synchronous code.
+
+    Starts the backend on a private event loop and yields every result of
+    `work(backend)` as soon as it is produced.
+
+    Args:
+        backend: Backend to start and close
+        work: Async generator function, e.g.
+            lambda b: fetch_transcripts(b, meetings)
+        meetings: Meetings the work fetches; if the backend cannot start, one
+            failed result is yielded per meeting (default: a single result)
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        if not loop.run_until_complete(backend.start()):
+            for meeting in meetings or [None]:
+                yield {"meeting": meeting, "url": None, "transcript": None,
+                       "seconds": 0.0, "error": "Session unavailable"}
+            return
+
+        results = work(backend)
+        while True:
+            try:
+                yield loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(backend.close())
+        loop.close()
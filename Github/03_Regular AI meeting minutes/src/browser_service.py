@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Warm Browser Service for tldv Transcript Scraping
+
+Keeps one authenticated Chrome alive and serves transcript requests over a
+local socket, so callers skip Chrome startup and login checks on every run.
+The browser is health-checked periodically and recycled if it stops
+responding; the service shuts itself down after a period of inactivity.
+
+Protocol: one JSON object per line over TCP (localhost only).
+    {"action": "fetch", "url": "...", "meeting_id": "...", "meeting_name": "..."}
+    {"action": "health"}
+    {"action": "shutdown"}
+
+Usage:
+    python src/browser_service.py                     # Start service
+    python src/browser_service.py --idle-timeout 3600 # Custom idle shutdown
+    python src/browser_service.py --status            # Check running service
+    python src/browser_service.py --stop              # Stop running service
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from typing import Optional
+
+from tldv_scraper import TldvScraper
+
+# Service address (bound to localhost only)
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = int(os.getenv("TLDV_BROWSER_SERVICE_PORT", "47831"))
+
+# Shut down after this many seconds without requests
+IDLE_TIMEOUT = 30 * 60
+
+# Seconds between background health checks
+HEALTH_INTERVAL = 60
+
+# A browser that does not answer a ping within this many seconds is recycled
+PING_TIMEOUT = 10
+
+
+class BrowserService:
+    """Owns one long-lived TldvScraper session and serves fetch requests."""
+
+    def __init__(self, headless: bool = True, idle_timeout: float = IDLE_TIMEOUT,
+                 health_interval: float = HEALTH_INTERVAL):
+        """
+        Initialize the service.
+
+        Args:
+            headless: Run browser in headless mode (default: True)
+            idle_timeout: Seconds without requests before shutting down
+            health_interval: Seconds between background health checks
+        """
+        self.headless = headless
+        self.idle_timeout = idle_timeout
+        self.health_interval = health_interval
+        self.scraper: Optional[TldvScraper] = None
+        self.started_at = time.time()
+        self.last_activity = time.monotonic()
+        self.requests_served = 0
+        self.recycles = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: Optional[socketserver.ThreadingTCPServer] = None
+
+    def _ping(self, timeout: float = PING_TIMEOUT) -> bool:
+        """Check that the browser answers a trivial script within the timeout."""
+        if not self.scraper or not self.scraper.driver:
+            return False
+
+        result = {"ok": False}
+
+        def ping():
+            try:
+                result["ok"] = self.scraper.driver.execute_script("return 1") == 1
+            except Exception:
+                result["ok"] = False
+
+        worker = threading.Thread(target=ping, daemon=True)
+        worker.start()
+        worker.join(timeout)
+        return result["ok"]
+
+    def _discard_browser(self) -> None:
+        """Quit the current browser without blocking on a wedged driver."""
+        scraper, self.scraper = self.scraper, None
+        if scraper:
+            threading.Thread(target=scraper.close, daemon=True).start()
+
+    def _signed_out(self) -> bool:
+        """Return True if the browser's current page is tldv's sign-in page."""
+        return self.scraper.waiter.meeting_link_count() == -1
+
+    def _ensure_browser(self) -> bool:
+        """Start or recycle the browser so it is healthy and logged in."""
+        if self.scraper and self._ping():
+            if not self._signed_out():
+                return True
+            print("tldv session expired. Starting a new browser session...")
+            self.recycles += 1
+            self._discard_browser()
+        elif self.scraper:
+            print("Browser is not responding. Recycling...")
+            self.recycles += 1
+            self._discard_browser()
+
+        scraper = TldvScraper(headless=self.headless)
+        try:
+            ready = scraper.start_session()
+        except Exception as e:
+            print(f"Error starting browser: {e}")
+            ready = False
+
+        if not ready:
+            scraper.close()
+            return False
+
+        self.scraper = scraper
+        return True
+
+    def fetch(self, url: Optional[str] = None, meeting_id: Optional[str] = None,
+              meeting_name: Optional[str] = None) -> dict:
+        """Fetch a transcript with the warm browser."""
+        with self._lock:
+            self.last_activity = time.monotonic()
+            started = time.monotonic()
+
+            if not self._ensure_browser():
+                return {"ok": False, "error": "Browser session unavailable. Run --login first."}
+
+            self.scraper.waiter.timings.clear()
+            self.scraper.navigations.clear()
+            transcript = self.scraper.fetch_transcript(
+                meeting_url=url, meeting_id=meeting_id, meeting_name=meeting_name
+            )
+            self.requests_served += 1
+            self.last_activity = time.monotonic()
+
+            # An expired session lands on the sign-in page; its text is not a transcript
+            if self._signed_out():
+                print("tldv session expired during fetch. Discarding the browser session.")
+                self.recycles += 1
+                self._discard_browser()
+                return {"ok": False, "error": "tldv session expired. Run --login again."}
+
+            if not transcript:
+                return {"ok": False, "error": "Transcript not found"}
+
+            return {
+                "ok": True,
+                "transcript": transcript,
+                "meeting_id": self.scraper.last_meeting_id,
+                "seconds": round(time.monotonic() - started, 3),
+                "waits": self.scraper.waiter.timings,
+                "navigations": list(self.scraper.navigations),
+            }
+
+    def health(self, ping: bool = True) -> dict:
+        """
+        Return the service and browser status.
+
+        Args:
+            ping: Also check that the browser responds (skipped while busy)
+        """
+        alive = None
+        if ping and self._lock.acquire(timeout=1):
+            try:
+                alive = self._ping()
+            finally:
+                self._lock.release()
+        return {
+            "ok": True,
+            "browser_alive": alive,
+            "uptime": round(time.time() - self.started_at, 1),
+            "idle": round(time.monotonic() - self.last_activity, 1),
+            "requests_served": self.requests_served,
+            "recycles": self.recycles,
+        }
+
+    def _monitor(self) -> None:
+        """Recycle a wedged browser and stop the service when idle."""
+        while not self._stop.wait(self.health_interval):
+            if time.monotonic() - self.last_activity > self.idle_timeout:
+                print("Idle timeout reached. Shutting down browser service.")
+                self.stop()
+                return
+
+            if self._lock.acquire(blocking=False):
+                try:
+                    if self.scraper and not self._ping():
+                        print("Health check failed. Recycling browser...")
+                        self.recycles += 1
+                        self._discard_browser()
+                finally:
+                    self._lock.release()
+
+    def handle(self, request: dict) -> dict:
+        """Dispatch a single protocol request."""
+        action = request.get("action")
+        if action == "fetch":
+            return self.fetch(
+                url=request.get("url"),
+                meeting_id=request.get("meeting_id"),
+                meeting_name=request.get("meeting_name"),
+            )
+        if action == "health":
+            return self.health(ping=request.get("ping", True))
+        if action == "shutdown":
+            threading.Thread(target=self.stop, daemon=True).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown action: {action}"}
+
+    def serve(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> None:
+        """Start the browser and serve requests until stopped."""
+        service = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                try:
+                    response = service.handle(json.loads(line))
+                except json.JSONDecodeError:
+                    response = {"ok": False, "error": "Invalid request"}
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self._server.daemon_threads = True
+
+        with self._lock:
+            if not self._ensure_browser():
+                print("Warning: Browser session not ready. Will retry on first request.")
+
+        threading.Thread(target=self._monitor, daemon=True).start()
+        print(f"Browser service listening on {host}:{port}")
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if self.scraper:
+                self.scraper.close()
+                self.scraper = None
+            print("Browser service stopped.")
+
+    def stop(self) -> None:
+        """Stop serving requests."""
+        self._stop.set()
+        if self._server:
+            self._server.shutdown()
+
+
+class BrowserServiceClient:
+    """Sends requests to a running BrowserService."""
+
+    def __init__(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT,
+                 timeout: float = 300):
+        """
+        Initialize the client.
+
+        Args:
+            host: Service host
+            port: Service port
+            timeout: Socket timeout in seconds for a single request
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.last_meeting_id: Optional[str] = None
+
+    def _request(self, payload: dict, timeout: Optional[float] = None) -> dict:
+        """Send one request and return the decoded response."""
+        with socket.create_connection((self.host, self.port),
+                                      timeout=timeout or self.timeout) as sock:
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise ConnectionError("Browser service closed the connection")
+        return json.loads(line)
+
+    def is_available(self) -> bool:
+        """Return True if a service is running and answering."""
+        try:
+            response = self._request({"action": "health", "ping": False}, timeout=3)
+            return response.get("ok", False)
+        except (OSError, ValueError):
+            return False
+
+    def health(self) -> dict:
+        """Return service status."""
+        return self._request({"action": "health"}, timeout=15)
+
+    def fetch_transcript(self, meeting_url: Optional[str] = None,
+                         meeting_id: Optional[str] = None,
+                         meeting_name: Optional[str] = None) -> Optional[str]:
+        """
+        Fetch a transcript through the service.
+
+        Sets last_meeting_id to the ID of the fetched meeting, if the service reported it.
+
+        Returns:
+            Transcript text, or None if the service could not fetch it
+        """
+        self.last_meeting_id = None
+        try:
+            response = self._request({
+                "action": "fetch",
+                "url": meeting_url,
+                "meeting_id": meeting_id,
+                "meeting_name": meeting_name,
+            })
+        except (OSError, ValueError) as e:
+            print(f"Error contacting browser service: {e}")
+            return None
+
+        if not response.get("ok"):
+            print(f"Browser service error: {response.get('error')}")
+            return None
+
+        print(f"Fetched via browser service in {response['seconds']:.2f}s "
+              f"({len(response.get('navigations', []))} navigations)")
+        self.last_meeting_id = response.get("meeting_id")
+        return response["transcript"]
+
+    def shutdown(self) -> bool:
+        """Ask the service to stop."""
+        try:
+            return self._request({"action": "shutdown"}, timeout=5).get("ok", False)
+        except (OSError, ValueError):
+            return False
+
+
+def main():
+    """Main entry point for the browser service."""
+    parser = argparse.ArgumentParser(description="Warm browser service for tldv scraping")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT, help="Port to listen on")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=IDLE_TIMEOUT,
+        help=f"Seconds without requests before shutdown (default: {IDLE_TIMEOUT})"
+    )
+    parser.add_argument(
+        "--health-interval",
+        type=float,
+        default=HEALTH_INTERVAL,
+        help=f"Seconds between health checks (default: {HEALTH_INTERVAL})"
+    )
+    parser.add_argument("--no-headless", action="store_true", help="Run browser with visible window")
+    parser.add_argument("--status", action="store_true", help="Show status of running service")
+    parser.add_argument("--stop", action="store_true", help="Stop running service")
+
+    args = parser.parse_args()
+    client = BrowserServiceClient(port=args.port)
+
+    if args.status:
+        if not client.is_available():
+            print("Browser service is not running.")
+            return 1
+        print(json.dumps(client.health(), indent=2))
+        return 0
+
+    if args.stop:
+        if client.shutdown():
+            print("Browser service stopping.")
+            return 0
+        print("Browser service is not running.")
+        return 1
+
+    if client.is_available():
+        print(f"Browser service already running on port {args.port}")
+        return 1
+
+    service = BrowserService(
+        headless=not args.no_headless,
+        idle_timeout=args.idle_timeout,
+        health_interval=args.health_interval,
+    )
+    try:
+        service.serve(port=args.port)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+New Meeting Probe
+
+Answers "is there a new matching meeting since the last processed one?"
+without launching Chrome, so a scheduler can poll often and start the full
+pipeline only when there is work:
+
+1. Conditional request for the meeting list with the saved session
+   (If-None-Match / If-Modified-Since; HTTP 304 means the list is unchanged)
+2. Otherwise the local meeting index, if it was crawled recently
+
+The newest matching meeting is compared with the one recorded by
+mark_processed() after the last successful run.
+
+Exit codes:
+    0  A new meeting is waiting (run the pipeline)
+    1  Nothing new
+    2  Could not check (session expired, meeting list endpoint not learned
+       yet and index too old)
+
+Usage:
+    python src/change_probe.py                          # Check "AI定例MTG"
+    python src/change_probe.py --meeting-name "週次定例"
+    python src/main.py --check                          # Same, via main.py
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from file_lock import read_json, update_json
+from meeting_index import MeetingIndex
+from session_store import SessionStore
+from tldv_http import TldvHttpClient
+
+# Last processed meeting per name and the meeting list's HTTP validators
+PROBE_STATE_FILE = Path(__file__).parent.parent / ".tldv_last_processed.json"
+
+# The probe should answer in about a second; a slow tldv counts as "could not check"
+PROBE_TIMEOUT = 5
+
+# Trust the local index this long when tldv cannot be asked (seconds)
+INDEX_MAX_AGE = 60 * 60
+
+CHECK_NEW = 0
+CHECK_NOTHING_NEW = 1
+CHECK_FAILED = 2
+
+
+def last_processed(meeting_name: str, path: Path = PROBE_STATE_FILE) -> Optional[Dict]:
+    """Return the meeting last processed for a name, or None."""
+    return read_json(path, {}).get("processed", {}).get(meeting_name)
+
+
+def mark_processed(meeting_name: str, meeting_id: Optional[str],
+                   path: Path = PROBE_STATE_FILE) -> None:
+    """
+    Record the meeting a successful run processed.
+
+    Args:
+        meeting_name: Name the run searched for
+        meeting_id: ID of the meeting whose transcript the run fetched; nothing
+                    is recorded if it is unknown
+        path: Probe state file
+    """
+    if not meeting_id:
+        return
+    index = MeetingIndex()
+    meeting = index.get(meeting_id) or {"id": meeting_id, "title": meeting_id}
+    index.close()
+
+    entry = {"id": meeting["id"], "title": meeting["title"],
+             "date": meeting.get("date"), "processed_at": time.time()}
+
+    def record(state: Dict) -> Dict:
+        state.setdefault("processed", {})[meeting_name] = entry
+        return state
+
+    update_json(path, record, default={}, ensure_ascii=False)
+
+
+def _refresh_index(index: MeetingIndex, path: Path) -> Optional[str]:
+    """
+    Update the index from tldv with a conditional request.
+
+    Returns:
+        Description of the answer ("HTTP 304", "HTTP 200"), or None if tldv
+        could not be asked
+    """
+    sessions = SessionStore()
+    client = TldvHttpClient(sessions.load(), sessions, timeout=PROBE_TIMEOUT)
+    if not client.has_credentials or "meetings" not in client.endpoints:
+        return None
+
+    # Without indexed meetings a 304 would leave nothing to compare against
+    validators = read_json(path, {}).get("validators", {}) if index.count() else {}
+    status, meetings, validators = client.list_meetings_if_changed(validators)
+    if status == "failed":
+        return None
+    if status == "unchanged":
+        index.mark_seen(read_json(path, {}).get("listed", []))
+        return "HTTP 304"
+
+    index.upsert(meetings)
+    listed = [meeting["id"] for meeting in meetings]
+    update_json(path, lambda state: {**state, "validators": validators, "listed": listed},
+                default={}, ensure_ascii=False)
+    return "HTTP 200"
+
+
+def check_for_new_meeting(meeting_name: str, path: Path = PROBE_STATE_FILE) -> int:
+    """
+    Check whether a meeting newer than the last processed one exists.
+
+    Args:
+        meeting_name: Substring of the meeting title
+        path: Probe state file
+
+    Returns:
+        CHECK_NEW, CHECK_NOTHING_NEW or CHECK_FAILED
+    """
+    started = time.monotonic()
+    index = MeetingIndex()
+    try:
+        source = _refresh_index(index, path)
+        if source is None:
+            last_crawled = index.last_crawled()
+            age = time.time() - last_crawled if last_crawled else None
+            source = f"index crawled {age / 60:.0f} min ago" if age is not None else None
+            stale = age is None or age > INDEX_MAX_AGE
+        else:
+            stale = False
+        latest = index.find_latest(meeting_name)
+    finally:
+        index.close()
+
+    elapsed = time.monotonic() - started
+    processed = last_processed(meeting_name, path)
+    if latest and (not processed or latest["id"] != processed["id"]):
+        print(f"New meeting: {latest['title']} ({latest['date'] or 'no date'}) "
+              f"[{source}, {elapsed:.2f}s]")
+        return CHECK_NEW
+
+    if stale:
+        print(f"Could not check tldv: session expired or meeting list endpoint not learned, "
+              f"and the meeting index is {'empty' if source is None else 'too old'} "
+              f"({elapsed:.2f}s). Run the pipeline once to refresh them.")
+        return CHECK_FAILED
+
+    last = f"{processed['title']} ({processed['date'] or 'no date'})" if processed else "none"
+    print(f"No new meeting for '{meeting_name}' (last processed: {last}) "
+          f"[{source}, {elapsed:.2f}s]")
+    return CHECK_NOTHING_NEW
+
+
+def main():
+    """Check for a new meeting and exit with the probe's status code."""
+    parser = argparse.ArgumentParser(description="Check tldv for a new meeting without a browser")
+    parser.add_argument("--meeting-name", type=str, default="AI定例MTG",
+                        help="Meeting name to check (default: 'AI定例MTG')")
+    args = parser.parse_args()
+    return check_for_new_meeting(args.meeting_name)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
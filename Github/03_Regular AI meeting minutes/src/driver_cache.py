@@ -0,0 +1,129 @@
+"""
+Patched chromedriver Cache
+
+undetected-chromedriver downloads and patches a fresh chromedriver on every
+launch unless it is given an existing binary. This module detects the
+installed Chrome major version and keeps one patched chromedriver per
+version in a local cache, so later launches reuse it and only check that the
+binary is still patched.
+
+Set TLDV_CHROME_VERSION to override the detected major version.
+"""
+
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+import undetected_chromedriver as uc
+
+from file_lock import atomic_write, file_lock, update_json
+
+# Cached drivers and detected versions
+DRIVER_CACHE_DIR = Path(__file__).parent.parent / ".driver_cache"
+
+# Detected versions, keyed by Chrome binary path, size and mtime
+VERSIONS_FILE = DRIVER_CACHE_DIR / "versions.json"
+
+# Timeout for `chrome --version` (seconds)
+VERSION_TIMEOUT = 10
+
+
+def _version_key(binary: str) -> str:
+    """Return a key that changes whenever the Chrome binary is updated."""
+    stat = os.stat(binary)
+    return f"{binary}|{stat.st_size}|{int(stat.st_mtime)}"
+
+
+def _load_versions() -> dict:
+    """Load previously detected Chrome versions."""
+    if VERSIONS_FILE.exists():
+        try:
+            return json.loads(VERSIONS_FILE.read_text())
+        except ValueError:
+            pass
+    return {}
+
+
+def detect_chrome_version(binary: Optional[str] = None) -> Optional[int]:
+    """
+    Detect the installed Chrome major version.
+
+    The result is remembered per binary (path, size, mtime), so Chrome is only
+    asked again after it has been updated.
+
+    Args:
+        binary: Chrome executable (default: found by undetected-chromedriver)
+
+    Returns:
+        Major version such as 144, or None if it cannot be detected
+    """
+    override = os.getenv("TLDV_CHROME_VERSION")
+    if override:
+        return int(override)
+
+    binary = binary or uc.find_chrome_executable()
+    if not binary:
+        return None
+
+    key = _version_key(binary)
+    versions = _load_versions()
+    if key in versions:
+        return versions[key]
+
+    try:
+        output = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True,
+            timeout=VERSION_TIMEOUT, check=True
+        ).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"Warning: Could not detect Chrome version: {e}")
+        return None
+
+    match = re.search(r"(\d+)\.\d+\.\d+", output)
+    if not match:
+        print(f"Warning: Unrecognized Chrome version output: {output.strip()}")
+        return None
+
+    version = int(match.group(1))
+    update_json(VERSIONS_FILE, lambda versions: {**versions, key: version}, default={})
+    return version
+
+
+def cached_driver_path(version_main: int) -> Path:
+    """Return the cache location of the patched chromedriver for a Chrome version."""
+    exe = "chromedriver.exe" if os.name == "nt" else "chromedriver"
+    return DRIVER_CACHE_DIR / str(version_main) / exe
+
+
+def ensure_driver(version_main: int) -> Optional[str]:
+    """
+    Return a patched chromedriver for a Chrome version, downloading it once.
+
+    Args:
+        version_main: Chrome major version
+
+    Returns:
+        Path to the cached driver, or None if it could not be prepared
+    """
+    path = cached_driver_path(version_main)
+    patcher = uc.Patcher(executable_path=str(path), version_main=version_main)
+    if path.exists() and patcher.is_binary_patched():
+        return str(path)
+
+    print(f"Preparing chromedriver for Chrome {version_main}...")
+    try:
+        # A non-custom patcher downloads into its own data directory and
+        # deletes the binary when collected, so copy it into the cache.
+        downloader = uc.Patcher(version_main=version_main)
+        downloader.auto()
+        # Another run may be preparing the same version: copy under its lock
+        with file_lock(path):
+            if not (path.exists() and patcher.is_binary_patched()):
+                atomic_write(path, Path(downloader.executable_path).read_bytes(), mode=0o755)
+    except Exception as e:
+        print(f"Warning: Could not cache chromedriver: {e}")
+        return None
+    return str(path)
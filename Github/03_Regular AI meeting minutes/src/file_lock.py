@@ -0,0 +1,115 @@
+"""
+File Locking and Atomic Writes
+
+Lets overlapping runs (e.g. the launchd job and a manual run) share the
+session snapshot, token cache and statistics files safely:
+
+- file_lock():    advisory flock on a sidecar "<file>.lock", shared for
+                  readers and exclusive for writers
+- atomic_write(): writes a uniquely named temp file in the same directory,
+                  fsyncs it and renames it over the target, so readers see
+                  either the old or the new file and concurrent writers
+                  never share a temp file
+- update_json():  locked read-modify-write of a JSON file
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+
+def lock_path(path: Path) -> Path:
+    """Return the sidecar lock file of a path."""
+    return path.with_name(path.name + ".lock")
+
+
+@contextmanager
+def file_lock(path: Path, shared: bool = False, wait_message: str = "") -> Iterator[None]:
+    """
+    Hold an advisory lock on a file (or directory) for the duration of the block.
+
+    Args:
+        path: File or directory to lock (the lock is taken on "<path>.lock")
+        shared: Take a shared (read) lock instead of an exclusive one
+        wait_message: Printed if the lock is held by another process and we wait
+    """
+    lock = lock_path(path)
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+    with open(lock, "a") as f:
+        try:
+            fcntl.flock(f, mode | fcntl.LOCK_NB)
+        except BlockingIOError:
+            if wait_message:
+                print(wait_message)
+            fcntl.flock(f, mode)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def atomic_write(path: Path, data: Union[str, bytes], mode: Optional[int] = None) -> None:
+    """
+    Replace a file's contents atomically.
+
+    Args:
+        path: Target file
+        data: Text (written as UTF-8) or bytes
+        mode: Permission bits to set before the file appears (e.g. 0o755)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data.encode("utf-8") if isinstance(data, str) else data)
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def read_json(path: Path, default: Any = None) -> Any:
+    """Read a JSON file under a shared lock; returns default if missing or corrupt."""
+    if not path.exists():
+        return default
+    with file_lock(path, shared=True):
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return default
+
+
+def update_json(path: Path, update: Callable[[Any], Any], default: Any = None,
+                **dump_options) -> Any:
+    """
+    Read, modify and write a JSON file while holding its exclusive lock.
+
+    Args:
+        path: JSON file
+        update: Receives the current data (or default) and returns the new data
+        default: Data used when the file is missing or corrupt
+        dump_options: Passed to json.dumps (default: indent=2)
+
+    Returns:
+        The data written
+    """
+    dump_options.setdefault("indent", 2)
+    with file_lock(path):
+        data = default
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                pass
+        data = update(data)
+        atomic_write(path, json.dumps(data, **dump_options))
+        return data
@@ -0,0 +1,149 @@
+"""
+Display-less Headless Chrome
+
+tldv detects the old headless mode, so the scraper normally runs a regular
+window moved offscreen. That needs a display (Xvfb on Linux runners). The
+"new" mode uses Chrome's new headless mode (--headless=new, the full
+browser without a window) and hides what still gives it away:
+
+- "HeadlessChrome" in the User-Agent and its client hints
+- empty navigator.languages / plugins and a missing window.chrome
+- Notification.permission and permissions.query() disagreeing
+- zero outer window size and a screen smaller than the window
+
+HEADLESS_MODES:
+    offscreen  Regular window at -10000,-10000 (needs a display)
+    new        Chrome's new headless mode with the adjustments above
+    auto       new on Linux without DISPLAY/WAYLAND_DISPLAY, else offscreen
+"""
+
+import json
+import os
+import sys
+from typing import Dict
+
+HEADLESS_MODES = ("auto", "offscreen", "new")
+
+# Window and screen size reported to pages
+WINDOW_WIDTH = 1920
+WINDOW_HEIGHT = 1080
+
+# Languages reported to pages (matches --lang=ja-JP)
+LANGUAGES = ["ja-JP", "ja", "en-US", "en"]
+
+# Runs before any page script in new headless mode
+FINGERPRINT_SCRIPT = """
+(function (width, height, languages) {
+    var define = function (obj, name, value) {
+        try { Object.defineProperty(obj, name, {get: function () { return value; }, configurable: true}); }
+        catch (e) {}
+    };
+    define(Navigator.prototype, 'webdriver', undefined);
+    define(Navigator.prototype, 'languages', Object.freeze(languages.slice()));
+    if (!navigator.plugins.length) {
+        var names = ['PDF Viewer', 'Chrome PDF Viewer', 'Chromium PDF Viewer'];
+        var plugins = names.map(function (name) {
+            return {name: name, filename: 'internal-pdf-viewer', description: 'Portable Document Format', length: 1};
+        });
+        plugins.item = function (i) { return plugins[i] || null; };
+        plugins.namedItem = function (name) { return plugins.filter(function (p) { return p.name === name; })[0] || null; };
+        plugins.refresh = function () {};
+        define(Navigator.prototype, 'plugins', plugins);
+    }
+    if (!window.chrome) { window.chrome = {}; }
+    if (!window.chrome.runtime) { window.chrome.runtime = {}; }
+    if (window.Notification && navigator.permissions) {
+        define(Notification, 'permission', 'default');
+        var query = navigator.permissions.query.bind(navigator.permissions);
+        navigator.permissions.query = function (descriptor) {
+            if (descriptor && descriptor.name === 'notifications') {
+                return Promise.resolve({state: 'prompt', onchange: null});
+            }
+            return query(descriptor);
+        };
+    }
+    if (!window.outerWidth) {
+        define(window, 'outerWidth', width);
+        define(window, 'outerHeight', height);
+    }
+    if (screen.width < width) {
+        define(Screen.prototype, 'width', width);
+        define(Screen.prototype, 'height', height);
+        define(Screen.prototype, 'availWidth', width);
+        define(Screen.prototype, 'availHeight', height - 40);
+    }
+})(%d, %d, %s);
+"""
+
+
+def resolve_mode(mode: str = "auto") -> str:
+    """
+    Resolve "auto" to the mode that works on this machine.
+
+    Returns:
+        "offscreen" or "new"
+    """
+    if mode not in HEADLESS_MODES:
+        raise ValueError(f"Unknown headless mode: {mode} (choose from {', '.join(HEADLESS_MODES)})")
+    if mode != "auto":
+        return mode
+    has_display = os.getenv("DISPLAY") or os.getenv("WAYLAND_DISPLAY")
+    return "new" if sys.platform.startswith("linux") and not has_display else "offscreen"
+
+
+def fingerprint_script() -> str:
+    """Return FINGERPRINT_SCRIPT filled in with the window size and languages."""
+    return FINGERPRINT_SCRIPT % (WINDOW_WIDTH, WINDOW_HEIGHT, json.dumps(LANGUAGES))
+
+
+def user_agent_override(user_agent: str) -> Dict:
+    """
+    Build a CDP Emulation.setUserAgentOverride request without the headless markers.
+
+    Args:
+        user_agent: User-Agent reported by Browser.getVersion
+
+    Returns:
+        Parameters with the User-Agent, Accept-Language and client hints fixed
+    """
+    user_agent = user_agent.replace("HeadlessChrome", "Chrome")
+    version = user_agent.split("Chrome/")[-1].split(" ")[0]
+    major = version.split(".")[0]
+    brands = [{"brand": "Google Chrome", "version": major},
+              {"brand": "Chromium", "version": major},
+              {"brand": "Not_A Brand", "version": "24"}]
+    if sys.platform == "darwin":
+        platform, navigator_platform = "macOS", "MacIntel"
+    elif sys.platform.startswith("win"):
+        platform, navigator_platform = "Windows", "Win32"
+    else:
+        platform, navigator_platform = "Linux", "Linux x86_64"
+    return {
+        "userAgent": user_agent,
+        "acceptLanguage": ",".join(LANGUAGES),
+        "platform": navigator_platform,
+        "userAgentMetadata": {
+            "brands": brands,
+            "fullVersionList": [dict(b, version=version if b["version"] == major else b["version"])
+                                for b in brands],
+            "fullVersion": version,
+            "platform": platform,
+            "platformVersion": "",
+            "architecture": "x86",
+            "model": "",
+            "mobile": False,
+        },
+    }
+
+
+def apply_fingerprint(driver) -> None:
+    """
+    Apply the new headless mode adjustments to the current tab of a WebDriver session.
+
+    The overrides are per tab: call it for every new tab before its first page load.
+    """
+    user_agent = driver.execute_cdp_cmd("Browser.getVersion", {})["userAgent"]
+    driver.execute_cdp_cmd("Emulation.setUserAgentOverride", user_agent_override(user_agent))
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": fingerprint_script(),
+    })
@@ -0,0 +1,105 @@
+"""
+Low-memory Scraping Mode
+
+Chrome options and profile housekeeping for small VMs. The scraper only
+needs the text of a few pages, so the low-memory mode:
+
+- uses a smaller window and at most LOW_MEMORY_RENDERERS renderer processes
+- disables extensions, background networking, component updates and
+  features that keep extra processes or caches alive
+- caps the disk cache and disables the HTTP memory cache
+- trims the caches in the persistent profile (.chrome_profile) before
+  launch, so they never grow past PROFILE_CACHE_LIMIT
+"""
+
+import shutil
+from pathlib import Path
+from typing import List
+
+# Window size in low-memory mode (tldv's layout still shows the transcript panel)
+LOW_MEMORY_WINDOW = (1280, 800)
+
+# Maximum renderer processes
+LOW_MEMORY_RENDERERS = 2
+
+# Disk cache cap passed to Chrome (bytes)
+DISK_CACHE_SIZE = 16 * 1024 * 1024
+
+# V8 heap cap per renderer (MB)
+JS_HEAP_MB = 512
+
+# Cache directories trimmed in the persistent profile when over PROFILE_CACHE_LIMIT
+PROFILE_CACHE_DIRS = ["Cache", "Code Cache", "GPUCache", "DawnCache", "GrShaderCache",
+                      "ShaderCache", "Service Worker/CacheStorage",
+                      "Service Worker/ScriptCache"]
+PROFILE_CACHE_LIMIT = 64 * 1024 * 1024
+
+# Features that run extra processes or keep caches around
+_DISABLED_FEATURES = ["Translate", "OptimizationHints", "MediaRouter", "BackForwardCache",
+                      "AutofillServerCommunication", "InterestFeedContentSuggestions",
+                      "CalculateNativeWinOcclusion", "HeavyAdIntervention"]
+
+
+def low_memory_arguments() -> List[str]:
+    """Return the Chrome command-line arguments of the low-memory mode."""
+    width, height = LOW_MEMORY_WINDOW
+    return [
+        f"--window-size={width},{height}",
+        f"--renderer-process-limit={LOW_MEMORY_RENDERERS}",
+        f"--disk-cache-size={DISK_CACHE_SIZE}",
+        f"--media-cache-size={DISK_CACHE_SIZE}",
+        f"--js-flags=--max-old-space-size={JS_HEAP_MB}",
+        "--disable-extensions",
+        "--disable-component-extensions-with-background-pages",
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--no-first-run",
+        "--disable-breakpad",
+        "--disable-features=" + ",".join(_DISABLED_FEATURES),
+    ]
+
+
+def _dir_size(path: Path) -> int:
+    """Return the total size of the files under a directory."""
+    total = 0
+    for f in path.rglob("*"):
+        try:
+            if f.is_file():
+                total += f.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def trim_profile_cache(profile_dir: Path, limit: int = PROFILE_CACHE_LIMIT) -> int:
+    """
+    Delete the profile's cache directories if together they exceed the limit.
+
+    Cookies, local storage and preferences are never touched, so the login
+    session survives.
+
+    Args:
+        profile_dir: Chrome user data directory
+        limit: Maximum total cache size (bytes)
+
+    Returns:
+        Bytes freed
+    """
+    caches = [d / name for d in profile_dir.glob("*") if d.is_dir()
+              for name in PROFILE_CACHE_DIRS if (d / name).is_dir()]
+    sizes = {cache: _dir_size(cache) for cache in caches}
+    total = sum(sizes.values())
+    if total <= limit:
+        return 0
+
+    freed = 0
+    # Largest first, until the rest fits
+    for cache, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        if total - freed <= limit:
+            break
+        shutil.rmtree(cache, ignore_errors=True)
+        freed += size
+    print(f"Trimmed browser profile cache: {freed / 2**20:.0f} MB freed")
+    return freed
@@ -8,10 +8,13 @@ then distributes to Teams and OneNote.
 Usage:
     python src/main.py --login                   # Initial login (browser opens)
     python src/main.py --auto                    # Auto-fetch "AI定例" meeting
+    python src/main.py --check                   # Exit 0 if a new "AI定例" meeting exists
+    python src/main.py --auto --if-new           # Run only when there is a new meeting
     python src/main.py --auto --meeting-name "週次定例"  # Custom meeting name
     python src/main.py --file input/sample.md   # From file
     python src/main.py --paste                   # From clipboard
     python src/main.py --url https://tldv.io/app/meetings/abc123  # Specific URL
+    python src/main.py --meeting-id abc123,def456  # Batch (one browser session)
 """
 
 import argparse
@@ -19,6 +22,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 from dotenv import load_dotenv
 
@@ -26,10 +30,24 @@ from dotenv import load_dotenv
 PROJECT_ROOT = Path(__file__).parent.parent
 load_dotenv(PROJECT_ROOT / ".env", override=True)
 
-from tldv_scraper import TldvScraper
-from minutes_generator import MinutesGenerator
+from tldv_scraper import BATCH_MAX_TABS, TldvScraper, meeting_id_from_url
+from browser_service import BrowserServiceClient
+from change_probe import CHECK_NOTHING_NEW, check_for_new_meeting, mark_processed
+from minutes_generator import (
+    LONG_TRANSCRIPT_CHARS,
+    MAP_WORKERS,
+    ConsolePreview,
+    MinutesFile,
+    MinutesGenerator,
+    minutes_path,
+)
 from teams_poster import TeamsPoster
 from onenote_writer import OneNoteWriter
+from response_cache import ResponseCache
+from transcript import Transcript
+
+# Transcript formats recognized from file extensions (others are auto-detected)
+TRANSCRIPT_FORMATS = {".vtt": "vtt", ".srt": "srt", ".json": "json"}
 
 
 def get_clipboard_content() -> str:
@@ -58,6 +76,196 @@ def read_file_content(filepath: Path) -> str:
         return f.read()
 
 
+def load_transcript(text: str, source: Optional[Path] = None) -> Union[str, Transcript]:
+    """
+    Parse transcript text into a Transcript, using the file extension as a format hint.
+
+    Text that is not entirely in a known transcript layout (e.g. pasted
+    notes) is returned unchanged, so the prompt gets exactly what was given.
+    """
+    fmt = TRANSCRIPT_FORMATS.get(source.suffix.lower()) if source else None
+    return Transcript.recognize(text, fmt) or text
+
+
+def fetch_from_tldv(
+    headless: bool,
+    use_service: bool = False,
+    meeting_url: Optional[str] = None,
+    meeting_id: Optional[str] = None,
+    meeting_name: Optional[str] = None,
+    verbose: bool = False,
+    scraper_options: Optional[Dict] = None,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Fetch a transcript via the warm browser service or a fresh browser.
+
+    Returns:
+        (transcript text or None, ID of the fetched meeting or None if unknown)
+    """
+    if use_service:
+        client = BrowserServiceClient()
+        if client.is_available():
+            if verbose:
+                print("Using warm browser service...")
+            transcript = client.fetch_transcript(
+                meeting_url=meeting_url, meeting_id=meeting_id, meeting_name=meeting_name
+            )
+            return transcript, client.last_meeting_id
+        print("Warning: Browser service not running. Falling back to a new browser.")
+
+    scraper = TldvScraper(headless=headless, **(scraper_options or {}))
+    if meeting_url:
+        transcript = scraper.get_transcript_from_url(meeting_url)
+    else:
+        transcript = scraper.get_latest_transcript(meeting_id=meeting_id,
+                                                   meeting_name=meeting_name)
+    return transcript, scraper.last_meeting_id
+
+
+def scraper_options(args: argparse.Namespace) -> Dict:
+    """Build TldvScraper keyword options from CLI arguments."""
+    return {
+        "capture_network": not args.dom_only,
+        "block_resources": not args.no_block,
+        "backend": args.backend,
+        "headless_mode": args.headless_mode,
+        "low_memory": args.low_memory,
+        "clone_profile": not args.shared_profile,
+        "use_http": not args.no_http,
+        "use_cache": not args.no_transcript_cache,
+        "refresh": args.refresh_transcript,
+        "cache_max_age": (args.transcript_max_age * 3600
+                          if args.transcript_max_age is not None else None),
+    }
+
+
+def create_generator(args: argparse.Namespace) -> MinutesGenerator:
+    """Create the minutes generator, exiting if the API key is missing."""
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("Error: ANTHROPIC_API_KEY must be set in .env")
+        sys.exit(1)
+    return MinutesGenerator(
+        api_key,
+        long_transcript_chars=0 if args.map_reduce else LONG_TRANSCRIPT_CHARS,
+        map_workers=args.map_workers,
+        cache=None if args.no_cache else ResponseCache(),
+        refresh=args.refresh,
+    )
+
+
+def process_transcript(transcript: Union[str, Transcript], args: argparse.Namespace,
+                       generator: MinutesGenerator,
+                       file_suffix: Optional[str] = None) -> None:
+    """Generate minutes from a transcript and distribute them."""
+    if args.verbose and not isinstance(transcript, Transcript):
+        print(f"Transcript: unstructured text, {len(transcript)} characters")
+    elif args.verbose:
+        speakers = transcript.speakers
+        print(f"Transcript: {len(transcript)} segments, {transcript.char_count} characters, "
+              f"{len(speakers)} speakers" + (f" ({', '.join(speakers)})" if speakers else ""))
+
+    # Prepare date
+    date = args.date or datetime.now().strftime("%Y年%m月%d日")
+    date_for_filename = args.date or datetime.now().strftime("%Y%m%d")
+    if file_suffix:
+        date_for_filename = f"{date_for_filename}_{file_suffix}"
+
+    # Generate minutes, saving and previewing them as they stream in
+    print("Generating meeting minutes with Claude Haiku...")
+    sinks = []
+    output_file = None
+    if not args.skip_save and not args.dry_run:
+        output_file = MinutesFile(minutes_path(date_for_filename))
+        sinks.append(output_file)
+    if args.verbose:
+        sinks.append(ConsolePreview())
+    minutes = generator.generate(
+        transcript=transcript,
+        date=args.date,
+        participants=args.participants,
+        video_url=args.video_url,
+        sinks=sinks
+    )
+
+    print(f"Minutes generated successfully! ({generator.summary()})")
+    if args.verbose and generator.cache:
+        print(f"Response cache: {generator.cache.summary()}")
+
+    if output_file:
+        print(f"Saved to: {output_file.path}")
+
+    # Post to Teams
+    if not args.skip_teams and not args.dry_run:
+        webhook_url = os.getenv("TEAMS_WORKFLOW_WEBHOOK_URL")
+        if webhook_url:
+            print("Posting to Teams...")
+            poster = TeamsPoster(webhook_url)
+            if poster.post_minutes(minutes, date=date, participants=args.participants):
+                print("Posted to Teams successfully!")
+            else:
+                print("Warning: Failed to post to Teams")
+        else:
+            print("Warning: Skipping Teams: TEAMS_WORKFLOW_WEBHOOK_URL not set")
+
+    # Save to OneNote
+    if not args.skip_onenote and not args.dry_run:
+        tenant_id = os.getenv("AZURE_TENANT_ID")
+        client_id = os.getenv("AZURE_CLIENT_ID")
+        section_id = os.getenv("ONENOTE_SECTION_ID")
+
+        if tenant_id and client_id:
+            print("Saving to OneNote...")
+            writer = OneNoteWriter(
+                tenant_id=tenant_id,
+                client_id=client_id,
+                section_id=section_id
+            )
+            if writer.write_minutes(minutes, date=date):
+                print("Saved to OneNote successfully!")
+            else:
+                print("Warning: Failed to save to OneNote")
+        else:
+            print("Warning: Skipping OneNote: Azure credentials not set")
+
+
+def read_meeting_list(filepath: Path) -> List[str]:
+    """Read meeting URLs or IDs from a file (one per line, # for comments)."""
+    meetings = []
+    for line in read_file_content(filepath).splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            meetings.append(line)
+    return meetings
+
+
+def run_batch(meetings: List[str], args: argparse.Namespace, headless: bool) -> int:
+    """Fetch many meetings in one browser session and process each as it arrives."""
+    generator = create_generator(args)
+    print(f"Batch mode: fetching {len(meetings)} meetings ({args.max_tabs} tabs)...")
+
+    scraper = TldvScraper(headless=headless, **scraper_options(args))
+    failures = []
+    for result in scraper.get_transcripts(meetings, max_tabs=args.max_tabs):
+        meeting = result["meeting"]
+        if result["error"]:
+            print(f"[FAILED] {meeting}: {result['error']} ({result['seconds']:.1f}s)")
+            failures.append(meeting)
+            continue
+
+        print(f"[OK] {meeting}: {len(result['transcript'])} characters "
+              f"({result['seconds']:.1f}s)")
+        process_transcript(load_transcript(result["transcript"]), args, generator,
+                           file_suffix=meeting_id_from_url(meeting))
+
+    print(f"\nBatch finished: {len(meetings) - len(failures)} succeeded, "
+          f"{len(failures)} failed")
+    for meeting in failures:
+        print(f"  failed: {meeting}")
+
+    return 1 if failures else 0
+
+
 def do_login(verbose: bool = False) -> int:
     """Perform interactive login to save session."""
     print("Starting interactive login...")
@@ -91,20 +299,36 @@ Examples:
     # Auto-fetch with custom meeting name
     python src/main.py --auto --meeting-name "週次定例"
 
+    # Check for a new meeting without a browser (exit 0: new, 1: none, 2: unknown)
+    python src/main.py --check
+
+    # Run the pipeline only if a new meeting exists
+    python src/main.py --auto --if-new
+
     # From a specific tldv meeting URL
     python src/main.py --url https://tldv.io/app/meetings/abc123
 
     # From a specific tldv meeting ID
     python src/main.py --meeting-id abc123
 
+    # Batch: several meetings in one browser session
+    python src/main.py --meeting-id abc123,def456,ghi789
+    python src/main.py --url-file input/meetings.txt
+
     # From a transcript file
     python src/main.py --file input/transcript.md
 
     # From clipboard
     python src/main.py --paste
 
+    # Retry distribution with the same minutes (served from the response cache)
+    python src/main.py --file input/transcript.md --skip-teams
+
     # Generate only (no distribution)
     python src/main.py --auto --skip-teams --skip-onenote
+
+    # Use the warm browser service (start it with: python src/browser_service.py)
+    python src/main.py --auto --use-service
         """
     )
 
@@ -122,6 +346,18 @@ Examples:
         help="Automatically find and process target meeting (default: 'AI定例')"
     )
 
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check for a new matching meeting without a browser and exit "
+             "(0: new meeting, 1: nothing new, 2: could not check)"
+    )
+    parser.add_argument(
+        "--if-new",
+        action="store_true",
+        help="Auto mode: skip the run if --check finds nothing new"
+    )
+
     # Meeting name filter
     parser.add_argument(
         "--meeting-name",
@@ -145,13 +381,18 @@ Examples:
     input_group.add_argument(
         "--meeting-id", "-m",
         type=str,
-        help="Fetch specific tldv meeting by ID"
+        help="Fetch specific tldv meeting by ID (comma-separated for batch)"
     )
     input_group.add_argument(
         "--url",
         type=str,
         help="Fetch specific tldv meeting by full URL"
     )
+    input_group.add_argument(
+        "--url-file",
+        type=Path,
+        help="Batch: fetch every meeting URL/ID listed in file (one per line)"
+    )
 
     # Metadata options
     parser.add_argument(
@@ -199,6 +440,99 @@ Examples:
         action="store_true",
         help="Run browser with visible window"
     )
+    parser.add_argument(
+        "--headless-mode",
+        choices=["auto", "offscreen", "new"],
+        default="auto",
+        help="How the headless browser hides its window: offscreen window (needs a display), "
+             "new headless mode (no display), or auto: new on Linux without a display "
+             "(default: auto)"
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Smaller window, fewer renderer processes, capped caches and one meeting tab "
+             "at a time (for small VMs)"
+    )
+    parser.add_argument(
+        "--shared-profile",
+        action="store_true",
+        help="Use .chrome_profile directly instead of a per-run clone "
+             "(overlapping runs then wait for each other)"
+    )
+    parser.add_argument(
+        "--use-service",
+        action="store_true",
+        help="Fetch via the warm browser service if running (see src/browser_service.py)"
+    )
+    parser.add_argument(
+        "--dom-only",
+        action="store_true",
+        help="Scrape the transcript from the page only (skip network capture)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["selenium", "playwright"],
+        default="selenium",
+        help="Browser backend for transcript pages (default: selenium; "
+             "playwright fetches several meetings concurrently with the saved session)"
+    )
+    parser.add_argument(
+        "--no-block",
+        action="store_true",
+        help="Load images, video, fonts and analytics normally (default: blocked)"
+    )
+    parser.add_argument(
+        "--no-http",
+        action="store_true",
+        help="Always use the browser (skip the browserless HTTP fast path)"
+    )
+    parser.add_argument(
+        "--refresh-transcript",
+        action="store_true",
+        help="Fetch the transcript again even if it is cached"
+    )
+    parser.add_argument(
+        "--transcript-max-age",
+        type=float,
+        metavar="HOURS",
+        help="Ignore cached transcripts older than HOURS (default: never expire)"
+    )
+    parser.add_argument(
+        "--no-transcript-cache",
+        action="store_true",
+        help="Do not read or write the local transcript cache"
+    )
+    parser.add_argument(
+        "--max-tabs",
+        type=int,
+        default=BATCH_MAX_TABS,
+        help=f"Batch: meetings loaded concurrently (default: {BATCH_MAX_TABS})"
+    )
+
+    # Generation options
+    parser.add_argument(
+        "--map-reduce",
+        action="store_true",
+        help="Summarize the transcript in parts before writing the minutes "
+             f"(default: only above {LONG_TRANSCRIPT_CHARS} characters)"
+    )
+    parser.add_argument(
+        "--map-workers",
+        type=int,
+        default=MAP_WORKERS,
+        help=f"Transcript parts summarized at the same time (default: {MAP_WORKERS})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API for the minutes (do not read or write the response cache)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Generate the minutes again even if identical inputs are cached"
+    )
 
     # Misc options
     parser.add_argument(
@@ -218,11 +552,30 @@ Examples:
     if args.login:
         return do_login(args.verbose)
 
+    # Handle probe mode
+    if args.check:
+        return check_for_new_meeting(args.meeting_name)
+    if args.auto and args.if_new and check_for_new_meeting(args.meeting_name) == CHECK_NOTHING_NEW:
+        return 0
+
     # Determine headless mode
     headless = not args.no_headless
 
-    # Get transcript
+    # Batch mode
+    batch = None
+    if args.url_file:
+        batch = read_meeting_list(args.url_file)
+    elif args.meeting_id and "," in args.meeting_id:
+        batch = [m.strip() for m in args.meeting_id.split(",") if m.strip()]
+    if batch is not None:
+        if not batch:
+            print("Error: No meetings to fetch")
+            sys.exit(1)
+        return run_batch(batch, args, headless)
+
+    # Get transcript (and the ID of the tldv meeting it came from, if fetched)
     transcript = None
+    fetched_id = None
 
     if args.file:
         if args.verbose:
@@ -237,8 +590,10 @@ Examples:
     elif args.url:
         if args.verbose:
             print(f"Fetching transcript from URL: {args.url}")
-        scraper = TldvScraper(headless=headless)
-        transcript = scraper.get_transcript_from_url(args.url)
+        transcript, fetched_id = fetch_from_tldv(
+            headless, args.use_service, meeting_url=args.url, verbose=args.verbose,
+            scraper_options=scraper_options(args)
+        )
         if not transcript:
             print("Error: Failed to fetch transcript from tldv")
             sys.exit(1)
@@ -246,8 +601,10 @@ Examples:
     elif args.meeting_id:
         if args.verbose:
             print(f"Fetching transcript for meeting ID: {args.meeting_id}")
-        scraper = TldvScraper(headless=headless)
-        transcript = scraper.get_latest_transcript(meeting_id=args.meeting_id)
+        transcript, fetched_id = fetch_from_tldv(
+            headless, args.use_service, meeting_id=args.meeting_id, verbose=args.verbose,
+            scraper_options=scraper_options(args)
+        )
         if not transcript:
             print("Error: Failed to fetch transcript from tldv")
             sys.exit(1)
@@ -257,8 +614,10 @@ Examples:
         if args.verbose:
             print(f"Auto mode: searching for meeting '{args.meeting_name}'...")
 
-        scraper = TldvScraper(headless=headless)
-        transcript = scraper.get_latest_transcript(meeting_name=args.meeting_name)
+        transcript, fetched_id = fetch_from_tldv(
+            headless, args.use_service, meeting_name=args.meeting_name, verbose=args.verbose,
+            scraper_options=scraper_options(args)
+        )
 
         if not transcript:
             print(f"Error: Could not find or fetch meeting '{args.meeting_name}'")
@@ -270,8 +629,10 @@ Examples:
         if args.verbose:
             print("Fetching latest transcript from tldv...")
 
-        scraper = TldvScraper(headless=headless)
-        transcript = scraper.get_latest_transcript()
+        transcript, fetched_id = fetch_from_tldv(
+            headless, args.use_service, verbose=args.verbose,
+            scraper_options=scraper_options(args)
+        )
 
         if not transcript:
             print("Error: Failed to fetch transcript from tldv")
@@ -282,78 +643,14 @@ Examples:
             print("  --paste       : Read from clipboard")
             sys.exit(1)
 
-    if not transcript or not transcript.strip():
+    transcript = load_transcript(transcript or "", args.file)
+    if not transcript:
         print("Error: Empty transcript")
         sys.exit(1)
 
-    if args.verbose:
-        print(f"Transcript length: {len(transcript)} characters")
-
-    # Prepare date
-    date = args.date or datetime.now().strftime("%Y年%m月%d日")
-    date_for_filename = args.date or datetime.now().strftime("%Y%m%d")
-
-    # Generate minutes
-    print("Generating meeting minutes with Claude Haiku...")
-
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        print("Error: ANTHROPIC_API_KEY must be set in .env")
-        sys.exit(1)
-
-    generator = MinutesGenerator(api_key)
-    minutes = generator.generate(
-        transcript=transcript,
-        date=date,
-        participants=args.participants,
-        video_url=args.video_url
-    )
-
-    print("Minutes generated successfully!")
-
-    if args.verbose:
-        print("\n--- Generated Minutes Preview ---")
-        preview = minutes[:500] + "..." if len(minutes) > 500 else minutes
-        print(preview)
-        print("--- End Preview ---\n")
-
-    # Save to local file
-    if not args.skip_save and not args.dry_run:
-        output_path = generator.save_minutes(minutes, date=date_for_filename)
-        print(f"Saved to: {output_path}")
-
-    # Post to Teams
-    if not args.skip_teams and not args.dry_run:
-        webhook_url = os.getenv("TEAMS_WORKFLOW_WEBHOOK_URL")
-        if webhook_url:
-            print("Posting to Teams...")
-            poster = TeamsPoster(webhook_url)
-            if poster.post_minutes(minutes, date=date, participants=args.participants):
-                print("Posted to Teams successfully!")
-            else:
-                print("Warning: Failed to post to Teams")
-        else:
-            print("Warning: Skipping Teams: TEAMS_WORKFLOW_WEBHOOK_URL not set")
-
-    # Save to OneNote
-    if not args.skip_onenote and not args.dry_run:
-        tenant_id = os.getenv("AZURE_TENANT_ID")
-        client_id = os.getenv("AZURE_CLIENT_ID")
-        section_id = os.getenv("ONENOTE_SECTION_ID")
-
-        if tenant_id and client_id:
-            print("Saving to OneNote...")
-            writer = OneNoteWriter(
-                tenant_id=tenant_id,
-                client_id=client_id,
-                section_id=section_id
-            )
-            if writer.write_minutes(minutes, date=date):
-                print("Saved to OneNote successfully!")
-            else:
-                print("Warning: Failed to save to OneNote")
-        else:
-            print("Warning: Skipping OneNote: Azure credentials not set")
+    process_transcript(transcript, args, create_generator(args))
+    if args.auto and not args.dry_run:
+        mark_processed(args.meeting_name, fetched_id)
 
     print("\nDone!")
 
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Local tldv Meeting Index
+
+SQLite index of tldv meetings (ID, title, date, duration, last seen) filled
+by an incremental crawl of the meeting list. Name, date-range and
+"latest matching" lookups are answered from the index instead of the
+live page.
+
+Usage:
+    python src/meeting_index.py                         # List indexed meetings
+    python src/meeting_index.py --name "AI定例"         # Search by name
+    python src/meeting_index.py --from 2026-01-01 --to 2026-01-31
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Index database
+INDEX_DB = Path(__file__).parent.parent / ".meeting_index.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    date TEXT,
+    duration REAL,
+    list_order REAL NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS meetings_date ON meetings (date);
+CREATE TABLE IF NOT EXISTS crawl_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Newest first. list_order follows tldv's own list order (newest at the top)
+# across crawls; dates are not always shown in the list, so they only break ties.
+_ORDER_BY = "ORDER BY list_order DESC, date DESC"
+
+_MONTHS = {name: i for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun",
+     "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+
+_DATE_PATTERNS = [
+    (re.compile(r"(\d{4})年\s*(\d{1,2})月\s*(\d{1,2})日"), ("y", "m", "d")),
+    (re.compile(r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})"), ("y", "m", "d")),
+    (re.compile(r"([A-Za-z]{3})[a-z]*\.? (\d{1,2}),? (\d{4})"), ("b", "d", "y")),
+    (re.compile(r"(\d{1,2}) ([A-Za-z]{3})[a-z]*\.? (\d{4})"), ("d", "b", "y")),
+]
+
+
+def parse_meeting_date(text: str) -> Optional[str]:
+    """
+    Extract a date from meeting list text.
+
+    Args:
+        text: Text such as "2026年2月11日", "2026/02/11" or "Feb 11, 2026"
+
+    Returns:
+        ISO date (YYYY-MM-DD), or None if no date is found
+    """
+    for pattern, order in _DATE_PATTERNS:
+        match = pattern.search(text)
+        if not match:
+            continue
+        parts = dict(zip(order, match.groups()))
+        month = _MONTHS.get(parts["b"][:3].lower()) if "b" in parts else int(parts["m"])
+        if not month:
+            continue
+        try:
+            return datetime(int(parts["y"]), month, int(parts["d"])).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+class MeetingIndex:
+    """SQLite index of tldv meetings."""
+
+    def __init__(self, db_path: Path = INDEX_DB):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = db_path
+        # Callers such as the browser service serialize access across threads
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def known_ids(self, meeting_ids: Iterable[str]) -> set:
+        """Return the subset of the given IDs that are already indexed."""
+        ids = list(meeting_ids)
+        if not ids:
+            return set()
+        placeholders = ",".join("?" * len(ids))
+        rows = self.conn.execute(
+            f"SELECT id FROM meetings WHERE id IN ({placeholders})", ids
+        )
+        return {row["id"] for row in rows}
+
+    def upsert(self, meetings: List[Dict], crawl_started: Optional[float] = None,
+               offset: int = 0) -> int:
+        """
+        Add or refresh meetings in list order (newest first).
+
+        Args:
+            meetings: Dicts with id, title and optional date and duration
+            crawl_started: Start time of the crawl, used to rank new meetings
+            offset: Position of the first meeting within the crawl
+
+        Returns:
+            Number of newly indexed meetings
+        """
+        now = time.time()
+        crawl_started = crawl_started or now
+        known = self.known_ids(m["id"] for m in meetings)
+        new = 0
+
+        with self.conn:
+            # New meetings at the top of the list that do not reach an indexed
+            # one may leave unindexed meetings below them
+            if offset == 0 and meetings and not known:
+                self.conn.execute("DELETE FROM crawl_state WHERE key = 'complete_to'")
+            for position, meeting in enumerate(meetings, start=offset):
+                date = meeting.get("date")
+                if date and not re.match(r"\d{4}-\d{2}-\d{2}", date):
+                    date = parse_meeting_date(date)
+                if meeting["id"] in known:
+                    self.conn.execute(
+                        "UPDATE meetings SET title = ?, date = COALESCE(?, date), "
+                        "duration = COALESCE(?, duration), last_seen = ? WHERE id = ?",
+                        (meeting["title"], date, meeting.get("duration"), now, meeting["id"]),
+                    )
+                else:
+                    self.conn.execute(
+                        "INSERT INTO meetings (id, title, date, duration, list_order, "
+                        "first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (meeting["id"], meeting["title"], date, meeting.get("duration"),
+                         crawl_started - position * 1e-3, now, now),
+                    )
+                    new += 1
+        return new
+
+    def search(self, name: Optional[str] = None, date_from: Optional[str] = None,
+               date_to: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Search indexed meetings, newest first.
+
+        Args:
+            name: Substring of the meeting title
+            date_from: Earliest date (YYYY-MM-DD, inclusive)
+            date_to: Latest date (YYYY-MM-DD, inclusive)
+            limit: Maximum number of results
+
+        Returns:
+            Matching meetings as dicts
+        """
+        clauses, params = [], []
+        if name:
+            clauses.append("instr(title, ?) > 0")
+            params.append(name)
+        if date_from:
+            clauses.append("date >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append("date <= ?")
+            params.append(date_to + "~")  # include timestamps on the last day
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT * FROM meetings {where} {_ORDER_BY}"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def get(self, meeting_id: str) -> Optional[Dict]:
+        """Return an indexed meeting by ID, or None."""
+        row = self.conn.execute("SELECT * FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
+        return dict(row) if row else None
+
+    def find_latest(self, name: Optional[str] = None) -> Optional[Dict]:
+        """Return the newest meeting whose title contains the name."""
+        results = self.search(name=name, limit=1)
+        return results[0] if results else None
+
+    def last_crawled(self) -> Optional[float]:
+        """Return when the meeting list was last crawled (epoch seconds), or None."""
+        return self.conn.execute("SELECT MAX(last_seen) FROM meetings").fetchone()[0]
+
+    def complete_to(self) -> Optional[str]:
+        """
+        Return the ID of the oldest meeting down to which the index has no gaps.
+
+        Every meeting from the top of the list down to this one is indexed.
+        None means an earlier crawl never reached the end of the list.
+        """
+        row = self.conn.execute(
+            "SELECT value FROM crawl_state WHERE key = 'complete_to'"
+        ).fetchone()
+        return row["value"] if row else None
+
+    def set_complete_to(self, meeting_id: Optional[str]) -> None:
+        """Record (or with None, clear) the complete-down-to marker."""
+        with self.conn:
+            if meeting_id:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO crawl_state (key, value) VALUES ('complete_to', ?)",
+                    (meeting_id,),
+                )
+            else:
+                self.conn.execute("DELETE FROM crawl_state WHERE key = 'complete_to'")
+
+    def mark_seen(self, meeting_ids: Iterable[str]) -> None:
+        """Record that the given meetings were confirmed unchanged just now."""
+        ids = list(meeting_ids)
+        if not ids:
+            return
+        placeholders = ",".join("?" * len(ids))
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE meetings SET last_seen = ? WHERE id IN ({placeholders})",
+                [time.time(), *ids],
+            )
+
+    def count(self) -> int:
+        """Return the number of indexed meetings."""
+        return self.conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+
+
+def main():
+    """Search the local meeting index."""
+    parser = argparse.ArgumentParser(description="Search the local tldv meeting index")
+    parser.add_argument("--name", type=str, help="Substring of the meeting title")
+    parser.add_argument("--from", dest="date_from", type=str, help="Earliest date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", type=str, help="Latest date (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum results (default: 20)")
+    args = parser.parse_args()
+
+    index = MeetingIndex()
+    started = time.monotonic()
+    meetings = index.search(args.name, args.date_from, args.date_to, args.limit)
+    elapsed_ms = (time.monotonic() - started) * 1000
+
+    for meeting in meetings:
+        print(f"{meeting['date'] or '----------':<10}  {meeting['id']}  {meeting['title']}")
+    print(f"\n{len(meetings)} of {index.count()} indexed meetings ({elapsed_ms:.1f} ms)")
+    index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
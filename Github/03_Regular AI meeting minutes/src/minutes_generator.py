@@ -3,31 +3,247 @@ Meeting Minutes Generator using Claude API
 
 Generates structured meeting minutes from transcripts using Claude Haiku
 for cost-effective AI processing.
+
+Minutes are streamed: stream() yields text deltas as they arrive, and
+generate() passes them to output sinks (objects with write(text) and
+close(complete)) such as MinutesFile and ConsolePreview while building the
+full text. First-token latency and tokens/sec of each generation are kept
+in .minutes_generation_stats.json.
+
+Transcripts too long for one request are generated map-reduce style: the
+transcript is split between speaker turns (overlong turns at line breaks)
+into parts of at most CHUNK_CHARS characters, the parts are summarized into
+notes concurrently, and the notes are turned into the minutes with the
+usual template. Any output cut off at the token limit is continued
+automatically.
+
+Requests put the template's instructions in the system prompt and only the
+meeting metadata and transcript in the user message. When the instructions
+reach the model's minimum cacheable length, they are marked as a
+prompt-cache breakpoint, so back-to-back and batch runs reuse them. Cache
+reads and writes are reported with the other stats.
+
+With a ResponseCache (see response_cache.py), finished minutes are stored
+under a hash of the model, prompts and generation parameters, and the
+same inputs return the stored minutes without an API call.
 """
 
 import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Union
 
 from anthropic import Anthropic
 
+from file_lock import update_json
+from response_cache import ResponseCache, response_key
+from transcript import Transcript, format_timestamp
+
 # Load prompt template from file
 PROMPT_TEMPLATE_FILE = Path(__file__).parent.parent / "AI活用ミーティング_議事録プロンプト.md"
 
+# Default directory for saved minutes
+OUTPUT_DIR = Path(__file__).parent.parent / "output"
+
+# Output token limit per request
+MAX_TOKENS = 4096
+
+# Continuation requests when an output stops at the token limit
+MAX_CONTINUATIONS = 3
+
+# Transcripts longer than this (rendered characters) are generated map-reduce style
+LONG_TRANSCRIPT_CHARS = 100_000
+
+# Transcript text characters per map chunk
+CHUNK_CHARS = 30_000
+
+# Chunks summarized at the same time
+MAP_WORKERS = 4
+
+# Output token limit of one chunk's notes
+MAP_MAX_TOKENS = 2048
+
+# Map step instructions (system prompt): notes for one part of a long meeting
+MAP_INSTRUCTIONS = """ユーザーメッセージは社内のAI活用ミーティングの文字起こしの一部（区間）です。
+後で全区間のメモをまとめて議事録を作成するので、この区間について次の情報を漏れなく箇条書きでメモしてください。
+
+- 話題ごとの要点（発言者名を明記）
+- 紹介されたAIツール・機能（正式名称、概要、活用シーン、紹介者）
+- 実際に試した結果・気づき、活用アイデア、課題・注意点、未解決の質問
+- 参加者が試せそうなアクション
+- 会話中に出てきたURL・ツール名・参考記事
+- 次回話したいテーマ
+
+区間の前後の文脈は分からなくて構いません。推測で補わず、文字起こしにある内容だけを書いてください。
+"""
+
+# Map step user message
+MAP_MESSAGE = """文字起こしの第{part}区間（全{total}区間、{span}）：
+---
+{transcript}
+---
+"""
+
+# Minutes user message: everything that changes between meetings
+MINUTES_MESSAGE = """【基本情報】
+- 日時：{date}
+- 参加者：{participants}
+- 録画URL：{video_url}
+
+以下が文字起こしです：
+---
+{transcript}
+---
+"""
+
+# Where the template takes the transcript
+_TRANSCRIPT_MARKERS = ("（ここに貼り付け）", "{transcript}")
+
+# Template metadata placeholders, pointed at the user message's 【基本情報】
+_METADATA_REFERENCES = {
+    "{date}": "（基本情報の日時）",
+    "{participants}": "（基本情報の参加者）",
+    "{video_url}": "（基本情報の録画URL）",
+}
+_EMPTY_METADATA_LINE = re.compile(r"^(- (?:日時|参加者)：)[ \t]*$", re.MULTILINE)
+
+# Reduce step: replaces the transcript in the minutes message
+REDUCE_PREFACE = """（長時間のミーティングのため、文字起こしを{total}区間に分けて要約したメモを時系列順に示します。
+区間をまたいで同じ話題が続いている場合は1つにまとめてください。）
+
+"""
+
+# Latency and throughput of recent generations
+GENERATION_STATS_FILE = Path(__file__).parent.parent / ".minutes_generation_stats.json"
+
+# Generations kept in the stats file
+GENERATION_HISTORY = 50
+
+# Shortest system prompt Claude Haiku caches (tokens); shorter breakpoints are ignored
+CACHE_MIN_TOKENS = 2048
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate a text's token count (about 4 ASCII or 1 Japanese character per token)."""
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+
+def _empty_usage() -> Dict[str, int]:
+    """Return zeroed token counters for a generation."""
+    return {"input_tokens": 0, "output_tokens": 0, "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0, "continuations": 0}
+
+
+def _add_usage(stats: Dict, usage) -> None:
+    """Add a response's usage (including prompt-cache reads and writes) to the counters."""
+    for key in ("input_tokens", "output_tokens", "cache_read_input_tokens",
+                "cache_creation_input_tokens"):
+        stats[key] += getattr(usage, key, 0) or 0
+
+
+def minutes_path(date: Optional[str] = None, output_dir: Optional[Path] = None) -> Path:
+    """Return the file minutes for a date are saved to (output/議事録_<date>.md)."""
+    if not date:
+        date = datetime.now().strftime("%Y%m%d")
+    return (output_dir or OUTPUT_DIR) / f"議事録_{date}.md"
+
+
+class MinutesFile:
+    """Output sink that writes minutes to a file as they are generated."""
+
+    def __init__(self, path: Path):
+        """
+        Open the sink.
+
+        Text goes to a hidden temp file next to the target, flushed on every
+        delta (follow it with tail -f); it replaces the target only when the
+        generation completes, so a failed run never leaves truncated minutes.
+
+        Args:
+            path: Minutes file to write
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.partial = path.with_name(f".{path.name}.tmp")
+        self._file = open(self.partial, "w", encoding="utf-8")
+
+    def write(self, text: str) -> None:
+        """Append a text delta."""
+        self._file.write(text)
+        self._file.flush()
+
+    def close(self, complete: bool = True) -> None:
+        """Move the finished file into place, or discard an incomplete one."""
+        self._file.close()
+        if complete:
+            os.replace(self.partial, self.path)
+        else:
+            self.partial.unlink(missing_ok=True)
+
+
+class ConsolePreview:
+    """Output sink that prints the beginning of the minutes as they are generated."""
+
+    def __init__(self, limit: Optional[int] = 500):
+        """
+        Open the sink.
+
+        Args:
+            limit: Characters to print (None for all)
+        """
+        self.limit = limit
+        self.printed = 0
+        print("\n--- Generated Minutes Preview ---")
+
+    def write(self, text: str) -> None:
+        """Print a text delta while under the limit."""
+        if self.limit is not None:
+            if self.printed >= self.limit:
+                return
+            text = text[:self.limit - self.printed]
+        self.printed += len(text)
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def close(self, complete: bool = True) -> None:
+        """Finish the preview."""
+        if self.limit is not None and self.printed >= self.limit:
+            sys.stdout.write("...")
+        print("\n--- End Preview ---\n" if complete else "\n--- Generation failed ---\n")
+
 
 class MinutesGenerator:
     """Generates meeting minutes using Claude API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None,
+                 long_transcript_chars: int = LONG_TRANSCRIPT_CHARS,
+                 chunk_chars: int = CHUNK_CHARS, map_workers: int = MAP_WORKERS,
+                 cache: Optional[ResponseCache] = None, refresh: bool = False):
         """
         Initialize the generator.
 
         Args:
             api_key: Anthropic API key. If not provided, uses ANTHROPIC_API_KEY env var.
+            long_transcript_chars: Generate map-reduce style above this many
+                                   rendered characters (0 to always do so)
+            chunk_chars: Transcript text characters per map chunk
+            map_workers: Chunks summarized at the same time
+            cache: Response cache for finished minutes (None to always call the API)
+            refresh: Ignore cached minutes but store the new ones
         """
         self.client = Anthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"))
         self.model = "claude-3-haiku-20240307"  # Cost-effective model
+        self.long_transcript_chars = long_transcript_chars
+        self.chunk_chars = chunk_chars
+        self.map_workers = map_workers
+        self.cache = cache
+        self.refresh = refresh
+        self.last_stats: Optional[Dict] = None
 
     def _load_prompt_template(self) -> str:
         """Load the prompt template from file."""
@@ -92,62 +308,294 @@ class MinutesGenerator:
 ---
 """
 
+    def _build_instructions(self) -> str:
+        """
+        Turn the prompt template into a system prompt that is the same for every meeting.
+
+        The transcript section is cut off and the metadata placeholders
+        refer to the 【基本情報】 block of the user message instead.
+        """
+        template = self._load_prompt_template()
+        for marker in _TRANSCRIPT_MARKERS:
+            if marker in template:
+                template = template.split(marker)[0]
+                break
+
+        # Drop the transcript's fence and its "以下が文字起こしです：" lead-in
+        lines = template.rstrip().splitlines()
+        while lines and lines[-1].strip() in ("---", ""):
+            lines.pop()
+        if lines and lines[-1].rstrip().endswith(("：", ":")):
+            lines.pop()
+        instructions = "\n".join(lines).rstrip()
+
+        for placeholder, reference in _METADATA_REFERENCES.items():
+            instructions = instructions.replace(placeholder, reference)
+        instructions = _EMPTY_METADATA_LINE.sub(r"\1（基本情報を参照）", instructions)
+        return instructions + "\n\n基本情報と文字起こしはユーザーメッセージで渡します。"
+
+    def _build_message(self, transcript: str, date: Optional[str],
+                       participants: Optional[str], video_url: Optional[str]) -> str:
+        """Build the user message with the meeting metadata and transcript (or notes)."""
+        return MINUTES_MESSAGE.format(
+            date=date or datetime.now().strftime("%Y年%m月%d日"),
+            participants=participants or "（自動検出）",
+            video_url=video_url or "（未設定）",
+            transcript=transcript,
+        )
+
+    def stream(
+        self,
+        transcript: Union[str, Transcript],
+        date: Optional[str] = None,
+        participants: Optional[str] = None,
+        video_url: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Generate meeting minutes, yielding text deltas as they arrive.
+
+        Args:
+            transcript: The meeting transcript (text or structured Transcript)
+            date: Meeting date (optional, defaults to today; only a given
+                date is part of the response cache key)
+            participants: Comma-separated list of participants (optional)
+            video_url: Video recording URL (optional)
+
+        Yields:
+            Pieces of the minutes markdown, in order. Long transcripts are
+            summarized part by part first, so the first piece arrives after
+            that. When the stream is exhausted, last_stats holds its latency
+            and throughput.
+        """
+        started = time.monotonic()
+        stats = {**_empty_usage(), "chunks": 0, "map_seconds": 0.0, "map_output_tokens": 0}
+
+        # Render structured transcripts to prompt text once, here at the edge
+        text = transcript.render() if isinstance(transcript, Transcript) else transcript
+        long = len(text) > self.long_transcript_chars
+        instructions = self._build_instructions()
+        message = self._build_message(text, date, participants, video_url)
+
+        key = None
+        if self.cache:
+            map_reduce = ({"chunk_chars": self.chunk_chars, "instructions": MAP_INSTRUCTIONS,
+                           "message": MAP_MESSAGE, "max_tokens": MAP_MAX_TOKENS,
+                           "preface": REDUCE_PREFACE} if long else None)
+            # The default date (today) is left out so a rerun on a later day still hits
+            key_message = self._build_message(text, date or "（未指定）", participants, video_url)
+            key = response_key(self.model, instructions, key_message, max_tokens=MAX_TOKENS,
+                               max_continuations=MAX_CONTINUATIONS, map_reduce=map_reduce)
+            cached = None if self.refresh else self.cache.get(key)
+            if cached is not None:
+                self.last_stats = {"at": time.time(), "model": self.model, "cached": True,
+                                   "seconds": time.monotonic() - started}
+                yield cached
+                return
+
+        if long:
+            if not isinstance(transcript, Transcript):
+                transcript = Transcript.parse(transcript)
+            message = self._build_message(self._map_chunks(transcript, stats), date,
+                                          participants, video_url)
+
+        parts = []
+        first_token = None
+        for delta in self._stream_completion(instructions, message, MAX_TOKENS, stats):
+            if first_token is None:
+                first_token = time.monotonic()
+            parts.append(delta)
+            yield delta
+
+        self._record_stats(started, first_token, stats)
+        if key and stats.get("stop_reason") != "max_tokens":
+            self.cache.put(key, "".join(parts), model=self.model)
+
+    def _stream_completion(self, instructions: str, prompt: str, max_tokens: int,
+                           stats: Dict) -> Iterator[str]:
+        """
+        Stream a completion, continuing it while it stops at the token limit.
+
+        Args:
+            instructions: Static system prompt (cached between requests when it
+                is at least CACHE_MIN_TOKENS long)
+            prompt: User message
+            max_tokens: Output token limit per request
+            stats: Token counts, continuations and stop reason are added here
+
+        Yields:
+            Text deltas of the whole completion, in order
+        """
+        system = [
+            {
+                "type": "text",
+                "text": instructions
+            }
+        ]
+        if estimate_tokens(instructions) >= CACHE_MIN_TOKENS:
+            system[0]["cache_control"] = {"type": "ephemeral"}
+        messages = [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+        text = ""
+        # Whitespace already yielded but cut from the resumed text
+        trimmed = False
+        for attempt in range(MAX_CONTINUATIONS + 1):
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=system,
+                messages=messages
+            ) as stream:
+                for delta in stream.text_stream:
+                    if trimmed:
+                        delta = delta.lstrip()
+                        trimmed = not delta
+                    text += delta
+                    yield delta
+                message = stream.get_final_message()
+
+            _add_usage(stats, message.usage)
+            stats["stop_reason"] = message.stop_reason
+            if message.stop_reason != "max_tokens" or attempt == MAX_CONTINUATIONS:
+                break
+
+            # Resume from the text so far (the API rejects a trailing space here)
+            stats["continuations"] += 1
+            trimmed = text != text.rstrip()
+            messages = messages[:1] + [{"role": "assistant", "content": text.rstrip()}]
+
+        if stats.get("stop_reason") == "max_tokens":
+            print(f"Warning: Output still cut off after {MAX_CONTINUATIONS} continuations")
+
+    def _complete(self, instructions: str, prompt: str, max_tokens: int, stats: Dict) -> str:
+        """Return a whole completion (continued past the token limit)."""
+        return "".join(self._stream_completion(instructions, prompt, max_tokens, stats))
+
+    def _map_chunks(self, transcript: Transcript, stats: Dict) -> str:
+        """
+        Summarize a long transcript part by part, concurrently.
+
+        Args:
+            transcript: The whole transcript
+            stats: Token counts and the number of chunks are added here
+
+        Returns:
+            Notes of every part in transcript order, to be used in place of
+            the transcript in the minutes template
+        """
+        chunks = transcript.chunks(self.chunk_chars)
+        total = len(chunks)
+        workers = max(1, min(self.map_workers, total))
+        print(f"Long transcript ({transcript.char_count} characters): summarizing "
+              f"{total} parts, {workers} at a time...")
+
+        def summarize(part: int) -> tuple:
+            chunk = chunks[part - 1]
+            first, last = chunk[0].start_ms, chunk[-1].start_ms
+            span = (f"{format_timestamp(first)}〜{format_timestamp(last)}"
+                    if first is not None and last is not None else f"{len(chunk)}発言")
+            chunk_stats = _empty_usage()
+            notes = self._complete(MAP_INSTRUCTIONS, MAP_MESSAGE.format(
+                total=total, part=part, span=span, transcript=chunk.render()
+            ), MAP_MAX_TOKENS, chunk_stats)
+            return f"【第{part}区間（{span}）】\n{notes.strip()}", chunk_stats
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(summarize, range(1, total + 1)))
+
+        for _, chunk_stats in results:
+            stats["map_output_tokens"] += chunk_stats["output_tokens"]
+            for key in _empty_usage():
+                if key != "output_tokens":
+                    stats[key] += chunk_stats[key]
+        stats["chunks"] = total
+        stats["map_seconds"] = time.monotonic() - started
+        print(f"Summarized {total} parts in {stats['map_seconds']:.1f}s")
+
+        return REDUCE_PREFACE.format(total=total) + "\n\n".join(notes for notes, _ in results)
+
+    def _record_stats(self, started: float, first_token: Optional[float], stats: Dict) -> None:
+        """
+        Keep a finished generation's latency and throughput.
+
+        Args:
+            started: time.monotonic() when generation started
+            first_token: time.monotonic() when the first minutes text arrived
+            stats: Token counts of the generation (output_tokens: minutes only)
+        """
+        finished = time.monotonic()
+        streaming = finished - (first_token or started)
+        self.last_stats = {
+            "at": time.time(),
+            "model": self.model,
+            "seconds": finished - started,
+            "first_token": first_token - started if first_token is not None else None,
+            "tokens_per_second": stats["output_tokens"] / streaming if streaming > 0 else 0.0,
+            **stats,
+        }
+        run = self.last_stats
+        update_json(GENERATION_STATS_FILE,
+                    lambda history: (history + [run])[-GENERATION_HISTORY:], default=[])
+
+    def summary(self) -> str:
+        """Describe the last generation's latency and throughput."""
+        stats = self.last_stats
+        if not stats:
+            return "no generation yet"
+        if stats.get("cached"):
+            return f"from the response cache in {stats['seconds']:.2f}s, no API call"
+        first = f"{stats['first_token']:.1f}s" if stats["first_token"] is not None else "n/a"
+        summary = (f"first token after {first}, {stats['output_tokens']} tokens in "
+                   f"{stats['seconds']:.1f}s ({stats['tokens_per_second']:.0f} tokens/s)")
+        if stats.get("chunks"):
+            summary += f", {stats['chunks']} parts summarized in {stats['map_seconds']:.1f}s"
+        if stats.get("continuations"):
+            summary += f", {stats['continuations']} continuations"
+        summary += (f"; input {stats['input_tokens']} tokens, cache read "
+                    f"{stats.get('cache_read_input_tokens', 0)}, cache write "
+                    f"{stats.get('cache_creation_input_tokens', 0)}")
+        return summary
+
     def generate(
         self,
-        transcript: str,
+        transcript: Union[str, Transcript],
         date: Optional[str] = None,
         participants: Optional[str] = None,
         video_url: Optional[str] = None,
+        sinks: Optional[List] = None,
     ) -> str:
         """
         Generate meeting minutes from transcript.
 
         Args:
-            transcript: The meeting transcript text
+            transcript: The meeting transcript (text or structured Transcript)
             date: Meeting date (optional, defaults to today)
             participants: Comma-separated list of participants (optional)
             video_url: Video recording URL (optional)
+            sinks: Output sinks fed each text delta as it arrives (e.g.
+                   MinutesFile, ConsolePreview); closed when generation ends
 
         Returns:
             Generated meeting minutes as markdown
         """
-        # Prepare date
-        if not date:
-            date = datetime.now().strftime("%Y年%m月%d日")
-
-        # Load and prepare prompt
-        template = self._load_prompt_template()
-
-        # Replace placeholders in template
-        prompt = template.replace("（ここに貼り付け）", transcript)
-
-        # If template has date/participants placeholders, replace them
-        if "{date}" in prompt:
-            prompt = prompt.replace("{date}", date)
-        if "{participants}" in prompt:
-            prompt = prompt.replace("{participants}", participants or "（自動検出）")
-        if "{transcript}" in prompt:
-            prompt = prompt.replace("{transcript}", transcript)
-        if "{video_url}" in prompt:
-            prompt = prompt.replace("{video_url}", video_url or "（未設定）")
-
-        # Insert date info if not in template
-        if "【基本情報】" in prompt and date:
-            prompt = prompt.replace("- 日時：", f"- 日時：{date}")
-
-        # Call Claude API
-        message = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-
-        return message.content[0].text
+        sinks = sinks or []
+        parts = []
+        complete = False
+        try:
+            for delta in self.stream(transcript, date, participants, video_url):
+                parts.append(delta)
+                for sink in sinks:
+                    sink.write(delta)
+            complete = True
+        finally:
+            for sink in sinks:
+                sink.close(complete)
+
+        return "".join(parts)
 
     def save_minutes(
         self,
@@ -166,16 +614,8 @@ class MinutesGenerator:
         Returns:
             Path to the saved file
         """
-        if output_dir is None:
-            output_dir = Path(__file__).parent.parent / "output"
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        if not date:
-            date = datetime.now().strftime("%Y%m%d")
-
-        filename = f"議事録_{date}.md"
-        filepath = output_dir / filename
+        filepath = minutes_path(date, output_dir)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
 
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(minutes)
@@ -206,15 +646,13 @@ def main():
     """
 
     print("Generating minutes...")
-    minutes = generator.generate(
+    generator.generate(
         transcript=sample_transcript,
         date="2026年2月11日",
-        participants="山中、田中"
+        participants="山中、田中",
+        sinks=[ConsolePreview(limit=None)]
     )
-
-    print("\n--- Generated Minutes ---")
-    print(minutes)
-    print("--- End ---")
+    print(generator.summary())
 
 
 if __name__ == "__main__":
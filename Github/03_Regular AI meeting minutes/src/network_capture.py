@@ -0,0 +1,365 @@
+"""
+Network Transcript Capture via Chrome DevTools
+
+Listens to Chrome's network events (performance log) while a meeting page
+loads and captures the JSON payload the tldv frontend fetches for the
+transcript. The payload is decoded directly into speaker/timestamp segments,
+so no rendering-dependent waits or DOM scraping are needed.
+
+The same decoders are used by the browserless HTTP client (tldv_http.py).
+
+Responses from transcript-like URLs (or the learned transcript endpoint) are
+decoded leniently. Other large JSON responses are only accepted if nearly
+every entry has a speaker, text and time, and are reported as untrusted, so
+comment or activity feeds are never mistaken for a cached transcript.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+
+from transcript import TranscriptSegment
+
+# How long to wait for the transcript request after navigation (seconds)
+NETWORK_CAPTURE_TIMEOUT = 8
+
+# Once the page has rendered, stop waiting for the request after this long
+NETWORK_CAPTURE_GRACE = 1.5
+
+# URL fragments that identify transcript API responses
+TRANSCRIPT_URL_HINTS = ("transcript", "transcription", "caption", "utterance")
+
+# URL fragments that identify meeting list API responses
+MEETING_LIST_URL_HINTS = ("meetings",)
+
+# Large JSON responses are inspected even without a URL hint
+MIN_UNHINTED_BYTES = 4096
+
+# Placeholder for the meeting ID in learned endpoint templates
+MEETING_ID_PLACEHOLDER = "{meeting_id}"
+
+# Candidate keys in transcript payloads
+TEXT_KEYS = ("text", "content", "sentence", "transcript", "body")
+SPEAKER_KEYS = ("speaker", "speakerName", "speaker_name", "name", "participant",
+                "participantName", "user", "author")
+START_KEYS = ("startTime", "start_time", "start", "startMs", "start_ms",
+              "startTimestamp", "from", "offset", "timestamp", "time")
+END_KEYS = ("endTime", "end_time", "end", "endMs", "end_ms", "endTimestamp", "to")
+
+# Candidate keys in meeting list payloads
+MEETING_ID_KEYS = ("id", "_id", "meetingId", "meeting_id", "uuid")
+MEETING_TITLE_KEYS = ("name", "title", "meetingName", "meeting_name")
+MEETING_DATE_KEYS = ("happenedAt", "startedAt", "startTime", "start_time",
+                     "createdAt", "created_at", "date")
+MEETING_DURATION_KEYS = ("duration", "durationSeconds", "duration_seconds", "length")
+
+# A segment list must have at least this many entries to count as a transcript
+MIN_SEGMENTS = 2
+
+
+def enable_performance_logging(options) -> None:
+    """Enable the Chrome performance log (network events) on driver options."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def _first(item: Dict, keys) -> Tuple[Optional[str], Any]:
+    """Return (key, value) for the first present, non-empty key, or (None, None)."""
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, ""):
+            return key, value
+    return None, None
+
+
+def _speaker_name(value: Any) -> str:
+    """Extract a speaker name from a string or nested object."""
+    if isinstance(value, dict):
+        _, name = _first(value, ("name", "displayName", "fullName", "email"))
+        return str(name) if name else ""
+    return str(value) if value is not None else ""
+
+
+def _segment_text(item: Dict) -> str:
+    """Extract segment text, joining word-level entries if necessary."""
+    _, text = _first(item, TEXT_KEYS)
+    if isinstance(text, str):
+        return text.strip()
+
+    words = item.get("words")
+    if isinstance(words, list):
+        parts = []
+        for word in words:
+            if isinstance(word, dict):
+                _, value = _first(word, ("text", "word", "value"))
+                if value:
+                    parts.append(str(value))
+            elif isinstance(word, str):
+                parts.append(word)
+        return " ".join(parts).strip()
+    return ""
+
+
+def _to_ms(key: Optional[str], value: Any, scale: int) -> Optional[int]:
+    """Convert a time value to milliseconds using the detected scale."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        # "HH:MM:SS" or "MM:SS"
+        if ":" in value:
+            try:
+                parts = [float(p) for p in value.split(":")]
+            except ValueError:
+                return None
+            seconds = 0.0
+            for part in parts:
+                seconds = seconds * 60 + part
+            return int(seconds * 1000)
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    if key and key.lower().endswith("ms"):
+        return int(value)
+    return int(float(value) * scale)
+
+
+def _detect_scale(items: List[Dict]) -> int:
+    """Guess whether numeric times are seconds (1000) or milliseconds (1)."""
+    values = []
+    for item in items:
+        key, value = _first(item, START_KEYS)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if key.lower().endswith("ms"):
+                return 1
+            values.append(value)
+    # A meeting longer than a day is implausible, so large values are milliseconds
+    return 1 if values and max(values) > 86400 else 1000
+
+
+def _decode_list(items: List[Any], strict: bool = False) -> Optional[List[TranscriptSegment]]:
+    """
+    Decode a list of segment-like objects, or return None if it is not one.
+
+    Args:
+        items: JSON list
+        strict: Require a speaker, text and time in 80% of the entries
+            (default: text in 80% and a time in 50%)
+    """
+    dicts = [item for item in items if isinstance(item, dict)]
+    if len(dicts) < MIN_SEGMENTS or len(dicts) < len(items) * 0.8:
+        return None
+
+    with_text = [item for item in dicts if _segment_text(item)]
+    with_time = [item for item in dicts if _first(item, START_KEYS)[0]]
+    if len(with_text) < len(dicts) * 0.8 or len(with_time) < len(dicts) * 0.5:
+        return None
+    if strict:
+        complete = [item for item in with_text
+                    if _first(item, START_KEYS)[0] and _first(item, SPEAKER_KEYS)[0]]
+        if len(complete) < len(dicts) * 0.8:
+            return None
+
+    scale = _detect_scale(dicts)
+    segments = []
+    for item in with_text:
+        start_key, start = _first(item, START_KEYS)
+        end_key, end = _first(item, END_KEYS)
+        _, speaker = _first(item, SPEAKER_KEYS)
+        segments.append(TranscriptSegment(
+            speaker=_speaker_name(speaker),
+            start_ms=_to_ms(start_key, start, scale),
+            end_ms=_to_ms(end_key, end, scale),
+            text=_segment_text(item),
+        ))
+    return segments
+
+
+def _decode_meeting_list(items: List[Any]) -> Optional[List[Dict]]:
+    """Decode a list of meeting-like objects, or return None if it is not one."""
+    dicts = [item for item in items if isinstance(item, dict)]
+    if not dicts or len(dicts) < len(items) * 0.8:
+        return None
+
+    meetings = []
+    for item in dicts:
+        _, meeting_id = _first(item, MEETING_ID_KEYS)
+        _, title = _first(item, MEETING_TITLE_KEYS)
+        if not meeting_id or not isinstance(title, str):
+            continue
+        _, date = _first(item, MEETING_DATE_KEYS)
+        _, duration = _first(item, MEETING_DURATION_KEYS)
+        meetings.append({
+            "id": str(meeting_id),
+            "title": title,
+            "date": str(date) if date is not None else None,
+            "duration": duration if isinstance(duration, (int, float)) else None,
+        })
+
+    if len(meetings) < len(dicts) * 0.8:
+        return None
+    return meetings
+
+
+def _find_largest(payload: Any, decode_list) -> Optional[List]:
+    """Return the largest list inside a JSON payload that decode_list accepts."""
+    best = None
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            decoded = decode_list(node)
+            if decoded and (best is None or len(decoded) > len(best)):
+                best = decoded
+            else:
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
+    return best
+
+
+def decode_transcript_payload(payload: Any) -> Optional[List[TranscriptSegment]]:
+    """
+    Find and decode the transcript segments inside a JSON payload.
+
+    The payload schema is not documented, so the largest list of objects that
+    carry text and timing fields is taken as the transcript.
+
+    Args:
+        payload: Parsed JSON response body
+
+    Returns:
+        Transcript segments, or None if the payload is not recognized
+    """
+    return _find_largest(payload, _decode_list)
+
+
+def decode_complete_transcript_payload(payload: Any) -> Optional[List[TranscriptSegment]]:
+    """Like decode_transcript_payload, but every segment needs a speaker, text and time."""
+    return _find_largest(payload, lambda items: _decode_list(items, strict=True))
+
+
+def matches_endpoint(url: str, template: Optional[str]) -> bool:
+    """Return True if a request URL matches a learned endpoint template."""
+    if not template:
+        return False
+    prefix, placeholder, suffix = template.split("?")[0].partition(MEETING_ID_PLACEHOLDER)
+    path = url.split("?")[0]
+    if not placeholder:
+        return path == prefix
+    return (path.startswith(prefix) and path.endswith(suffix)
+            and len(path) > len(prefix) + len(suffix))
+
+
+def decode_meeting_list(payload: Any) -> Optional[List[Dict]]:
+    """
+    Find and decode the meeting list inside a JSON payload.
+
+    Args:
+        payload: Parsed JSON response body
+
+    Returns:
+        List of dicts with id, title, date and duration, or None if not recognized
+    """
+    return _find_largest(payload, _decode_meeting_list)
+
+
+class NetworkTranscriptCapture:
+    """Captures tldv API responses (transcript, meeting list) from Chrome's network events."""
+
+    def __init__(self, driver, listener: Optional[Callable[[List[Dict]], None]] = None):
+        """
+        Initialize the capture.
+
+        Args:
+            driver: Chrome WebDriver created with performance logging enabled
+            listener: Called with every batch of performance log entries read,
+                including discarded ones (e.g. for request statistics)
+        """
+        self.driver = driver
+        self.listener = listener
+        self.matched_url: Optional[str] = None
+        # True if the match came from a hinted URL or the learned endpoint
+        self.matched_hinted = False
+        self._responses: Dict[str, Dict] = {}
+
+    def reset(self) -> None:
+        """Discard buffered network events (call before navigating)."""
+        self._responses.clear()
+        self.matched_url = None
+        self.matched_hinted = False
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException:
+            return
+        if self.listener:
+            self.listener(entries)
+
+    def _read_body(self, request_id: str) -> Optional[Any]:
+        """Fetch and parse a response body over the DevTools protocol."""
+        try:
+            result = self.driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request_id}
+            )
+            return json.loads(result.get("body", ""))
+        except (WebDriverException, ValueError):
+            return None
+
+    def poll(self, decoder=decode_transcript_payload, hints=TRANSCRIPT_URL_HINTS,
+             unhinted_decoder=decode_complete_transcript_payload,
+             endpoint: Optional[str] = None) -> Optional[Any]:
+        """
+        Process new network events and decode the first matching JSON response.
+
+        Sets matched_url, and matched_hinted to whether the response came from
+        a hinted URL or the learned endpoint.
+
+        Args:
+            decoder: Payload decoder returning None for unrecognized payloads
+            hints: URL fragments that mark a response as a likely match
+            unhinted_decoder: Stricter decoder for large responses from other URLs
+            endpoint: Learned endpoint template, trusted like a hinted URL
+
+        Returns:
+            Decoded payload (transcript segments by default), or None
+        """
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException:
+            return None
+        if self.listener:
+            self.listener(entries)
+
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get("method")
+            params = message.get("params", {})
+
+            if method == "Network.responseReceived":
+                response = params.get("response", {})
+                if "json" in response.get("mimeType", ""):
+                    url = response.get("url", "")
+                    self._responses[params["requestId"]] = {
+                        "url": url,
+                        "hinted": (any(hint in url.lower() for hint in hints)
+                                   or matches_endpoint(url, endpoint)),
+                    }
+
+            elif method == "Network.loadingFinished":
+                info = self._responses.pop(params.get("requestId"), None)
+                if not info:
+                    continue
+                if not info["hinted"] and params.get("encodedDataLength", 0) < MIN_UNHINTED_BYTES:
+                    continue
+                payload = self._read_body(params["requestId"])
+                decode = decoder if info["hinted"] else unhinted_decoder
+                decoded = decode(payload) if payload is not None else None
+                if decoded:
+                    self.matched_url = info["url"]
+                    self.matched_hinted = info["hinted"]
+                    return decoded
+        return None
@@ -12,6 +12,8 @@ from typing import Optional
 import requests
 import msal
 
+from file_lock import atomic_write, file_lock
+
 # Token cache file
 TOKEN_CACHE_FILE = Path(__file__).parent.parent / ".msal_token_cache.json"
 
@@ -56,7 +58,8 @@ class OneNoteWriter:
 
             # Load existing cache if available
             if TOKEN_CACHE_FILE.exists():
-                cache.deserialize(TOKEN_CACHE_FILE.read_text())
+                with file_lock(TOKEN_CACHE_FILE, shared=True):
+                    cache.deserialize(TOKEN_CACHE_FILE.read_text())
 
             self._app = msal.PublicClientApplication(
                 self.client_id,
@@ -67,11 +70,11 @@ class OneNoteWriter:
         return self._app
 
     def _save_cache(self) -> None:
-        """Save token cache to file."""
+        """Save token cache to file (atomically, under a lock shared with other runs)."""
         if self._app and self._app.token_cache.has_state_changed:
-            TOKEN_CACHE_FILE.write_text(
-                self._app.token_cache.serialize()
-            )
+            with file_lock(TOKEN_CACHE_FILE):
+                atomic_write(TOKEN_CACHE_FILE, self._app.token_cache.serialize())
+            self._app.token_cache.has_state_changed = False
 
     def authenticate(self) -> bool:
         """
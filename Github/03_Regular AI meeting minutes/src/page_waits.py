@@ -0,0 +1,256 @@
+"""
+Readiness-driven page waits for the tldv scraper
+
+Waits on concrete page conditions (DOM readiness, meeting links,
+transcript content) instead of fixed sleeps. Every wait has its own
+timeout and records how long it actually took.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Default timeouts (seconds)
+DOCUMENT_READY_TIMEOUT = 15
+MEETING_LIST_TIMEOUT = 15
+MEETING_PAGE_TIMEOUT = 20
+TRANSCRIPT_TIMEOUT = 20
+
+# Polling interval for all waits (seconds)
+POLL_INTERVAL = 0.2
+
+# Transcript is considered stable once its length stops changing for this long
+TRANSCRIPT_STABLE_WINDOW = 1.0
+
+# Minimum transcript length that counts as "loaded"
+MIN_TRANSCRIPT_LENGTH = 50
+
+# Stop waiting for the transcript if no container has rendered after this long
+TRANSCRIPT_CONTAINER_GRACE = 3.0
+
+# Returns the number of meeting links rendered, or -1 on the sign-in page
+_MEETING_LINKS_SCRIPT = """
+if (/signin|login/.test(location.href)) { return -1; }
+var links = document.querySelectorAll("a[href*='/app/meetings/']");
+var count = 0;
+for (var i = 0; i < links.length; i++) {
+    var id = links[i].href.split(/[?#]/)[0].replace(/\\/+$/, '').split('/').pop();
+    if (id.length >= 10) { count++; }
+}
+return count;
+"""
+
+# Returns true once any of the given XPaths or CSS selectors matches
+_ANY_PRESENT_SCRIPT = """
+var xpaths = arguments[0], selectors = arguments[1];
+for (var i = 0; i < xpaths.length; i++) {
+    var r = document.evaluate(xpaths[i], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+    if (r.singleNodeValue) { return true; }
+}
+for (var j = 0; j < selectors.length; j++) {
+    if (document.querySelector(selectors[j])) { return true; }
+}
+return false;
+"""
+
+# Returns [index, element, text] for the first visible match among the
+# given XPaths (or CSS selectors) with at least min_length characters
+_FIRST_VISIBLE_SCRIPT = """
+var candidates = arguments[0], isXpath = arguments[1], minLength = arguments[2];
+for (var i = 0; i < candidates.length; i++) {
+    var el = isXpath
+        ? document.evaluate(candidates[i], document, null,
+              XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(candidates[i]);
+    if (!el || !el.getClientRects().length) { continue; }
+    var text = el.innerText || '';
+    if (text.length >= minLength) { return [i, el, text]; }
+}
+return [null, null, null];
+"""
+
+# Returns the text length of the largest matching transcript container,
+# or -1 if no container is rendered
+_TRANSCRIPT_LENGTH_SCRIPT = """
+var selectors = arguments[0], best = -1;
+for (var i = 0; i < selectors.length; i++) {
+    var el = document.querySelector(selectors[i]);
+    if (el) { best = Math.max(best, (el.textContent || '').length); }
+}
+return best;
+"""
+
+
+class PageWaiter:
+    """Waits for tldv page states and records how long each wait took."""
+
+    def __init__(self, driver):
+        """
+        Initialize the waiter.
+
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        self.driver = driver
+        self.timings: List[Dict] = []
+
+    def _record(self, name: str, started: float, ok: bool) -> bool:
+        """Record the duration and outcome of a wait."""
+        self.timings.append({
+            "name": name,
+            "seconds": round(time.monotonic() - started, 3),
+            "ok": ok,
+        })
+        return ok
+
+    def until(self, name: str, condition: Callable[[], bool], timeout: float) -> bool:
+        """
+        Wait until a condition returns a truthy value.
+
+        Args:
+            name: Label used in the recorded timings
+            condition: Zero-argument callable evaluated on every poll
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        started = time.monotonic()
+        try:
+            WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=POLL_INTERVAL,
+                ignored_exceptions=(WebDriverException,),
+            ).until(lambda _: condition())
+            return self._record(name, started, True)
+        except TimeoutException:
+            return self._record(name, started, False)
+
+    def document_ready(self, timeout: float = DOCUMENT_READY_TIMEOUT) -> bool:
+        """Wait until document.readyState is 'complete'."""
+        return self.until(
+            "document_ready",
+            lambda: self.driver.execute_script("return document.readyState") == "complete",
+            timeout,
+        )
+
+    def meeting_list(self, timeout: float = MEETING_LIST_TIMEOUT) -> bool:
+        """
+        Wait until meeting links are rendered or the app redirects to sign-in.
+
+        Returns:
+            True if meeting links appeared, False on sign-in redirect or timeout
+        """
+        state = {"count": 0}
+
+        def check() -> bool:
+            state["count"] = self.driver.execute_script(_MEETING_LINKS_SCRIPT)
+            return state["count"] != 0
+
+        self.until("meeting_list", check, timeout)
+        return state["count"] > 0
+
+    def meeting_link_count(self) -> int:
+        """Return the number of meeting links currently rendered (-1 on sign-in)."""
+        try:
+            return self.driver.execute_script(_MEETING_LINKS_SCRIPT)
+        except WebDriverException:
+            return 0
+
+    def more_meetings(self, previous_count: int, timeout: float = 5) -> bool:
+        """Wait until more meeting links are rendered than before."""
+        return self.until(
+            "meeting_list_more",
+            lambda: self.meeting_link_count() > previous_count,
+            timeout,
+        )
+
+    def any_present(self, name: str, xpaths: List[str], selectors: List[str],
+                    timeout: float = MEETING_PAGE_TIMEOUT) -> bool:
+        """Wait until any of the given XPaths or CSS selectors matches."""
+        return self.until(
+            name,
+            lambda: self.driver.execute_script(_ANY_PRESENT_SCRIPT, xpaths, selectors),
+            timeout,
+        )
+
+    def is_present(self, xpaths: List[str], selectors: List[str]) -> bool:
+        """Check once, without waiting, whether any XPath or CSS selector matches."""
+        try:
+            return bool(self.driver.execute_script(_ANY_PRESENT_SCRIPT, xpaths, selectors))
+        except WebDriverException:
+            return False
+
+    def first_visible(self, xpaths: Optional[List[str]] = None,
+                      selectors: Optional[List[str]] = None,
+                      min_length: int = 0) -> Tuple[Optional[int], Any, Optional[str]]:
+        """
+        Find the first visible element among candidates in one round-trip.
+
+        Args:
+            xpaths: XPaths to try in order (or selectors)
+            selectors: CSS selectors to try in order
+            min_length: Minimum innerText length for a match
+
+        Returns:
+            (index of the matching candidate, element, innerText), or (None, None, None)
+        """
+        candidates = xpaths if xpaths is not None else selectors
+        try:
+            index, element, text = self.driver.execute_script(
+                _FIRST_VISIBLE_SCRIPT, candidates, xpaths is not None, min_length
+            )
+        except WebDriverException:
+            return None, None, None
+        return index, element, text
+
+    def transcript_stable(self, selectors: List[str],
+                          timeout: float = TRANSCRIPT_TIMEOUT,
+                          stable_window: float = TRANSCRIPT_STABLE_WINDOW,
+                          min_length: int = MIN_TRANSCRIPT_LENGTH) -> bool:
+        """
+        Wait until the transcript container is non-empty and stops growing.
+
+        Args:
+            selectors: CSS selectors that may match the transcript container
+            timeout: Maximum seconds to wait
+            stable_window: Seconds the length must stay unchanged
+            min_length: Minimum text length before stability is checked
+
+        Returns:
+            True if the transcript settled, False on timeout or if no
+            container rendered within TRANSCRIPT_CONTAINER_GRACE seconds
+        """
+        started = time.monotonic()
+        state: Dict[str, Any] = {"length": -1, "since": None, "missing": False}
+
+        def check() -> bool:
+            length = self.driver.execute_script(_TRANSCRIPT_LENGTH_SCRIPT, selectors)
+            now = time.monotonic()
+            if length < 0 and now - started >= TRANSCRIPT_CONTAINER_GRACE:
+                state["missing"] = True
+                return True
+            if length < min_length or length != state["length"]:
+                state["length"] = length
+                state["since"] = now
+                return False
+            return now - state["since"] >= stable_window
+
+        settled = self.until("transcript_stable", check, timeout)
+        if state["missing"]:
+            self.timings[-1]["ok"] = False
+            return False
+        return settled
+
+    def summary(self) -> str:
+        """Return a one-line summary of recorded wait timings."""
+        parts = []
+        for timing in self.timings:
+            mark = "" if timing["ok"] else " (timeout)"
+            parts.append(f"{timing['name']}={timing['seconds']:.2f}s{mark}")
+        total = sum(t["seconds"] for t in self.timings)
+        return f"Wait timings: {', '.join(parts)} | total={total:.2f}s"
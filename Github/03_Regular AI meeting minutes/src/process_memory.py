@@ -0,0 +1,152 @@
+"""
+Process Memory Accounting
+
+Measures the resident memory (RSS) of a process and all of its descendants,
+e.g. Chrome's browser, GPU, network and renderer processes. Uses `ps`, so it
+works on macOS and Linux without extra dependencies.
+
+RssSampler samples the tree in the background during a run and keeps the
+peak; record_run() appends each run's peak to a small history file so
+runners can be sized from real runs.
+"""
+
+import resource
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from file_lock import update_json
+
+# Peak memory of recent runs
+MEMORY_STATS_FILE = Path(__file__).parent.parent / ".tldv_memory_stats.json"
+
+# Runs kept in MEMORY_STATS_FILE
+MEMORY_HISTORY = 50
+
+# Seconds between samples
+SAMPLE_INTERVAL = 0.5
+
+
+def _process_table() -> List[Tuple[int, int, int]]:
+    """Return (pid, ppid, rss in KB) for every process."""
+    output = subprocess.run(
+        ["ps", "-A", "-o", "pid=,ppid=,rss="], capture_output=True, text=True, check=True
+    ).stdout
+    rows = []
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and all(p.isdigit() for p in parts):
+            rows.append((int(parts[0]), int(parts[1]), int(parts[2])))
+    return rows
+
+
+def process_tree_rss(pid: int) -> Optional[Dict[str, int]]:
+    """
+    Measure the RSS of a process and its descendants.
+
+    Args:
+        pid: Root process ID (e.g. the Chrome browser process)
+
+    Returns:
+        Dict with rss (bytes, whole tree) and processes (count), or None if
+        the process is gone or ps is unavailable
+    """
+    try:
+        table = _process_table()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    children: Dict[int, List[int]] = {}
+    rss = {}
+    for child, parent, kb in table:
+        children.setdefault(parent, []).append(child)
+        rss[child] = kb
+    if pid not in rss:
+        return None
+
+    total, count, stack = 0, 0, [pid]
+    while stack:
+        current = stack.pop()
+        total += rss.get(current, 0)
+        count += 1
+        stack.extend(children.get(current, []))
+    return {"rss": total * 1024, "processes": count}
+
+
+def python_peak_rss() -> int:
+    """Return the peak RSS of this Python process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    """Samples the RSS of a process tree in a background thread and keeps the peak."""
+
+    def __init__(self, pid: int, interval: float = SAMPLE_INTERVAL):
+        """
+        Initialize the sampler.
+
+        Args:
+            pid: Root process ID (e.g. the Chrome browser process)
+            interval: Seconds between samples
+        """
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self.peak_processes = 0
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        """Take one sample now."""
+        tree = process_tree_rss(self.pid)
+        if not tree:
+            return
+        self.samples += 1
+        if tree["rss"] > self.peak:
+            self.peak = tree["rss"]
+            self.peak_processes = tree["processes"]
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self) -> "RssSampler":
+        """Start sampling in a daemon thread."""
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Take a last sample and stop the thread."""
+        self.sample()
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval * 2)
+            self._thread = None
+
+    def summary(self) -> str:
+        """Return a one-line summary of the peak memory of the browser and Python."""
+        return (f"Peak RSS: browser {self.peak / 2**20:.0f} MB "
+                f"({self.peak_processes} processes, {self.samples} samples), "
+                f"Python {python_peak_rss() / 2**20:.0f} MB")
+
+
+def record_run(sampler: RssSampler, path: Path = MEMORY_STATS_FILE, **labels) -> None:
+    """
+    Append a run's peak memory to the history file.
+
+    Args:
+        sampler: Stopped sampler of the run
+        path: History file
+        labels: Run settings to record with it (e.g. headless mode, low_memory)
+    """
+    run = {"at": time.time(), "browser_peak": sampler.peak,
+           "processes": sampler.peak_processes, "python_peak": python_peak_rss(), **labels}
+    update_json(path, lambda history: (history + [run])[-MEMORY_HISTORY:], default=[])
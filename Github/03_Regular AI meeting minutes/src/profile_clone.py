@@ -0,0 +1,123 @@
+"""
+Per-run Chrome Profile Clones
+
+Chrome refuses to open a profile directory another Chrome is using, so two
+overlapping runs cannot both use .chrome_profile. Each scraping run instead
+gets its own copy of the authenticated profile in a temp directory, removed
+when the run ends.
+
+Files are cloned copy-on-write where the filesystem supports it
+(clonefile on APFS, FICLONE on Btrfs/XFS), so a clone costs almost no time
+or disk; elsewhere they are copied. Caches and Chrome's own lock files are
+never cloned. Cloning takes a shared lock on the profile; interactive
+logins, which write the profile itself, hold the exclusive lock.
+"""
+
+import ctypes
+import fcntl
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from file_lock import file_lock
+from low_memory import PROFILE_CACHE_DIRS
+
+# Temp directory name prefix of clones
+CLONE_PREFIX = "tldv_profile_"
+
+# Remove clones left behind by crashed runs after this many seconds
+STALE_CLONE_AGE = 24 * 60 * 60
+
+# Chrome's profile-in-use markers and crash state
+_SKIP_FILES = {"SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile",
+               "RunningChromeVersion", "Crashpad", "BrowserMetrics"}
+
+# Linux FICLONE ioctl (share the source file's extents)
+_FICLONE = 0x40049409
+
+_libc = None
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """Copy one file, sharing its data blocks with the source where possible."""
+    global _libc
+    try:
+        if sys.platform == "darwin":
+            _libc = _libc or ctypes.CDLL(None, use_errno=True)
+            if _libc.clonefile(src.encode(), dst.encode(), 0) == 0:
+                shutil.copystat(src, dst)
+                return dst
+        elif sys.platform.startswith("linux"):
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+            shutil.copystat(src, dst)
+            return dst
+    except (OSError, AttributeError):
+        pass
+    return shutil.copy2(src, dst)
+
+
+def _ignore_for(source: Path):
+    """Return a copytree ignore function that skips lock files and profile caches."""
+    def ignore(directory: str, names) -> set:
+        parts = Path(directory).relative_to(source).parts
+        skipped = set()
+        for name in names:
+            # Caches live inside a profile, e.g. Default/Service Worker/CacheStorage
+            in_profile = "/".join(parts[1:] + (name,))
+            if name in _SKIP_FILES or (parts and in_profile in PROFILE_CACHE_DIRS):
+                skipped.add(name)
+        return skipped
+    return ignore
+
+
+def remove_stale_clones(max_age: float = STALE_CLONE_AGE) -> None:
+    """Remove clones of runs that ended without cleaning up."""
+    cutoff = time.time() - max_age
+    for path in Path(tempfile.gettempdir()).glob(f"{CLONE_PREFIX}*"):
+        # A long-running service may still have Chrome open on an old clone
+        if os.path.lexists(path / "profile" / "SingletonLock"):
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+def clone_profile(source: Path) -> Optional[Path]:
+    """
+    Clone an authenticated Chrome profile for one run.
+
+    Args:
+        source: Chrome user data directory (e.g. .chrome_profile)
+
+    Returns:
+        Path of the clone (pass it to --user-data-dir and to remove_clone()),
+        or None if the profile could not be cloned
+    """
+    remove_stale_clones()
+    root = Path(tempfile.mkdtemp(prefix=CLONE_PREFIX))
+    clone = root / "profile"
+    started = time.monotonic()
+    try:
+        with file_lock(source, shared=True,
+                       wait_message="Waiting for the login to finish writing the browser profile..."):
+            shutil.copytree(source, clone, symlinks=True, ignore=_ignore_for(source),
+                            copy_function=_clone_file)
+    except (OSError, shutil.Error) as e:
+        print(f"Warning: Could not clone browser profile: {e}")
+        shutil.rmtree(root, ignore_errors=True)
+        return None
+    print(f"Cloned browser profile in {time.monotonic() - started:.2f}s")
+    return clone
+
+
+def remove_clone(clone: Path) -> None:
+    """Delete a clone made by clone_profile()."""
+    if clone.parent.name.startswith(CLONE_PREFIX):
+        shutil.rmtree(clone.parent, ignore_errors=True)
@@ -0,0 +1,184 @@
+"""
+Network Resource Blocking for Scraping Runs
+
+Blocks request classes the scraper never uses (images, video, fonts,
+analytics and chat widgets) with the DevTools Network.setBlockedURLs
+command. Which classes are blocked is configured per page type, so the
+meeting list and meeting detail pages can use different profiles.
+
+Blocked and loaded requests are counted from Chrome's network events.
+Blocked requests are never downloaded, so their size is estimated from the
+average size of the same class seen in runs without blocking.
+"""
+
+import json
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from file_lock import atomic_write
+
+# Learned average sizes of blockable request classes
+BLOCKING_STATS_FILE = Path(__file__).parent.parent / ".tldv_blocking_stats.json"
+
+# URL patterns of each request class (Network.setBlockedURLs wildcards)
+RESOURCE_CLASSES: Dict[str, List[str]] = {
+    "images": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+               "*.avif*", "*gravatar.com*", "*googleusercontent.com*"],
+    "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.m4s*", "*.mp3*", "*.m4a*",
+              "*mux.com*", "*cloudfront.net*/video*"],
+    "fonts": ["*.woff*", "*.ttf*", "*.otf*", "*.eot*", "*fonts.googleapis.com*",
+              "*fonts.gstatic.com*", "*use.typekit.net*"],
+    "analytics": ["*google-analytics.com*", "*googletagmanager.com*", "*segment.io*",
+                  "*segment.com*", "*mixpanel.com*", "*amplitude.com*", "*hotjar.com*",
+                  "*fullstory.com*", "*clarity.ms*", "*sentry.io*", "*doubleclick.net*",
+                  "*facebook.net*", "*posthog.com*", "*datadoghq.com*", "*hs-scripts.com*",
+                  "*hs-analytics.net*", "*logrocket.*"],
+    "widgets": ["*intercom.io*", "*intercomcdn.com*", "*crisp.chat*", "*zdassets.com*",
+                "*drift.com*", "*hubspot.com*", "*usepylon.com*", "*beamer*",
+                "*canny.io*", "*youtube.com/embed*"],
+}
+
+# Request classes blocked on each page type. The transcript panel relies on
+# stylesheets and scripts for layout and scrolling, so those always load.
+BLOCK_PROFILES: Dict[str, List[str]] = {
+    "meeting_list": ["images", "media", "fonts", "analytics", "widgets"],
+    "meeting_detail": ["images", "media", "fonts", "analytics", "widgets"],
+}
+
+
+def resource_class(url: str) -> Optional[str]:
+    """Return the request class a URL belongs to, or None."""
+    lowered = url.lower()
+    for name, patterns in RESOURCE_CLASSES.items():
+        if any(fnmatchcase(lowered, pattern) for pattern in patterns):
+            return name
+    return None
+
+
+class ResourceBlocker:
+    """Applies per-page-type blocking profiles and counts what they avoid."""
+
+    def __init__(self, driver, profiles: Optional[Dict[str, List[str]]] = BLOCK_PROFILES,
+                 stats_file: Path = BLOCKING_STATS_FILE):
+        """
+        Initialize the blocker.
+
+        Args:
+            driver: Chrome WebDriver
+            profiles: Request classes to block per page type (None: block nothing,
+                only measure)
+            stats_file: File for learned request class sizes
+        """
+        self.driver = driver
+        self.profiles = profiles or {}
+        self.stats_file = stats_file
+        self.page_type: Optional[str] = None
+        self.blocked: Dict[str, int] = {}
+        self.loaded_requests = 0
+        self.loaded_bytes = 0
+        self._pending: Dict[str, Optional[str]] = {}
+        self._sizes = self._load_sizes()
+        self._sizes_changed = False
+
+    def _load_sizes(self) -> Dict[str, Dict[str, float]]:
+        """Load learned request class sizes."""
+        if self.stats_file.exists():
+            try:
+                return json.loads(self.stats_file.read_text())
+            except ValueError:
+                pass
+        return {}
+
+    def apply(self, page_type: str) -> None:
+        """
+        Block the request classes configured for a page type in the current tab.
+
+        Call before navigating; the block list stays active for the tab until
+        another profile is applied.
+
+        Args:
+            page_type: "meeting_list" or "meeting_detail"
+        """
+        self.page_type = page_type
+        patterns = [
+            pattern
+            for name in self.profiles.get(page_type, [])
+            for pattern in RESOURCE_CLASSES.get(name, [])
+        ]
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except WebDriverException as e:
+            print(f"Warning: Could not apply resource blocking: {e}")
+
+    def observe(self, entries: List[Dict]) -> None:
+        """Count blocked and loaded requests from performance log entries."""
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get("method")
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+
+            if method == "Network.requestWillBeSent":
+                url = params.get("request", {}).get("url", "")
+                if not url.startswith("data:"):
+                    self._pending[request_id] = resource_class(url)
+
+            elif method == "Network.loadingFinished" and request_id in self._pending:
+                size = params.get("encodedDataLength", 0)
+                self.loaded_requests += 1
+                self.loaded_bytes += size
+                name = self._pending.pop(request_id)
+                if name:
+                    learned = self._sizes.setdefault(name, {"requests": 0, "bytes": 0})
+                    learned["requests"] += 1
+                    learned["bytes"] += size
+                    self._sizes_changed = True
+
+            elif method == "Network.loadingFailed" and request_id in self._pending:
+                name = self._pending.pop(request_id)
+                if params.get("blockedReason"):
+                    key = name or "other"
+                    self.blocked[key] = self.blocked.get(key, 0) + 1
+
+    def estimated_bytes_avoided(self) -> Optional[int]:
+        """Estimate bytes not downloaded, from learned class sizes (None if unknown)."""
+        total, known = 0, False
+        for name, count in self.blocked.items():
+            learned = self._sizes.get(name)
+            if learned and learned["requests"]:
+                total += count * learned["bytes"] / learned["requests"]
+                known = True
+        return int(total) if known else None
+
+    def save(self) -> None:
+        """Persist learned class sizes."""
+        if not self._sizes_changed:
+            return
+        atomic_write(self.stats_file, json.dumps(self._sizes, indent=2))
+        self._sizes_changed = False
+
+    def summary(self) -> str:
+        """Return a short report of requests blocked and bytes avoided."""
+        blocked = sum(self.blocked.values())
+        lines = [
+            f"Resource blocking: {blocked} requests blocked, "
+            f"{self.loaded_requests} loaded ({self.loaded_bytes / 1024:.0f} KB)"
+        ]
+        if self.blocked:
+            detail = ", ".join(f"{name} {count}" for name, count in sorted(self.blocked.items()))
+            lines.append(f"  blocked: {detail}")
+        avoided = self.estimated_bytes_avoided()
+        if avoided is not None:
+            lines.append(f"  estimated bytes avoided: {avoided / 1024:.0f} KB")
+        elif blocked:
+            lines.append("  estimated bytes avoided: unknown "
+                         "(run once with --no-block to learn request sizes)")
+        return "\n".join(lines)
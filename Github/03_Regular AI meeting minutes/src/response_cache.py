@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Minutes Response Cache
+
+Content-addressed cache of generated minutes. The key is a SHA-256 hash of
+everything that determines a generation (model, system prompt, user
+message, generation parameters), so re-running on the same transcript,
+e.g. to retry a failed OneNote write, returns the same minutes instantly
+without an API call.
+
+Entries older than MAX_RESPONSE_AGE are dropped, and the cache is bounded
+in size, evicting the least recently used entries first. Hits and misses
+are counted in the index. Index changes are merged into the file under its
+lock, so overlapping runs do not lose each other's entries.
+
+Usage:
+    python src/response_cache.py            # Show cache statistics
+    python src/response_cache.py --clear    # Remove every cached response
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from file_lock import atomic_write, file_lock
+
+# Cache location
+RESPONSE_CACHE_DIR = Path(__file__).parent.parent / ".response_cache"
+
+# Maximum total size of cached responses (bytes)
+MAX_RESPONSE_CACHE_BYTES = 20 * 1024 * 1024
+
+# Drop responses older than this (seconds)
+MAX_RESPONSE_AGE = 30 * 24 * 60 * 60
+
+
+def response_key(model: str, system: str, message: str, **params: Any) -> str:
+    """
+    Hash the inputs of a generation.
+
+    Args:
+        model: Model name
+        system: System prompt
+        message: User message
+        params: Generation parameters (token limits, map-reduce settings, ...)
+
+    Returns:
+        Hex SHA-256 digest used as the cache key
+    """
+    payload = json.dumps({"model": model, "system": system, "message": message,
+                          "params": params}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Stores generated minutes on disk, keyed by a hash of their inputs."""
+
+    def __init__(self, cache_dir: Path = RESPONSE_CACHE_DIR,
+                 max_bytes: int = MAX_RESPONSE_CACHE_BYTES, max_age: float = MAX_RESPONSE_AGE):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the index and response blobs
+            max_bytes: Maximum total size of stored responses
+            max_age: Maximum age of a response in seconds
+        """
+        self.cache_dir = cache_dir
+        self.blob_dir = cache_dir / "blobs"
+        self.index_file = cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._index: Optional[Dict] = None
+
+    def _load_index(self) -> Dict:
+        """Load the index ({"entries": {key: entry}, "hits": n, "misses": n})."""
+        if self._index is None:
+            self._index = {"entries": {}, "hits": 0, "misses": 0}
+            if self.index_file.exists():
+                try:
+                    self._index.update(json.loads(self.index_file.read_text()))
+                except ValueError:
+                    print("Warning: Response cache index is corrupt. Starting fresh.")
+        return self._index
+
+    def _update_index(self, change: Callable[[Dict], None]) -> None:
+        """Apply a change to the latest on-disk index and write it back under its lock."""
+        with file_lock(self.index_file):
+            self._index = None
+            change(self._load_index())
+            atomic_write(self.index_file, json.dumps(self._index, indent=2))
+
+    def _blob_path(self, key: str) -> Path:
+        """Return the file path of a cached response."""
+        return self.blob_dir / f"{key}.md"
+
+    def _miss(self, key: Optional[str] = None) -> None:
+        """Count a miss, dropping the entry of an unusable response."""
+        def change(index: Dict) -> None:
+            index["misses"] += 1
+            if key:
+                index["entries"].pop(key, None)
+
+        self._update_index(change)
+        if key:
+            self._blob_path(key).unlink(missing_ok=True)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return a cached response and count the hit or miss.
+
+        Args:
+            key: Key from response_key()
+
+        Returns:
+            Response text, or None if missing, expired or corrupt
+        """
+        entry = self._load_index()["entries"].get(key)
+        if not entry:
+            self._miss()
+            return None
+
+        if time.time() - entry["created_at"] > self.max_age:
+            self._miss(key)
+            return None
+
+        try:
+            text = self._blob_path(key).read_text(encoding="utf-8")
+        except OSError:
+            self._miss(key)
+            return None
+
+        if hashlib.sha256(text.encode("utf-8")).hexdigest() != entry["hash"]:
+            print("Warning: Cached response is corrupt. Discarding.")
+            self._miss(key)
+            return None
+
+        now = time.time()
+
+        def hit(index: Dict) -> None:
+            index["hits"] += 1
+            if key in index["entries"]:
+                index["entries"][key]["last_used"] = now
+
+        self._update_index(hit)
+        return text
+
+    def put(self, key: str, text: str, **meta: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from response_key()
+            text: Response text
+            meta: Extra fields recorded with the entry (e.g. model)
+        """
+        data = text.encode("utf-8")
+        atomic_write(self._blob_path(key), data)
+        now = time.time()
+
+        def add(index: Dict) -> None:
+            index["entries"][key] = {
+                "hash": hashlib.sha256(data).hexdigest(),
+                "created_at": now,
+                "last_used": now,
+                "size": len(data),
+                **meta,
+            }
+            self._evict()
+
+        self._update_index(add)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones until the cache fits max_bytes."""
+        entries = self._load_index()["entries"]
+        cutoff = time.time() - self.max_age
+        total = sum(entry["size"] for entry in entries.values())
+
+        for key, entry in sorted(entries.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes and entry["created_at"] >= cutoff:
+                continue
+            del entries[key]
+            self._blob_path(key).unlink(missing_ok=True)
+            total -= entry["size"]
+
+    def clear(self) -> None:
+        """Remove every cached response and reset the statistics."""
+        with file_lock(self.index_file):
+            shutil.rmtree(self.blob_dir, ignore_errors=True)
+            self.index_file.unlink(missing_ok=True)
+            self._index = None
+
+    def summary(self) -> str:
+        """Describe the cache's hit rate and size."""
+        index = self._load_index()
+        lookups = index["hits"] + index["misses"]
+        rate = f"{index['hits'] / lookups:.0%}" if lookups else "n/a"
+        size = sum(entry["size"] for entry in index["entries"].values())
+        return (f"{index['hits']} hits, {index['misses']} misses (hit rate {rate}), "
+                f"{len(index['entries'])} responses, {size / 1024:.0f} KB")
+
+
+def main():
+    """Show or clear the response cache."""
+    parser = argparse.ArgumentParser(description="Minutes response cache")
+    parser.add_argument("--clear", action="store_true", help="Remove every cached response")
+    args = parser.parse_args()
+
+    cache = ResponseCache()
+    if args.clear:
+        cache.clear()
+        print("Response cache cleared")
+        return 0
+    print(f"Response cache: {cache.summary()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
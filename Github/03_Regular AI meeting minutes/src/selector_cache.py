@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Adaptive Selector Cache
+
+Remembers which XPath or CSS selector found the transcript tab and container
+on earlier runs and tries it first next time. Selectors that match are
+promoted; selectors that keep missing are demoted to the end of the list.
+Hit and miss counts are persisted, so a tldv UI change shows up as a rising
+miss count instead of only as slower runs. Each run's counts are merged into
+the file under its lock, so overlapping runs do not lose each other's.
+
+Usage:
+    python src/selector_cache.py          # Show hit/miss counts per selector
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from file_lock import read_json, update_json
+
+# Selector statistics
+SELECTOR_CACHE_FILE = Path(__file__).parent.parent / ".tldv_selectors.json"
+
+# Demote a selector after this many consecutive misses
+DEMOTE_AFTER = 3
+
+
+class SelectorCache:
+    """Orders selector candidates by past success and records hits and misses."""
+
+    def __init__(self, path: Path = SELECTOR_CACHE_FILE):
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file for selector statistics
+        """
+        self.path = path
+        self._stats: Dict[str, Dict[str, Dict]] = read_json(path, {})
+        # This run's outcomes, merged into the file by save()
+        self._pending: Dict[str, Dict[str, Dict]] = {}
+        self.lookups = 0
+
+    @staticmethod
+    def _new_entry(stats: Dict[str, Dict[str, Dict]], group: str, selector: str) -> Dict:
+        """Return the statistics entry for a selector, creating it if needed."""
+        return stats.setdefault(group, {}).setdefault(
+            selector, {"hits": 0, "misses": 0, "streak": 0, "last_hit": 0}
+        )
+
+    def _entry(self, group: str, selector: str) -> Dict:
+        """Return the in-memory statistics entry for a selector."""
+        return self._new_entry(self._stats, group, selector)
+
+    def _pending_entry(self, group: str, selector: str) -> Dict:
+        """Return this run's outcome entry for a selector."""
+        return self._pending.setdefault(group, {}).setdefault(
+            selector, {"hits": 0, "misses": 0, "streak": 0, "reset": False, "last_hit": 0}
+        )
+
+    def order(self, group: str, candidates: List[str]) -> List[str]:
+        """
+        Return candidates in the order they should be tried.
+
+        The most recent winner comes first, then other selectors by hit count,
+        then untried ones in their given order; selectors that missed
+        DEMOTE_AFTER times in a row go last.
+
+        Args:
+            group: Lookup name, e.g. "transcript_tab"
+            candidates: Selectors in their default order
+        """
+        stats = self._stats.get(group, {})
+
+        def rank(selector: str):
+            entry = stats.get(selector)
+            if not entry:
+                return (0, 0, 0)
+            return (entry["streak"] >= DEMOTE_AFTER, -entry["last_hit"], -entry["hits"])
+
+        return sorted(candidates, key=rank)
+
+    def record(self, group: str, tried: List[str], hit: Optional[int]) -> None:
+        """
+        Record the outcome of one lookup.
+
+        Args:
+            group: Lookup name
+            tried: Selectors in the order they were tried
+            hit: Index of the selector that matched, or None if none matched
+        """
+        misses = tried if hit is None else tried[:hit]
+        for selector in misses:
+            for entry in (self._entry(group, selector), self._pending_entry(group, selector)):
+                entry["misses"] += 1
+                entry["streak"] += 1
+        if hit is not None:
+            now = time.time()
+            for entry in (self._entry(group, tried[hit]),
+                          self._pending_entry(group, tried[hit])):
+                entry["hits"] += 1
+                entry["streak"] = 0
+                entry["last_hit"] = now
+            self._pending[group][tried[hit]]["reset"] = True
+        self.lookups += 1
+
+    def save(self) -> None:
+        """Merge this run's outcomes into the statistics file if there are any."""
+        if not self._pending:
+            return
+
+        def merge(stats: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict[str, Dict]]:
+            for group, selectors in self._pending.items():
+                for selector, run in selectors.items():
+                    entry = self._new_entry(stats, group, selector)
+                    entry["hits"] += run["hits"]
+                    entry["misses"] += run["misses"]
+                    # A hit in this run ends the miss streak; later misses start a new one
+                    entry["streak"] = run["streak"] + (0 if run["reset"] else entry["streak"])
+                    entry["last_hit"] = max(entry["last_hit"], run["last_hit"])
+            return stats
+
+        self._stats = update_json(self.path, merge, default={}, ensure_ascii=False)
+        self._pending = {}
+
+    def summary(self) -> str:
+        """Return hit/miss counts per lookup and selector."""
+        lines = []
+        for group, selectors in self._stats.items():
+            hits = sum(entry["hits"] for entry in selectors.values())
+            misses = sum(entry["misses"] for entry in selectors.values())
+            lines.append(f"{group}: {hits} hits, {misses} misses")
+            for selector, entry in sorted(selectors.items(),
+                                          key=lambda item: -item[1]["hits"]):
+                flag = "  (demoted)" if entry["streak"] >= DEMOTE_AFTER else ""
+                lines.append(f"  {entry['hits']:>5} hit {entry['misses']:>5} miss  "
+                             f"{selector}{flag}")
+        return "\n".join(lines) if lines else "No selector statistics yet"
+
+
+def main():
+    """Print selector hit/miss statistics."""
+    print(SelectorCache().summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
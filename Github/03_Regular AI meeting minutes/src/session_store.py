@@ -0,0 +1,373 @@
+"""
+Versioned tldv Session Snapshots
+
+Saves the browser session (cookies, localStorage and sessionStorage) as one
+atomically written, versioned JSON snapshot. Validity is taken from the real
+expiry of the auth token or session cookies instead of the file age, and a
+snapshot is restored into Chrome with one CDP call for the cookies and one
+bulk script for the storage, so a valid session needs no login page load.
+
+Snapshot load times and restore outcomes are recorded so the cost and
+reliability of session reuse can be checked over time. All files are read
+and written under advisory locks (see file_lock.py), so overlapping runs can
+share them.
+"""
+
+import base64
+import json
+import pickle
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from file_lock import atomic_write, file_lock, read_json, update_json
+
+# Session snapshot and statistics
+SESSION_FILE = Path(__file__).parent.parent / ".tldv_session.json"
+SESSION_STATS_FILE = Path(__file__).parent.parent / ".tldv_session_stats.json"
+
+# Files written by earlier versions (migrated once on first load)
+LEGACY_COOKIES_FILE = Path(__file__).parent.parent / ".tldv_cookies.pkl"
+LEGACY_STORAGE_FILE = Path(__file__).parent.parent / ".tldv_storage.json"
+
+# Snapshot format version
+SNAPSHOT_VERSION = 1
+
+# Treat sessions expiring within this many seconds as already expired
+EXPIRY_MARGIN = 5 * 60
+
+# Origin whose storage is saved and restored
+TLDV_ORIGIN = "https://tldv.io"
+
+# Cookie names that carry the login session
+_AUTH_COOKIE = re.compile(r"sess|auth|token|sid|jwt", re.IGNORECASE)
+
+# Restores saved storage on the first tldv document, before the app starts.
+# Existing keys are kept so tokens refreshed by the app are never overwritten.
+_RESTORE_STORAGE_SCRIPT = """
+(function (snapshot) {
+    if (location.origin !== snapshot.origin) { return; }
+    [['localStorage', localStorage], ['sessionStorage', sessionStorage]].forEach(function (pair) {
+        var saved = snapshot[pair[0]] || {};
+        Object.keys(saved).forEach(function (key) {
+            if (pair[1].getItem(key) === null) { pair[1].setItem(key, saved[key]); }
+        });
+    });
+})(%s);
+"""
+
+
+def find_token(storage: Dict[str, Any]) -> Optional[str]:
+    """Find a bearer token (JWT) among saved localStorage values."""
+    for value in storage.values():
+        if not isinstance(value, str):
+            continue
+        if value.startswith("eyJ") and value.count(".") == 2:
+            return value
+        try:
+            data = json.loads(value)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            for key in ("access_token", "accessToken", "token", "idToken"):
+                token = data.get(key)
+                if isinstance(token, str) and token.startswith("eyJ"):
+                    return token
+    return None
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """Return the exp claim of a JWT (epoch seconds), or None if unreadable."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def session_expiry(cookies: List[Dict], local_storage: Dict[str, Any]) -> Optional[float]:
+    """
+    Work out when a saved session stops being usable.
+
+    The bearer token's exp claim wins if there is one; otherwise the earliest
+    expiry among the session cookies is used.
+
+    Returns:
+        Expiry time (epoch seconds), or None if no expiry is known
+    """
+    token = find_token(local_storage)
+    if token:
+        expiry = token_expiry(token)
+        if expiry:
+            return expiry
+
+    expiries = [
+        float(cookie["expiry"]) for cookie in cookies
+        if cookie.get("expiry") and _AUTH_COOKIE.search(cookie.get("name", ""))
+    ]
+    return min(expiries) if expiries else None
+
+
+def restore_storage_script(snapshot: Dict) -> str:
+    """Return the script that restores a snapshot's storage on the next tldv page load."""
+    return _RESTORE_STORAGE_SCRIPT % json.dumps({
+        "origin": snapshot.get("origin", TLDV_ORIGIN),
+        "localStorage": snapshot.get("localStorage", {}),
+        "sessionStorage": snapshot.get("sessionStorage", {}),
+    })
+
+
+def playwright_storage_state(snapshot: Dict) -> Dict:
+    """
+    Convert a snapshot to a Playwright storage state.
+
+    sessionStorage is not part of Playwright's storage state; restore it with
+    restore_storage_script() as an init script.
+    """
+    cookies = []
+    for cookie in snapshot.get("cookies", []):
+        same_site = cookie.get("sameSite")
+        cookies.append({
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain") or "tldv.io",
+            "path": cookie.get("path", "/"),
+            "expires": cookie.get("expiry", -1),
+            "httpOnly": cookie.get("httpOnly", False),
+            "secure": cookie.get("secure", False),
+            "sameSite": same_site if same_site in ("Strict", "Lax", "None") else "Lax",
+        })
+    local_storage = [
+        {"name": name, "value": value if isinstance(value, str) else json.dumps(value)}
+        for name, value in snapshot.get("localStorage", {}).items()
+    ]
+    return {
+        "cookies": cookies,
+        "origins": [{"origin": snapshot.get("origin", TLDV_ORIGIN),
+                     "localStorage": local_storage}],
+    }
+
+
+def _cdp_cookie(cookie: Dict) -> Dict:
+    """Convert a WebDriver cookie to a CDP Network.CookieParam."""
+    param = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain") or "tldv.io",
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if cookie.get("expiry"):
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        param["sameSite"] = cookie["sameSite"]
+    return param
+
+
+def _cookie_key(cookie: Dict) -> tuple:
+    """Identify a cookie by name, domain and path."""
+    return (cookie["name"], (cookie.get("domain") or "tldv.io").lstrip("."),
+            cookie.get("path", "/"))
+
+
+def newer_cookies(saved: List[Dict], current: List[Dict]) -> List[Dict]:
+    """
+    Select the saved cookies that should replace the browser's own.
+
+    A saved cookie is kept only if the browser has no cookie of that name or
+    its cookie expires earlier, so a session the profile refreshed since the
+    snapshot was taken is never overwritten with an older one.
+
+    Args:
+        saved: Snapshot cookies (WebDriver format, "expiry")
+        current: Browser cookies (CDP format, "expires"; -1 for session cookies)
+
+    Returns:
+        Saved cookies to set
+    """
+    expires = {_cookie_key(cookie): cookie.get("expires") or 0 for cookie in current}
+    return [
+        cookie for cookie in saved
+        if _cookie_key(cookie) not in expires
+        or (cookie.get("expiry") or 0) > expires[_cookie_key(cookie)]
+    ]
+
+
+class SessionStore:
+    """Saves, validates and restores tldv session snapshots."""
+
+    def __init__(self, path: Path = SESSION_FILE, stats_path: Path = SESSION_STATS_FILE):
+        """
+        Initialize the store.
+
+        Args:
+            path: Snapshot file
+            stats_path: File for load time and restore statistics
+        """
+        self.path = path
+        self.stats_path = stats_path
+        self.last_load_ms: Optional[float] = None
+
+    def _write_json(self, path: Path, data: Dict) -> None:
+        """Write JSON atomically under the file's lock so readers never see a partial file."""
+        with file_lock(path):
+            atomic_write(path, json.dumps(data, indent=2))
+
+    def save(self, driver) -> Dict:
+        """
+        Save the session of a logged-in browser.
+
+        Args:
+            driver: Selenium WebDriver on a tldv page
+
+        Returns:
+            The saved snapshot
+        """
+        storage = driver.execute_script(
+            "return {localStorage: Object.assign({}, localStorage),"
+            " sessionStorage: Object.assign({}, sessionStorage)};"
+        )
+        return self.save_snapshot(driver.get_cookies(), storage["localStorage"],
+                                  storage["sessionStorage"])
+
+    def save_snapshot(self, cookies: List[Dict], local_storage: Dict[str, Any],
+                      session_storage: Dict[str, Any]) -> Dict:
+        """Write a snapshot from its parts."""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": time.time(),
+            "expires_at": session_expiry(cookies, local_storage),
+            "origin": TLDV_ORIGIN,
+            "cookies": cookies,
+            "localStorage": local_storage,
+            "sessionStorage": session_storage,
+        }
+        self._write_json(self.path, snapshot)
+        return snapshot
+
+    def load(self) -> Optional[Dict]:
+        """
+        Load the saved snapshot, migrating the legacy cookie files if needed.
+
+        Returns:
+            Snapshot dict, or None if there is no usable snapshot
+        """
+        started = time.perf_counter()
+        snapshot = None
+
+        if self.path.exists():
+            try:
+                with file_lock(self.path, shared=True):
+                    text = self.path.read_text()
+                snapshot = json.loads(text)
+            except ValueError:
+                print("Warning: Session snapshot is corrupt. Please run --login again.")
+            if snapshot and snapshot.get("version") != SNAPSHOT_VERSION:
+                print(f"Warning: Unsupported session snapshot version "
+                      f"{snapshot.get('version')}. Please run --login again.")
+                snapshot = None
+        elif LEGACY_COOKIES_FILE.exists():
+            snapshot = self._migrate_legacy()
+
+        self.last_load_ms = (time.perf_counter() - started) * 1000
+        if snapshot:
+            self._record(loads=1, load_ms=self.last_load_ms)
+        return snapshot
+
+    def _migrate_legacy(self) -> Optional[Dict]:
+        """Convert the pickled cookies and storage JSON into a snapshot."""
+        try:
+            with open(LEGACY_COOKIES_FILE, "rb") as f:
+                cookies = pickle.load(f)
+            storage = {}
+            if LEGACY_STORAGE_FILE.exists():
+                storage = json.loads(LEGACY_STORAGE_FILE.read_text())
+        except Exception as e:
+            print(f"Error migrating legacy session files: {e}")
+            return None
+
+        print(f"Migrated legacy session files to {self.path.name}")
+        return self.save_snapshot(cookies, storage.get("localStorage", {}),
+                                  storage.get("sessionStorage", {}))
+
+    def expires_in(self, snapshot: Dict) -> Optional[float]:
+        """Return seconds until the session expires, or None if unknown."""
+        expires_at = snapshot.get("expires_at")
+        return expires_at - time.time() if expires_at else None
+
+    def is_valid(self, snapshot: Optional[Dict]) -> bool:
+        """Return True if the snapshot has a known expiry that has not passed."""
+        if not snapshot:
+            return False
+        remaining = self.expires_in(snapshot)
+        return remaining is not None and remaining > EXPIRY_MARGIN
+
+    def is_expired(self, snapshot: Optional[Dict]) -> bool:
+        """Return True if the snapshot is missing or known to have expired."""
+        if not snapshot:
+            return True
+        remaining = self.expires_in(snapshot)
+        return remaining is not None and remaining <= EXPIRY_MARGIN
+
+    def restore(self, driver, snapshot: Dict) -> bool:
+        """
+        Restore a snapshot into a fresh browser without loading any page.
+
+        Cookies are set with one CDP call, except those the profile already
+        holds with a later expiry; storage is restored by one script that runs
+        before tldv's own scripts on the next tldv page load.
+
+        Returns:
+            True if the browser accepted the snapshot
+        """
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            current = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+            cookies = newer_cookies(snapshot.get("cookies", []), current)
+            if cookies:
+                driver.execute_cdp_cmd("Network.setCookies", {
+                    "cookies": [_cdp_cookie(cookie) for cookie in cookies]
+                })
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": restore_storage_script(snapshot),
+            })
+        except Exception as e:
+            print(f"Error restoring session: {e}")
+            return False
+
+        self._record(restores=1)
+        return True
+
+    def record_restore_result(self, ok: bool) -> None:
+        """Record whether a restored session was accepted by tldv."""
+        self._record(restore_ok=1 if ok else 0, restore_failed=0 if ok else 1)
+
+    def _load_stats(self) -> Dict[str, float]:
+        """Load the statistics file."""
+        return read_json(self.stats_path, {})
+
+    def _record(self, **counts: float) -> None:
+        """Add to the persisted statistics (other runs may be adding at the same time)."""
+        def add(stats: Dict[str, float]) -> Dict[str, float]:
+            for key, value in counts.items():
+                stats[key] = stats.get(key, 0) + value
+            return stats
+        update_json(self.stats_path, add, default={})
+
+    def summary(self) -> str:
+        """Return a one-line summary of snapshot load time and restore success rate."""
+        stats = self._load_stats()
+        loads = stats.get("loads", 0)
+        checked = stats.get("restore_ok", 0) + stats.get("restore_failed", 0)
+        parts = []
+        if loads:
+            parts.append(f"avg load {stats.get('load_ms', 0) / loads:.1f} ms over {int(loads)} loads")
+        if checked:
+            parts.append(f"restore success {stats.get('restore_ok', 0) / checked:.0%} "
+                         f"({int(stats.get('restore_ok', 0))}/{int(checked)})")
+        return "Session snapshot: " + (", ".join(parts) if parts else "no statistics yet")
@@ -0,0 +1,244 @@
+"""
+Browserless tldv Client
+
+Fetches meeting lists and transcripts over plain HTTP using the session
+cookies and tokens saved by the browser login. The API endpoints are learned
+from the browser's own network traffic (see network_capture.py) and stored
+locally, so no Chrome is needed while the session stays valid. Credentials
+come from the session snapshot (see session_store.py).
+
+Returns None whenever the session is rejected or a response is not
+recognized; callers then fall back to the browser.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from file_lock import update_json
+from network_capture import (
+    MEETING_ID_PLACEHOLDER,
+    decode_meeting_list,
+    decode_transcript_payload,
+)
+from session_store import SessionStore, find_token
+from transcript import format_segments
+
+# Learned API endpoints
+ENDPOINTS_FILE = Path(__file__).parent.parent / ".tldv_endpoints.json"
+
+# Request timeout (seconds)
+REQUEST_TIMEOUT = 15
+
+
+def load_endpoints() -> Dict[str, str]:
+    """Load learned API endpoint templates."""
+    if ENDPOINTS_FILE.exists():
+        try:
+            return json.loads(ENDPOINTS_FILE.read_text())
+        except ValueError:
+            pass
+    return {}
+
+
+def record_endpoint(kind: str, url: str, meeting_id: Optional[str] = None) -> None:
+    """
+    Remember an API endpoint seen in the browser's network traffic.
+
+    Args:
+        kind: "transcript" or "meetings"
+        url: Request URL as seen by the browser
+        meeting_id: Meeting ID to replace with a placeholder (transcript only)
+    """
+    if meeting_id:
+        if meeting_id not in url:
+            return
+        url = url.replace(meeting_id, MEETING_ID_PLACEHOLDER)
+
+    if load_endpoints().get(kind) == url:
+        return
+    update_json(ENDPOINTS_FILE, lambda endpoints: {**endpoints, kind: url}, default={})
+
+
+class TldvHttpClient:
+    """Fetches tldv data with a pooled HTTP session instead of a browser."""
+
+    def __init__(self, snapshot: Optional[Dict], sessions: Optional[SessionStore] = None,
+                 timeout: float = REQUEST_TIMEOUT):
+        """
+        Initialize the client.
+
+        Args:
+            snapshot: Session snapshot saved by the browser login
+            sessions: Store used to check the snapshot's expiry
+            timeout: Request timeout in seconds
+        """
+        self.timeout = timeout
+        self.endpoints = load_endpoints()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Origin": "https://tldv.io",
+            "Referer": "https://tldv.io/app/meetings",
+        })
+        self.has_credentials = self._load_credentials(snapshot, sessions or SessionStore())
+        self._meetings: Optional[List[Dict]] = None
+
+    def _load_credentials(self, snapshot: Optional[Dict], sessions: SessionStore) -> bool:
+        """Load the snapshot's cookies and bearer token into the session."""
+        if sessions.is_expired(snapshot):
+            return False
+
+        for cookie in snapshot.get("cookies", []):
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+
+        token = find_token(snapshot.get("localStorage", {}))
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+
+        return True
+
+    def is_ready(self) -> bool:
+        """Return True if credentials and a transcript endpoint are available."""
+        return self.has_credentials and "transcript" in self.endpoints
+
+    def _get_json(self, url: str) -> Optional[Any]:
+        """GET a URL and return its JSON body, or None on rejection or bad format."""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"tldv HTTP request failed: {e}")
+            return None
+
+        if response.status_code in (401, 403):
+            print(f"tldv session rejected (HTTP {response.status_code})")
+            return None
+        if response.status_code != 200:
+            print(f"tldv HTTP error: {response.status_code}")
+            return None
+
+        try:
+            return response.json()
+        except ValueError:
+            print("tldv response is not JSON")
+            return None
+
+    def list_meetings(self) -> Optional[List[Dict]]:
+        """
+        List meetings, newest first.
+
+        Returns:
+            List of dicts with id, title, date and duration, or None
+        """
+        if self._meetings is not None:
+            return self._meetings
+
+        url = self.endpoints.get("meetings")
+        if not url:
+            return None
+
+        payload = self._get_json(url)
+        meetings = decode_meeting_list(payload) if payload is not None else None
+        if not meetings:
+            return None
+
+        meetings.sort(key=lambda m: m["date"] or "", reverse=True)
+        self._meetings = meetings
+        return meetings
+
+    def list_meetings_if_changed(self, validators: Dict[str, str]
+                                 ) -> Tuple[str, Optional[List[Dict]], Dict[str, str]]:
+        """
+        List meetings with a conditional request.
+
+        Args:
+            validators: "etag" and "last_modified" of the previous response
+
+        Returns:
+            (status, meetings, validators) where status is "changed" (meetings
+            are given, newest first), "unchanged" (HTTP 304) or "failed"
+        """
+        url = self.endpoints.get("meetings")
+        if not url:
+            return "failed", None, validators
+
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            print(f"tldv HTTP request failed: {e}")
+            return "failed", None, validators
+
+        if response.status_code == 304:
+            return "unchanged", None, validators
+        if response.status_code != 200:
+            label = "session rejected" if response.status_code in (401, 403) else "HTTP error"
+            print(f"tldv {label} (HTTP {response.status_code})")
+            return "failed", None, validators
+
+        try:
+            meetings = decode_meeting_list(response.json())
+        except ValueError:
+            meetings = None
+        if not meetings:
+            print("tldv meeting list not recognized")
+            return "failed", None, validators
+
+        meetings.sort(key=lambda m: m["date"] or "", reverse=True)
+        self._meetings = meetings
+        return "changed", meetings, {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+        }
+
+    def find_meeting(self, meeting_name: Optional[str] = None) -> Optional[Dict]:
+        """
+        Find the newest meeting whose title contains the name.
+
+        Args:
+            meeting_name: Name to search for (None for the latest meeting)
+
+        Returns:
+            Meeting dict, or None if not found
+        """
+        meetings = self.list_meetings()
+        if not meetings:
+            return None
+        for meeting in meetings:
+            if not meeting_name or meeting_name in meeting["title"]:
+                return meeting
+        return None
+
+    def fetch_transcript(self, meeting_id: str) -> Optional[str]:
+        """
+        Fetch a meeting transcript.
+
+        Args:
+            meeting_id: tldv meeting ID
+
+        Returns:
+            Transcript text, or None if unavailable or not recognized
+        """
+        template = self.endpoints.get("transcript")
+        if not template:
+            return None
+
+        payload = self._get_json(template.replace(MEETING_ID_PLACEHOLDER, meeting_id))
+        segments = decode_transcript_payload(payload) if payload is not None else None
+        if not segments:
+            return None
+        return format_segments(segments)
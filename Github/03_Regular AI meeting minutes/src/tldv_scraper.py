@@ -6,13 +6,12 @@ Supports Microsoft SSO login with session persistence.
 Uses undetected-chromedriver to avoid bot detection.
 """
 
-import json
-import os
-import pickle
 import time
+from collections import deque
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
@@ -20,19 +19,115 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-# Session files
+from network_capture import (
+    MEETING_LIST_URL_HINTS,
+    NETWORK_CAPTURE_GRACE,
+    NETWORK_CAPTURE_TIMEOUT,
+    NetworkTranscriptCapture,
+    decode_meeting_list,
+    enable_performance_logging,
+)
+from driver_cache import detect_chrome_version, ensure_driver
+from file_lock import file_lock
+from headless import apply_fingerprint, resolve_mode
+from low_memory import low_memory_arguments, trim_profile_cache
+from page_waits import MEETING_PAGE_TIMEOUT, MIN_TRANSCRIPT_LENGTH, POLL_INTERVAL, PageWaiter
+from process_memory import RssSampler, record_run
+from profile_clone import clone_profile, remove_clone
+from resource_blocking import BLOCK_PROFILES, ResourceBlocker
+from selector_cache import SelectorCache
+from session_store import SessionStore
+from tldv_http import TldvHttpClient, load_endpoints, record_endpoint
+from meeting_index import MeetingIndex, parse_meeting_date
+from transcript_cache import TranscriptCache
+from transcript_stream import ScrollingTranscriptReader, read_rendered_segments
+from transcript import TranscriptSegment, format_segments
+
+# Browser profile
 SESSION_DIR = Path(__file__).parent.parent / ".chrome_profile"
-COOKIES_FILE = Path(__file__).parent.parent / ".tldv_cookies.pkl"
-STORAGE_FILE = Path(__file__).parent.parent / ".tldv_storage.json"
 
-# Session validity period (12 hours)
-SESSION_MAX_AGE = 12 * 60 * 60
+# tldv pages
+MEETINGS_URL = "https://tldv.io/app/meetings"
+SIGNIN_URL = "https://tldv.io/app/signin"
+
+# Maximum meeting list pages loaded by one incremental crawl
+CRAWL_MAX_PAGES = 50
+
+# Answer name lookups from the index without crawling if it was crawled this recently
+INDEX_FRESH_SECONDS = 15 * 60
+
+# Returns [id, title, date] for every rendered meeting in one round-trip
+MEETING_LIST_SCRIPT = """
+var titles = {}, dates = {}, order = [];
+var links = document.querySelectorAll("a[href*='/app/meetings/']");
+for (var i = 0; i < links.length; i++) {
+    var id = links[i].href.split(/[?#]/)[0].replace(/\\/+$/, '').split('/').pop();
+    if (id.length < 10) { continue; }
+    var text = (links[i].innerText || '').replace(/\\s+/g, ' ').trim();
+    var time = links[i].querySelector('time');
+    if (!(id in titles)) { order.push(id); titles[id] = ''; dates[id] = ''; }
+    if (!titles[id]) { titles[id] = text; }
+    if (!dates[id] && time) { dates[id] = time.getAttribute('datetime') || ''; }
+}
+return order.map(function (id) { return [id, titles[id], dates[id]]; });
+"""
+
+# Scrolls the meeting list and clicks a "load more" button if there is one
+_LOAD_MORE_SCRIPT = """
+var links = document.querySelectorAll("a[href*='/app/meetings/']");
+if (links.length) { links[links.length - 1].scrollIntoView({block: 'end'}); }
+window.scrollTo(0, document.body.scrollHeight);
+var buttons = document.querySelectorAll('button');
+for (var i = 0; i < buttons.length; i++) {
+    if (/load more|show more|もっと見る|さらに表示/i.test(buttons[i].textContent)) {
+        buttons[i].click();
+        return true;
+    }
+}
+return false;
+"""
+
+# Default number of meeting tabs loaded concurrently in batch mode
+BATCH_MAX_TABS = 3
+
+# Transcript tab candidates on the meeting page
+TRANSCRIPT_TAB_XPATHS = [
+    "//button[contains(text(), 'Transcript')]",
+    "//button[contains(text(), '文字起こし')]",
+    "//*[contains(@data-testid, 'transcript')]",
+]
+
+# Transcript container candidates
+TRANSCRIPT_SELECTORS = [
+    "[data-testid='transcript']",
+    "[data-testid='transcript-container']",
+    "[class*='transcript']",
+    "[class*='Transcript']",
+    "div[class*='transcription']",
+]
+
+
+def meeting_id_from_url(meeting: str) -> str:
+    """Return the meeting ID from a tldv meeting URL (or a bare ID)."""
+    return meeting.split("#")[0].split("?")[0].rstrip("/").split("/")[-1]
+
+
+def meeting_url_for(meeting: str) -> str:
+    """Return the full meeting URL for a tldv meeting URL or ID."""
+    if meeting.startswith("http"):
+        return meeting
+    return f"https://tldv.io/app/meetings/{meeting}"
 
 
 class TldvScraper:
     """Scrapes meeting transcripts from tldv using undetected-chromedriver."""
 
-    def __init__(self, email: str = "", password: str = "", headless: bool = True):
+    def __init__(self, email: str = "", password: str = "", headless: bool = True,
+                 capture_network: bool = True, use_http: bool = True,
+                 use_cache: bool = True, refresh: bool = False,
+                 cache_max_age: Optional[float] = None, block_resources: bool = True,
+                 backend: str = "selenium", headless_mode: str = "auto",
+                 low_memory: bool = False, clone_profile: bool = True):
         """
         Initialize the scraper.
 
@@ -40,18 +135,73 @@ class TldvScraper:
             email: tldv account email (optional for SSO)
             password: tldv account password (optional for SSO)
             headless: Run browser in headless mode (default: True)
+            capture_network: Read the transcript from tldv's own API response
+                via DevTools before falling back to DOM scraping (default: True)
+            use_http: Try the browserless HTTP fast path with the saved session
+                before launching Chrome (default: True)
+            use_cache: Reuse transcripts from the local cache (default: True)
+            refresh: Fetch again even if the transcript is cached
+            cache_max_age: Ignore cached transcripts older than this many seconds
+                (default: None, cached transcripts never expire)
+            block_resources: Block images, video, fonts, analytics and widgets
+                per page type (see resource_blocking.py) (default: True)
+            backend: Browser backend for transcript pages, "selenium" or
+                "playwright" (see browser_backend.py) (default: "selenium")
+            headless_mode: How a headless browser hides its window: "offscreen",
+                "new" (no display needed) or "auto" (see headless.py)
+                (default: "auto")
+            low_memory: Smaller window, fewer renderer processes, capped caches
+                and one meeting tab at a time (see low_memory.py) (default: False)
+            clone_profile: Run headless browsers on a per-run clone of the
+                profile so overlapping runs do not share it (see profile_clone.py)
+                (default: True)
         """
         self.email = email
         self.password = password
         self.headless = headless
+        self.capture_network = capture_network
+        self.use_http = use_http
+        self._http: Optional[TldvHttpClient] = None
+        self.cache = TranscriptCache() if use_cache else None
+        self.refresh = refresh
+        self.cache_max_age = cache_max_age
+        self.block_resources = block_resources
+        self.backend = backend
+        self.headless_mode = headless_mode
+        self.mode_used: Optional[str] = None
+        self.low_memory = low_memory
+        self.memory: Optional[RssSampler] = None
+        self.clone_profile = clone_profile
+        self._profile_clone: Optional[Path] = None
+        self._locks = ExitStack()
+        self.blocker: Optional[ResourceBlocker] = None
+        self.startup_seconds: Optional[float] = None
+        self.navigations: List[str] = []
+        self._current_url: Optional[str] = None
+        self.chrome_version: Optional[int] = None
+        self._index: Optional[MeetingIndex] = None
         self.driver = None
-
-    def _is_session_valid(self) -> bool:
-        """Check if session cookies exist and are not too old."""
-        if not COOKIES_FILE.exists():
-            return False
-        age = time.time() - COOKIES_FILE.stat().st_mtime
-        return age < SESSION_MAX_AGE
+        self.waiter = None
+        self.capture = None
+        self._captured: Optional[List[TranscriptSegment]] = None
+        # Whether the last network capture came from a hinted URL or the learned endpoint
+        self._capture_trusted = False
+        # Whether the last transcript read from the page is complete enough to cache
+        self._cacheable = False
+        # ID of the meeting whose transcript was last returned (cache, HTTP or browser)
+        self.last_meeting_id: Optional[str] = None
+        self.sessions = SessionStore()
+        self.selectors = SelectorCache()
+        self._snapshot: Optional[Dict] = None
+        self._snapshot_loaded = False
+        self._session_unverified = False
+
+    def _session_snapshot(self) -> Optional[Dict]:
+        """Return the saved session snapshot, loading it once per run."""
+        if not self._snapshot_loaded:
+            self._snapshot = self.sessions.load()
+            self._snapshot_loaded = True
+        return self._snapshot
 
     def _create_driver(self, headless: bool = None, use_profile: bool = True):
         """Create undetected Chrome driver."""
@@ -60,95 +210,183 @@ class TldvScraper:
 
         options = uc.ChromeOptions()
 
-        # Don't use headless mode - tldv detects it
-        # Use offscreen window position instead
-        if headless:
+        # The old headless mode is detected by tldv: use an offscreen window,
+        # or the new headless mode with fingerprint adjustments (headless.py)
+        mode = resolve_mode(self.headless_mode) if headless else "window"
+        if mode == "offscreen":
             options.add_argument('--window-position=-10000,-10000')
+        elif mode == "new":
+            options.add_argument('--headless=new')
 
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
         options.add_argument('--lang=ja-JP')
         options.add_argument('--disable-blink-features=AutomationControlled')
-
-        # Use persistent profile to maintain session
+        if self.low_memory:
+            for argument in low_memory_arguments():
+                options.add_argument(argument)
+        else:
+            options.add_argument('--window-size=1920,1080')
+
+        # Use persistent profile to maintain session. Headless runs use their
+        # own clone; visible runs may log in and write the profile itself.
         if use_profile:
             SESSION_DIR.mkdir(exist_ok=True)
-            options.add_argument(f'--user-data-dir={SESSION_DIR}')
-
-        driver = uc.Chrome(options=options, version_main=144, headless=False)
+            profile = SESSION_DIR
+            if self.clone_profile and headless:
+                if self.low_memory:
+                    # Clones skip the caches, but runs on the profile itself still grow them
+                    with file_lock(SESSION_DIR, wait_message="Waiting for another run to "
+                                                             "release the browser profile..."):
+                        trim_profile_cache(SESSION_DIR)
+                self._profile_clone = clone_profile(SESSION_DIR)
+                profile = self._profile_clone or SESSION_DIR
+            if profile == SESSION_DIR:
+                self._locks.enter_context(file_lock(
+                    SESSION_DIR, wait_message="Waiting for another run to release the browser profile..."
+                ))
+                if self.low_memory:
+                    trim_profile_cache(SESSION_DIR)
+            options.add_argument(f'--user-data-dir={profile}')
+
+        if self.capture_network:
+            enable_performance_logging(options)
+
+        # Reuse the patched chromedriver cached for the installed Chrome version
+        started = time.monotonic()
+        version_main = detect_chrome_version()
+        driver_path = ensure_driver(version_main) if version_main else None
+        # --headless=new is passed above; headless.py adjusts it instead of uc's own patches
+        driver = uc.Chrome(options=options, version_main=version_main,
+                           driver_executable_path=driver_path, headless=False)
+        if mode == "new":
+            apply_fingerprint(driver)
+        if self.low_memory:
+            # Pages are read once; keep nothing in the HTTP memory cache
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        self.memory = RssSampler(driver.browser_pid).start()
+        self.startup_seconds = time.monotonic() - started
+        self.chrome_version = version_main
+        self.mode_used = mode
+        self.waiter = PageWaiter(driver)
+        # Without blocking, the blocker only measures (and learns request sizes)
+        self.blocker = ResourceBlocker(driver, BLOCK_PROFILES if self.block_resources else None)
+        self.capture = (NetworkTranscriptCapture(driver, listener=self.blocker.observe)
+                        if self.capture_network else None)
         return driver
 
-    def _save_cookies(self):
-        """Save cookies and local storage to files."""
+    def _navigate(self, url: str, page_type: str) -> bool:
+        """
+        Load a page unless it is the page the last navigation already loaded.
+
+        Args:
+            url: Page URL
+            page_type: "meeting_list", "meeting_detail" or "login"
+
+        Returns:
+            True if the page was loaded, False if the current page was reused
+        """
+        if url == self._current_url:
+            return False
+        self._block_for(page_type)
+        self.driver.get(url)
+        self._current_url = url
+        self.navigations.append(page_type)
+        return True
+
+    def _release_page(self) -> None:
+        """Unload the current page so its renderer memory is freed (low-memory mode)."""
+        self.driver.get("about:blank")
+        self._current_url = None
+
+    def _open_tab(self) -> None:
+        """Open and switch to a new tab, applying the per-tab headless adjustments."""
+        self.driver.switch_to.new_window("tab")
+        if self.mode_used == "new":
+            apply_fingerprint(self.driver)
+
+    def _on_signin_page(self) -> bool:
+        """Return True if tldv redirected to the sign-in page."""
+        current_url = self.driver.current_url
+        return "signin" in current_url or "login" in current_url
+
+    def _block_for(self, page_type: str) -> None:
+        """Apply the resource blocking profile of a page type to the current tab."""
+        if self.blocker:
+            self.blocker.apply(page_type)
+
+    def _save_session(self) -> None:
+        """Save the browser's cookies and storage as a session snapshot."""
         if self.driver:
-            # Save cookies
-            cookies = self.driver.get_cookies()
-            with open(COOKIES_FILE, 'wb') as f:
-                pickle.dump(cookies, f)
-            print(f"Cookies saved to {COOKIES_FILE}")
-
-            # Save local storage
-            local_storage = self.driver.execute_script(
-                "return JSON.stringify(localStorage);"
-            )
-            session_storage = self.driver.execute_script(
-                "return JSON.stringify(sessionStorage);"
-            )
-            storage_data = {
-                "localStorage": json.loads(local_storage) if local_storage else {},
-                "sessionStorage": json.loads(session_storage) if session_storage else {}
-            }
-            with open(STORAGE_FILE, 'w') as f:
-                json.dump(storage_data, f)
-            print(f"Storage saved to {STORAGE_FILE}")
-
-    def _load_cookies(self):
-        """Load cookies from file."""
-        if COOKIES_FILE.exists() and self.driver:
-            try:
-                with open(COOKIES_FILE, 'rb') as f:
-                    cookies = pickle.load(f)
-                for cookie in cookies:
-                    try:
-                        self.driver.add_cookie(cookie)
-                    except Exception:
-                        pass
-                return True
-            except Exception as e:
-                print(f"Error loading cookies: {e}")
-        return False
+            self._snapshot = self.sessions.save(self.driver)
+            self._snapshot_loaded = True
+            print(f"Session saved to {self.sessions.path}")
 
-    def _load_storage(self):
-        """Load local storage from file."""
-        if STORAGE_FILE.exists() and self.driver:
-            try:
-                with open(STORAGE_FILE, 'r') as f:
-                    storage_data = json.load(f)
-
-                # Restore local storage
-                for key, value in storage_data.get("localStorage", {}).items():
-                    self.driver.execute_script(
-                        f"localStorage.setItem('{key}', '{value}');"
-                    )
-                print("Local storage restored")
-                return True
-            except Exception as e:
-                print(f"Error loading storage: {e}")
-        return False
+    def _save_clone_session(self) -> None:
+        """
+        Save the session of a run on a profile clone before the clone is deleted.
 
-    def _is_logged_in(self) -> bool:
-        """Check if already logged in."""
+        Cookies and tokens tldv refreshed during the run only exist in the
+        clone; without this, rotating refresh tokens would leave the saved
+        snapshot and the master profile stale.
+        """
         try:
-            # Try to access meetings directly - profile should have session
-            self.driver.get("https://tldv.io/app/meetings")
-            time.sleep(5)
-            current_url = self.driver.current_url
-            print(f"Current URL: {current_url}")
-            return "signin" not in current_url and "login" not in current_url
+            if not self.driver.current_url.startswith("https://tldv.io/") or self._on_signin_page():
+                return
+            self._save_session()
+        except Exception as e:
+            print(f"Warning: Could not save the refreshed session: {e}")
+
+    def _verify_restored_session(self) -> bool:
+        """
+        Check the first tldv page loaded after a snapshot restore.
+
+        Returns:
+            False if tldv redirected to the sign-in page
+        """
+        if not self._session_unverified:
+            return True
+        self._session_unverified = False
+        ok = not self._on_signin_page()
+        self.sessions.record_restore_result(ok)
+        if not ok:
+            print("Saved session was rejected by tldv. Please run with --login again.")
+        return ok
+
+    def _is_logged_in(self, landing_url: Optional[str] = None) -> bool:
+        """
+        Check if already logged in.
+
+        The check loads the page the run needs first anyway (the meeting page
+        when it is known, otherwise the meeting list), so later steps reuse it.
+
+        Args:
+            landing_url: Meeting page to check on (default: the meeting list)
+        """
+        try:
+            # Try to access the app directly - profile should have session
+            if landing_url:
+                self._navigate(landing_url, "meeting_detail")
+                self.waiter.until(
+                    "meeting_page",
+                    lambda: self._on_signin_page() or self.waiter.is_present(
+                        TRANSCRIPT_TAB_XPATHS, TRANSCRIPT_SELECTORS),
+                    MEETING_PAGE_TIMEOUT,
+                )
+            else:
+                self._navigate(MEETINGS_URL, "meeting_list")
+                self.waiter.document_ready()
+                self.waiter.meeting_list()
+            print(f"Current URL: {self.driver.current_url}")
+            if self._on_signin_page():
+                self._current_url = None
+                return False
+            return True
         except Exception as e:
             print(f"Error checking login status: {e}")
+            self._current_url = None
             return False
 
     def _wait_for_login(self, timeout: int = 180) -> bool:
@@ -168,10 +406,117 @@ class TldvScraper:
             print("Login timeout")
             return False
 
+    def _meeting_index(self) -> MeetingIndex:
+        """Return the local meeting index, opening it on first use."""
+        if self._index is None:
+            self._index = MeetingIndex()
+        return self._index
+
+    def _collect_meeting_links(self) -> List[Dict]:
+        """Collect the meetings currently rendered on the list page in one script call."""
+        meetings = []
+        for meeting_id, title, date in self.driver.execute_script(MEETING_LIST_SCRIPT):
+            meetings.append({
+                "id": meeting_id,
+                "title": title,
+                "date": date or parse_meeting_date(title),
+            })
+        return meetings
+
+    def _load_more_meetings(self) -> bool:
+        """Load the next page of the meeting list. Returns False at the end."""
+        count = self.waiter.meeting_link_count()
+        self.driver.execute_script(_LOAD_MORE_SCRIPT)
+        return self.waiter.more_meetings(count)
+
+    def crawl_meetings(self, max_pages: int = CRAWL_MAX_PAGES) -> int:
+        """
+        Incrementally crawl the meeting list into the local index.
+
+        Pages are loaded newest first. Once a crawl has reached the end of the
+        list (recorded as the index's complete-down-to marker), later crawls
+        stop as soon as a page contains a meeting that is already indexed;
+        until then they continue past indexed meetings so older ones are not
+        left out.
+
+        Args:
+            max_pages: Maximum number of list pages to load
+
+        Returns:
+            Number of newly indexed meetings
+        """
+        index = self._meeting_index()
+        crawl_started = time.time()
+
+        self._navigate(MEETINGS_URL, "meeting_list")
+        self.waiter.meeting_list()
+        if not self._verify_restored_session():
+            return 0
+        self._learn_meeting_list_endpoint()
+
+        complete_to = index.complete_to()
+        seen = set()
+        oldest = None
+        new_total = 0
+        pages = 0
+        connected = False
+        while pages < max_pages:
+            pages += 1
+            meetings = [m for m in self._collect_meeting_links() if m["id"] not in seen]
+            if not meetings:
+                # Nothing more to load: the whole list has been seen
+                connected, complete_to = True, oldest
+                break
+
+            known = index.known_ids(m["id"] for m in meetings)
+            new_total += index.upsert(meetings, crawl_started=crawl_started, offset=len(seen))
+            seen.update(m["id"] for m in meetings)
+            oldest = meetings[-1]["id"]
+
+            # Everything beyond this point was indexed by an earlier crawl
+            if known and complete_to:
+                connected = True
+                break
+            if not self._load_more_meetings():
+                connected, complete_to = True, oldest
+                break
+
+        # A crawl cut off by max_pages may leave a gap above older indexed meetings
+        index.set_complete_to(complete_to if connected else None)
+        print(f"Meeting index: {new_total} new, {index.count()} total ({pages} pages crawled)")
+        return new_total
+
+    def _index_is_fresh(self) -> bool:
+        """Return True if the meeting index was crawled within INDEX_FRESH_SECONDS."""
+        last_crawled = self._meeting_index().last_crawled()
+        return bool(last_crawled) and time.time() - last_crawled < INDEX_FRESH_SECONDS
+
+    def plan_meeting_url(self, meeting_url: Optional[str] = None,
+                         meeting_id: Optional[str] = None,
+                         meeting_name: Optional[str] = None) -> Optional[str]:
+        """
+        Work out the meeting page to load without visiting the meeting list.
+
+        Returns:
+            Meeting URL if it is known up front (given, or found in a freshly
+            crawled index), None if the meeting list has to be crawled first
+        """
+        if meeting_url or meeting_id:
+            return meeting_url_for(meeting_url or meeting_id)
+        if not self._index_is_fresh():
+            return None
+        meeting = self._meeting_index().find_latest(meeting_name)
+        if meeting:
+            print(f"Found meeting in index: {meeting['title']}")
+            return meeting_url_for(meeting["id"])
+        return None
+
     def find_target_meeting(self, meeting_name: str = "AI定例") -> Optional[str]:
         """
         Find a meeting containing the specified name.
 
+        Crawls new meetings into the local index, then answers from the index.
+
         Args:
             meeting_name: Name to search for in meeting titles
 
@@ -180,73 +525,142 @@ class TldvScraper:
         """
         print(f"Searching for meeting containing: {meeting_name}")
 
-        self.driver.get("https://tldv.io/app/meetings")
-        time.sleep(5)
-
         try:
-            # Find all meeting links
-            links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/app/meetings/']")
-
-            for link in links:
-                try:
-                    href = link.get_attribute("href") or ""
-                    if "/app/meetings/" in href:
-                        meeting_id = href.split("/")[-1]
-                        if len(meeting_id) < 10:
-                            continue
-
-                        text = link.text.strip()
-                        if meeting_name in text:
-                            print(f"Found matching meeting: {text}")
-                            return href
-                except Exception:
-                    continue
-
+            self.crawl_meetings()
         except Exception as e:
-            print(f"Error finding meeting: {e}")
+            print(f"Error crawling meetings: {e}")
+
+        meeting = self._meeting_index().find_latest(meeting_name)
+        if meeting:
+            print(f"Found matching meeting: {meeting['title']}")
+            return meeting_url_for(meeting["id"])
 
         print(f"No meeting found containing: {meeting_name}")
         return None
 
-    def _extract_transcript(self) -> Optional[str]:
-        """Extract transcript from current meeting page."""
-        # Click transcript tab
-        transcript_tabs = [
-            "//button[contains(text(), 'Transcript')]",
-            "//button[contains(text(), '文字起こし')]",
-            "//*[contains(@data-testid, 'transcript')]",
-        ]
+    def _learn_meeting_list_endpoint(self) -> None:
+        """Remember the meeting list API seen while the list page loaded."""
+        if not self.capture:
+            return
+        if self.capture.poll(decode_meeting_list, MEETING_LIST_URL_HINTS, decode_meeting_list):
+            record_endpoint("meetings", self.capture.matched_url)
+
+    def _open_meeting(self, meeting_url: str) -> None:
+        """Navigate to a meeting page and wait until it is usable."""
+        # The login check may already have loaded this page; keep its network events
+        if self.capture and meeting_url != self._current_url:
+            self.capture.reset()
+        self._navigate(meeting_url, "meeting_detail")
+        # The session may also expire after it was verified (e.g. in the browser service)
+        if not self._verify_restored_session() or self._on_signin_page():
+            raise RuntimeError("Not logged in to tldv")
+        self._after_meeting_navigation()
+
+    def _after_meeting_navigation(self) -> None:
+        """Capture the transcript from the network, or wait for the DOM instead."""
+        self._captured = None
+        if self.capture:
+            self._captured = self._capture_network_transcript(NETWORK_CAPTURE_TIMEOUT)
+            if self._captured:
+                return
+        self._wait_for_meeting_page()
+
+    def _capture_network_transcript(self, timeout: float) -> Optional[List[TranscriptSegment]]:
+        """Wait for the transcript API response, giving up shortly after the page renders."""
+        state = {"segments": None, "rendered_at": None}
+        endpoint = load_endpoints().get("transcript")
+
+        def check() -> bool:
+            state["segments"] = self.capture.poll(endpoint=endpoint)
+            if state["segments"]:
+                return True
+            if state["rendered_at"] is None:
+                if self.waiter.is_present(TRANSCRIPT_TAB_XPATHS, TRANSCRIPT_SELECTORS):
+                    state["rendered_at"] = time.monotonic()
+                return False
+            return time.monotonic() - state["rendered_at"] >= NETWORK_CAPTURE_GRACE
+
+        self.waiter.until("network_transcript", check, timeout)
+        self._capture_trusted = bool(state["segments"]) and self.capture.matched_hinted
+        if state["segments"]:
+            print(f"Transcript captured from network: {len(state['segments'])} segments "
+                  f"({self.capture.matched_url})")
+            # A response matched only by its shape is not learned as the endpoint
+            if self._capture_trusted:
+                meeting_id = meeting_id_from_url(self.driver.current_url)
+                record_endpoint("transcript", self.capture.matched_url, meeting_id)
+        return state["segments"]
+
+    def _wait_for_meeting_page(self) -> None:
+        """Wait until the meeting page shows a transcript tab or container."""
+        self.waiter.document_ready()
+        self.waiter.any_present("meeting_page", TRANSCRIPT_TAB_XPATHS, TRANSCRIPT_SELECTORS)
+
+    def _extract_transcript(self, use_network: bool = True) -> Optional[str]:
+        """
+        Extract transcript from current meeting page.
 
-        for xpath in transcript_tabs:
-            try:
-                tab = self.driver.find_element(By.XPATH, xpath)
-                if tab.is_displayed():
-                    tab.click()
-                    time.sleep(2)
-                    break
-            except NoSuchElementException:
-                continue
+        Sets self._cacheable to whether the result may be cached: only API
+        payloads from a transcript URL or the learned endpoint and settled,
+        complete transcript containers qualify, not responses matched by
+        shape alone or the page-text fallback.
+
+        Args:
+            use_network: Also look for the transcript API response in the
+                performance log (off when several meeting tabs share it)
+        """
+        self._cacheable = False
+
+        # Use the transcript captured from the network if available
+        if use_network and self._captured:
+            segments, self._captured = self._captured, None
+            self._cacheable = self._capture_trusted
+            return format_segments(segments)
+
+        # Click transcript tab, trying the selector that worked last time first
+        tab_xpaths = self.selectors.order("transcript_tab", TRANSCRIPT_TAB_XPATHS)
+        index, tab, _ = self.waiter.first_visible(xpaths=tab_xpaths)
+        self.selectors.record("transcript_tab", tab_xpaths, index)
+        if tab:
+            tab.click()
+
+        # The transcript may only be requested once the tab is opened
+        if use_network and self.capture:
+            segments = self._capture_network_transcript(NETWORK_CAPTURE_GRACE)
+            if segments:
+                self._cacheable = self._capture_trusted
+                return format_segments(segments)
+
+        # Wait for the transcript to render completely
+        stable = self.waiter.transcript_stable(TRANSCRIPT_SELECTORS)
+
+        # Long transcripts only render the visible lines: scroll and collect them all
+        selectors = self.selectors.order("transcript_container", TRANSCRIPT_SELECTORS)
+        reader = ScrollingTranscriptReader(self.driver, selectors)
+        probe = reader.probe()
+        if probe and probe["scrollable"]:
+            text = format_segments(self.iter_transcript_segments(selectors, reader))
+            if len(text) > 50:
+                self.selectors.record("transcript_container", selectors, probe["selector"])
+                self._cacheable = reader.complete and len(text) >= MIN_TRANSCRIPT_LENGTH
+                return text
+
+        # Serialize the rendered segments in the page (no layout-dependent innerText)
+        index, segments, _ = read_rendered_segments(self.driver, selectors)
+        text = format_segments(segments)
+        if len(text) > 50:
+            self.selectors.record("transcript_container", selectors, index)
+            self._cacheable = stable and len(text) >= MIN_TRANSCRIPT_LENGTH
+            return text
 
         # Extract transcript text
-        transcript_selectors = [
-            "[data-testid='transcript']",
-            "[data-testid='transcript-container']",
-            "[class*='transcript']",
-            "[class*='Transcript']",
-            "div[class*='transcription']",
-        ]
-
-        for selector in transcript_selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if element.is_displayed():
-                    text = element.text
-                    if text and len(text) > 50:
-                        return text
-            except NoSuchElementException:
-                continue
-
-        # Fallback: get main content
+        index, _, text = self.waiter.first_visible(selectors=selectors, min_length=51)
+        self.selectors.record("transcript_container", selectors, index)
+        if text:
+            self._cacheable = stable and len(text) >= MIN_TRANSCRIPT_LENGTH
+            return text
+
+        # Fallback: get main content (may be page chrome; never cached)
         try:
             main = self.driver.find_element(By.CSS_SELECTOR, "main, [role='main']")
             return main.text
@@ -255,6 +669,26 @@ class TldvScraper:
 
         return None
 
+    def iter_transcript_segments(self, selectors: Optional[List[str]] = None,
+                                 reader: Optional[ScrollingTranscriptReader] = None
+                                 ) -> Iterator[TranscriptSegment]:
+        """
+        Yield transcript segments from the open meeting page while scrolling.
+
+        Works on virtualized transcript panels that only render the visible
+        lines. Segments are yielded as soon as they are rendered, so callers
+        can start processing before the scroll finishes.
+
+        Args:
+            selectors: Container selectors in the order to try
+                (default: TRANSCRIPT_SELECTORS)
+            reader: Reader to use (its complete flag tells whether the end was reached)
+        """
+        reader = reader or ScrollingTranscriptReader(self.driver,
+                                                     selectors or TRANSCRIPT_SELECTORS)
+        yield from reader
+        print(f"Scrolled transcript panel: {reader.segments} segments in {reader.steps} steps")
+
     def _save_debug_screenshot(self, name: str) -> None:
         """Save screenshot for debugging."""
         try:
@@ -267,96 +701,457 @@ class TldvScraper:
         except Exception as e:
             print(f"Failed to save screenshot: {e}")
 
-    def get_transcript_from_url(self, meeting_url: str) -> Optional[str]:
-        """Get transcript from a specific meeting URL."""
-        try:
-            self.driver = self._create_driver()
+    def _cached_transcript(self, meeting_id: str) -> Optional[str]:
+        """Return the cached transcript for a meeting unless a refresh is requested."""
+        if not self.cache or self.refresh:
+            return None
+        transcript = self.cache.get(meeting_id, max_age=self.cache_max_age)
+        if transcript:
+            self.last_meeting_id = meeting_id
+            fetched = datetime.fromtimestamp(self.cache.fetched_at(meeting_id))
+            print(f"Using cached transcript for {meeting_id} "
+                  f"(fetched {fetched:%Y-%m-%d %H:%M})")
+        return transcript
+
+    def _store_transcript(self, meeting_id: Optional[str], transcript: Optional[str]) -> None:
+        """Save a freshly fetched transcript to the cache."""
+        if self.cache and meeting_id and transcript:
+            self.cache.put(meeting_id, transcript)
+
+    def _report_timings(self) -> None:
+        """Print browser startup time, page loads and how long each page wait took."""
+        if self.startup_seconds is not None:
+            print(f"Browser startup: {self.startup_seconds:.2f}s "
+                  f"(Chrome {self.chrome_version or 'unknown'}, {self.mode_used})")
+            print(f"Navigations: {len(self.navigations)}"
+                  + (f" ({', '.join(self.navigations)})" if self.navigations else ""))
+        if self.waiter and self.waiter.timings:
+            print(self.waiter.summary())
+        if self.sessions.last_load_ms is not None:
+            print(self.sessions.summary())
+        # Request counts come from the performance log read by the network capture
+        if self.blocker and self.capture:
+            print(self.blocker.summary())
+        if self.selectors.lookups:
+            print(self.selectors.summary())
+        if self.memory:
+            print(self.memory.summary())
+
+    def start_session(self, landing_url: Optional[str] = None) -> bool:
+        """
+        Launch the browser and make sure the tldv session is authenticated.
 
-            if not self._is_logged_in():
-                print("Session expired or not found.")
-                if self.headless:
-                    print("Please run with --login option to re-authenticate.")
-                    return None
-                else:
-                    self.driver.get("https://tldv.io/app/signin")
-                    if not self._wait_for_login():
-                        print("Login failed or timed out.")
-                        return None
-                    self._save_cookies()
+        Keeps the driver open so several transcripts can be fetched with
+        fetch_transcript() before close() is called.
+
+        Args:
+            landing_url: Meeting page the run will open first; the login
+                check loads it instead of the meeting list
+
+        Returns:
+            True if the browser is ready and logged in, False otherwise
+        """
+        self.driver = self._create_driver()
+
+        # A snapshot with an unexpired token needs no login check page load;
+        # the first real page load confirms it (see _verify_restored_session)
+        snapshot = self._session_snapshot()
+        if self.sessions.is_valid(snapshot) and self.sessions.restore(self.driver, snapshot):
+            remaining = self.sessions.expires_in(snapshot) / 3600
+            print(f"Using saved session (expires in {remaining:.1f}h).")
+            self._session_unverified = True
+            return True
+
+        if self._is_logged_in(landing_url):
+            print("Using saved session.")
+            if not self.sessions.is_valid(snapshot):
+                self._save_session()
+            return True
+
+        print("Session expired or not found. Login required...")
+        if self.headless:
+            print("Please run with --login option to authenticate first.")
+            return False
 
-            if not meeting_url.startswith("http"):
-                meeting_url = f"https://tldv.io/app/meetings/{meeting_url}"
+        # No profile for the sign-in page: the SSO pages load normally
+        self._navigate(SIGNIN_URL, "login")
+        if not self._wait_for_login():
+            print("Login failed or timed out.")
+            return False
 
-            self.driver.get(meeting_url)
-            time.sleep(5)
+        self._save_session()
+        print("Login successful. Session saved.")
+        return True
+
+    def close(self) -> None:
+        """Report wait timings and shut down the browser."""
+        if self.memory:
+            self.memory.stop()
+            record_run(self.memory, headless_mode=self.mode_used, low_memory=self.low_memory)
+        self._report_timings()
+        if self.blocker:
+            self.blocker.save()
+        self.selectors.save()
+        if self._index:
+            self._index.close()
+            self._index = None
+        if self.driver and self._profile_clone:
+            self._save_clone_session()
+        if self.driver:
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
+                self.memory = None
+        self._release_profile()
+
+    def _release_profile(self) -> None:
+        """Delete this run's profile clone and release the profile lock."""
+        if self._profile_clone:
+            remove_clone(self._profile_clone)
+            self._profile_clone = None
+        self._locks.close()
+
+    def fetch_transcript(self, meeting_url: Optional[str] = None,
+                         meeting_id: Optional[str] = None,
+                         meeting_name: Optional[str] = None) -> Optional[str]:
+        """
+        Fetch a transcript using the already started browser session.
 
-            return self._extract_transcript()
+        Args:
+            meeting_url: Full meeting URL (or bare meeting ID)
+            meeting_id: tldv meeting ID
+            meeting_name: Name to search for in meeting titles
+
+        Returns:
+            Transcript text, or None if not found
+        """
+        self.last_meeting_id = None
+        try:
+            # Go straight to the meeting page when it is known without the list
+            if not meeting_url:
+                meeting_url = self.plan_meeting_url(meeting_id=meeting_id,
+                                                    meeting_name=meeting_name)
+            if meeting_url:
+                meeting_id = meeting_id_from_url(meeting_url)
+            elif meeting_name:
+                meeting_url = self.find_target_meeting(meeting_name)
+                if not meeting_url:
+                    print(f"Could not find meeting: {meeting_name}")
+                    return None
+                meeting_id = meeting_id_from_url(meeting_url)
+
+            if meeting_id:
+                cached = self._cached_transcript(meeting_id)
+                if cached:
+                    return cached
+                self._open_meeting(meeting_url_for(meeting_url or meeting_id))
+            else:
+                # Get first meeting
+                self.crawl_meetings()
+                latest = self._meeting_index().find_latest()
+                if not latest:
+                    print("No meetings found")
+                    return None
+                meeting_id = latest["id"]
+                cached = self._cached_transcript(meeting_id)
+                if cached:
+                    return cached
+                self._open_meeting(meeting_url_for(meeting_id))
+
+            transcript = self._extract_transcript()
+            if self._cacheable:
+                self._store_transcript(meeting_id, transcript)
+            if transcript:
+                self.last_meeting_id = meeting_id
+            if self.low_memory:
+                self._release_page()
+            return transcript
 
         except Exception as e:
             print(f"Error getting transcript: {e}")
             self._save_debug_screenshot("error")
             return None
-        finally:
-            if self.driver:
-                self.driver.quit()
 
-    def get_latest_transcript(self, meeting_id: Optional[str] = None,
-                              meeting_name: Optional[str] = None) -> Optional[str]:
-        """Get transcript from the latest or specified meeting."""
-        try:
-            self.driver = self._create_driver()
+    def iter_transcripts(self, meetings: List[str],
+                         max_tabs: int = BATCH_MAX_TABS) -> Iterator[Dict]:
+        """
+        Fetch many transcripts concurrently using a bounded pool of tabs.
 
-            if not self._is_logged_in():
-                print("Session expired or not found. Login required...")
+        Meetings load in parallel tabs of the already started session and
+        results are yielded as soon as each one is extracted, in completion
+        order rather than input order.
 
-                if self.headless:
-                    print("Please run with --login option to authenticate first.")
-                    return None
+        Args:
+            meetings: Meeting URLs or IDs
+            max_tabs: Maximum number of tabs loading at the same time
 
-                self.driver.get("https://tldv.io/app/signin")
-                if not self._wait_for_login():
-                    print("Login failed or timed out.")
-                    return None
+        Yields:
+            Dict with meeting, url, transcript (or None), seconds and error
+        """
+        pending = deque(meetings)
+        active = {}
+        home = self.driver.current_window_handle
+        if self.low_memory:
+            # One meeting renderer at a time; the home tab keeps no page loaded
+            max_tabs = 1
+            self._release_page()
+
+        while pending or active:
+            # Fill the tab pool
+            while pending and len(active) < max_tabs:
+                meeting = pending.popleft()
+                url = meeting_url_for(meeting)
+                self._open_tab()
+                self._block_for("meeting_detail")
+                # Assigning location returns immediately, unlike driver.get()
+                self.driver.execute_script("window.location.href = arguments[0];", url)
+                self.navigations.append("meeting_detail")
+                active[self.driver.current_window_handle] = (meeting, url, time.monotonic())
+
+            # Extract from every tab that is ready (or has timed out)
+            for handle, (meeting, url, started) in list(active.items()):
+                self.driver.switch_to.window(handle)
+                elapsed = time.monotonic() - started
+                ready = self.waiter.is_present(TRANSCRIPT_TAB_XPATHS, TRANSCRIPT_SELECTORS)
+                if not ready and elapsed < MEETING_PAGE_TIMEOUT:
+                    continue
 
-                self._save_cookies()
-                print("Login successful. Session saved.")
-            else:
-                print("Using saved session.")
+                result = {"meeting": meeting, "url": url, "transcript": None, "error": None}
+                try:
+                    if not self._verify_restored_session():
+                        result["error"] = "Not logged in to tldv"
+                    elif ready:
+                        result["transcript"] = self._extract_transcript(use_network=False)
+                        if result["transcript"]:
+                            if self._cacheable:
+                                self._store_transcript(meeting_id_from_url(meeting),
+                                                       result["transcript"])
+                        else:
+                            result["error"] = "Transcript not found"
+                    else:
+                        result["error"] = f"Page not ready after {MEETING_PAGE_TIMEOUT}s"
+                except Exception as e:
+                    result["error"] = str(e)
+
+                result["seconds"] = round(time.monotonic() - started, 3)
+                if self.capture:
+                    # Tabs share one performance log, so batch tabs read the DOM only;
+                    # drop the events they produced
+                    self.capture.reset()
+                self.driver.close()
+                del active[handle]
+                self.driver.switch_to.window(home)
+                yield result
+
+            if active:
+                time.sleep(POLL_INTERVAL)
+
+    def _http_client(self) -> Optional[TldvHttpClient]:
+        """Return the browserless client if it can be used for this run."""
+        if not self.use_http:
+            return None
+        if self._http is None:
+            self._http = TldvHttpClient(self._session_snapshot(), self.sessions)
+        return self._http if self._http.is_ready() else None
 
-            # Find meeting
-            if meeting_name:
-                meeting_url = self.find_target_meeting(meeting_name)
-                if meeting_url:
-                    self.driver.get(meeting_url)
-                    time.sleep(5)
-                else:
-                    print(f"Could not find meeting: {meeting_name}")
-                    return None
-            elif meeting_id:
-                self.driver.get(f"https://tldv.io/app/meetings/{meeting_id}")
-                time.sleep(5)
+    def _fetch_via_http(self, meeting_url: Optional[str] = None,
+                        meeting_id: Optional[str] = None,
+                        meeting_name: Optional[str] = None) -> Optional[str]:
+        """
+        Fetch a transcript without a browser using the saved session.
+
+        Returns:
+            Transcript text, or None if the caller should fall back to Chrome
+        """
+        client = self._http_client()
+        if not client:
+            return None
+
+        started = time.monotonic()
+        if meeting_url:
+            meeting_id = meeting_id_from_url(meeting_url)
+        if not meeting_id:
+            meetings = client.list_meetings()
+            if meetings:
+                self._meeting_index().upsert(meetings)
+            meeting = client.find_meeting(meeting_name)
+            if not meeting:
+                print("HTTP fast path: meeting not found in list. Falling back to browser.")
+                return None
+            print(f"Found matching meeting: {meeting['title']}")
+            meeting_id = meeting["id"]
+            cached = self._cached_transcript(meeting_id)
+            if cached:
+                return cached
+
+        transcript = client.fetch_transcript(meeting_id)
+        if transcript:
+            print(f"Fetched via HTTP in {time.monotonic() - started:.2f}s (no browser)")
+            self._store_transcript(meeting_id, transcript)
+            self.last_meeting_id = meeting_id
+        else:
+            print("HTTP fast path unavailable. Falling back to browser.")
+        return transcript
+
+    def _run_backend(self, work, meetings: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        Run an async flow from browser_backend on the configured backend.
+
+        Cacheable results are cached as they arrive and the backend is closed afterwards.
+
+        Args:
+            work: Async generator function taking the backend
+            meetings: Meetings the work fetches, reported as failed one by one
+                if the backend cannot start
+        """
+        # Imported here: browser_backend depends on this module
+        from browser_backend import create_backend, run_sync
+
+        backend = create_backend(self.backend, self)
+        try:
+            for result in run_sync(backend, work, meetings):
+                if result["transcript"] and result.get("cacheable"):
+                    self._store_transcript(meeting_id_from_url(result["url"]),
+                                           result["transcript"])
+                yield result
+        finally:
+            if self._index:
+                self._index.close()
+                self._index = None
+            if backend.startup_seconds is not None:
+                print(f"Browser startup ({backend.name}): {backend.startup_seconds:.2f}s")
+                print(f"Navigations: {len(backend.navigations)}"
+                      + (f" ({', '.join(backend.navigations)})" if backend.navigations else ""))
+
+    def _backend_transcript(self, work) -> Optional[str]:
+        """Run a single-meeting flow on the configured backend and return its transcript."""
+        try:
+            for result in self._run_backend(work):
+                if result["error"]:
+                    print(f"Error getting transcript: {result['error']}")
+                if result["transcript"] and result["url"]:
+                    self.last_meeting_id = meeting_id_from_url(result["url"])
+                return result["transcript"]
+        except Exception as e:
+            print(f"Error getting transcript: {e}")
+        return None
+
+    def get_transcripts(self, meetings: List[str],
+                        max_tabs: int = BATCH_MAX_TABS) -> Iterator[Dict]:
+        """
+        Fetch transcripts for several meetings in a single browser session.
+
+        Args:
+            meetings: Meeting URLs or IDs
+            max_tabs: Maximum number of tabs loading at the same time
+
+        Yields:
+            Per-meeting result dicts as each meeting completes
+        """
+        # Serve what we can from the cache or over HTTP; launch Chrome for the rest
+        remaining = []
+        for meeting in meetings:
+            started = time.monotonic()
+            transcript = self._cached_transcript(meeting_id_from_url(meeting))
+            if not transcript and self._http_client():
+                transcript = self._fetch_via_http(meeting_url=meeting)
+            if transcript:
+                yield {"meeting": meeting, "url": None, "transcript": transcript,
+                       "seconds": round(time.monotonic() - started, 3), "error": None}
             else:
-                # Get first meeting
-                self.driver.get("https://tldv.io/app/meetings")
-                time.sleep(5)
+                remaining.append(meeting)
 
-                links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/app/meetings/']")
-                for link in links:
-                    href = link.get_attribute("href") or ""
-                    if "/app/meetings/" in href and len(href.split("/")[-1]) > 10:
-                        link.click()
-                        time.sleep(5)
-                        break
+        if not remaining:
+            return
 
-            return self._extract_transcript()
+        if self.backend != "selenium":
+            # Imported here: browser_backend depends on this module
+            from browser_backend import fetch_transcripts
+            yield from self._run_backend(
+                lambda backend: fetch_transcripts(backend, remaining, concurrency=max_tabs),
+                meetings=remaining,
+            )
+            return
 
+        try:
+            if not self.start_session():
+                for meeting in remaining:
+                    yield {"meeting": meeting, "url": None, "transcript": None,
+                           "seconds": 0.0, "error": "Session unavailable"}
+                return
+            yield from self.iter_transcripts(remaining, max_tabs=max_tabs)
+        finally:
+            self.close()
+
+    def get_transcript_from_url(self, meeting_url: str) -> Optional[str]:
+        """Get transcript from a specific meeting URL."""
+        self.last_meeting_id = None
+        transcript = (self._cached_transcript(meeting_id_from_url(meeting_url))
+                      or self._fetch_via_http(meeting_url=meeting_url))
+        if transcript:
+            return transcript
+
+        if self.backend != "selenium":
+            # Imported here: browser_backend depends on this module
+            from browser_backend import fetch_transcripts
+            return self._backend_transcript(
+                lambda backend: fetch_transcripts(backend, [meeting_url])
+            )
+
+        try:
+            if not self.start_session(landing_url=meeting_url_for(meeting_url)):
+                return None
+            return self.fetch_transcript(meeting_url=meeting_url)
         except Exception as e:
             print(f"Error getting transcript: {e}")
             self._save_debug_screenshot("error")
             return None
         finally:
-            if self.driver:
-                self.driver.quit()
+            self.close()
+
+    def get_latest_transcript(self, meeting_id: Optional[str] = None,
+                              meeting_name: Optional[str] = None) -> Optional[str]:
+        """Get transcript from the latest or specified meeting."""
+        self.last_meeting_id = None
+        transcript = meeting_id and self._cached_transcript(meeting_id)
+        transcript = transcript or self._fetch_via_http(
+            meeting_id=meeting_id, meeting_name=meeting_name
+        )
+        if transcript:
+            return transcript
+
+        # Land on the meeting page directly when it is known; otherwise the
+        # login check loads the meeting list, which the crawl then reuses
+        landing_url = self.plan_meeting_url(meeting_id=meeting_id, meeting_name=meeting_name)
+        if landing_url and not meeting_id:
+            transcript = self._cached_transcript(meeting_id_from_url(landing_url))
+            if transcript:
+                return transcript
+
+        if self.backend != "selenium":
+            # Imported here: browser_backend depends on this module
+            from browser_backend import fetch_latest, fetch_transcripts
+            if landing_url:
+                return self._backend_transcript(
+                    lambda backend: fetch_transcripts(backend, [landing_url])
+                )
+            return self._backend_transcript(
+                lambda backend: fetch_latest(backend, self._meeting_index(), meeting_name,
+                                             cached=self._cached_transcript)
+            )
+
+        try:
+            if not self.start_session(landing_url=landing_url):
+                return None
+            return self.fetch_transcript(meeting_url=landing_url, meeting_id=meeting_id,
+                                         meeting_name=meeting_name)
+        except Exception as e:
+            print(f"Error getting transcript: {e}")
+            self._save_debug_screenshot("error")
+            return None
+        finally:
+            self.close()
 
     def interactive_login(self) -> bool:
         """Perform interactive login with visible browser."""
@@ -371,8 +1166,8 @@ class TldvScraper:
             print("=" * 50 + "\n")
 
             if self._wait_for_login(timeout=180):
-                time.sleep(3)
-                self._save_cookies()
+                self.waiter.document_ready()
+                self._save_session()
                 print("\n✅ ログイン成功！セッションを保存しました。")
                 print(f"プロファイル保存先: {SESSION_DIR}")
                 print("次回以降は自動的にログインされます。")
@@ -387,6 +1182,7 @@ class TldvScraper:
         finally:
             if self.driver:
                 self.driver.quit()
+            self._release_profile()
 
 
 def main():
@@ -0,0 +1,455 @@
+"""
+Transcript Data Types
+
+Structured transcript model shared across the pipeline, from the scraper's
+extraction paths to the minutes generator.
+
+A Transcript stores every segment as (speaker id, start ms, end ms, text
+offset) in compact arrays over one shared text buffer. Slicing by time or
+speaker returns a view over the same buffers without copying text, and the
+transcript is rendered back to plain text only once, when the prompt is built.
+"""
+
+import json
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Marker stored in the time arrays for unknown timestamps
+_NO_TIME = -1
+
+
+class TranscriptSegment(NamedTuple):
+    """One speaker turn in a transcript."""
+
+    speaker: str
+    start_ms: Optional[int]
+    end_ms: Optional[int]
+    text: str
+
+
+def format_timestamp(ms: Optional[int]) -> str:
+    """Format milliseconds as H:MM:SS (or M:SS under an hour)."""
+    if ms is None:
+        return ""
+    seconds = ms // 1000
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def parse_timestamp(text: str) -> Optional[int]:
+    """
+    Parse a timestamp such as "1:23", "01:02:03" or "83.5" into milliseconds.
+
+    Returns:
+        Milliseconds, or None if the text is not a timestamp
+    """
+    text = (text or "").strip().replace(",", ".")
+    if not text:
+        return None
+    try:
+        seconds = 0.0
+        for part in text.split(":"):
+            seconds = seconds * 60 + float(part)
+    except ValueError:
+        return None
+    return int(seconds * 1000)
+
+
+def format_segment(segment: TranscriptSegment) -> str:
+    """Render one segment as "[M:SS] Speaker: text"."""
+    prefix = f"[{format_timestamp(segment.start_ms)}] " if segment.start_ms is not None else ""
+    speaker = f"{segment.speaker}: " if segment.speaker else ""
+    return f"{prefix}{speaker}{segment.text}"
+
+
+def format_segments(segments: Iterable[TranscriptSegment]) -> str:
+    """
+    Render segments as plain transcript text.
+
+    Each segment becomes one line: "[M:SS] Speaker: text".
+    """
+    return "\n".join(format_segment(segment) for segment in segments)
+
+
+def _split_text(text: str, max_chars: int) -> List[str]:
+    """Cut text into pieces of at most max_chars characters, preferring line breaks."""
+    pieces: List[str] = []
+    current = None
+    for line in text.split("\n"):
+        while len(line) > max_chars:
+            if current is not None:
+                pieces.append(current)
+                current = None
+            pieces.append(line[:max_chars])
+            line = line[max_chars:]
+        if current is None:
+            current = line
+        elif len(current) + 1 + len(line) <= max_chars:
+            current += "\n" + line
+        else:
+            pieces.append(current)
+            current = line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+class _TranscriptData:
+    """Shared, immutable buffers behind one or more Transcript views."""
+
+    __slots__ = ("text", "speakers", "speaker_ids", "starts", "ends", "offsets")
+
+    def __init__(self, segments: Iterable[TranscriptSegment]):
+        speaker_index: Dict[str, int] = {}
+        self.speakers: List[str] = []
+        self.speaker_ids = array("i")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.offsets = array("q", [0])
+        parts = []
+        length = 0
+
+        for segment in segments:
+            speaker_id = speaker_index.get(segment.speaker)
+            if speaker_id is None:
+                speaker_id = speaker_index[segment.speaker] = len(self.speakers)
+                self.speakers.append(segment.speaker)
+            self.speaker_ids.append(speaker_id)
+            self.starts.append(_NO_TIME if segment.start_ms is None else segment.start_ms)
+            self.ends.append(_NO_TIME if segment.end_ms is None else segment.end_ms)
+            parts.append(segment.text)
+            length += len(segment.text)
+            self.offsets.append(length)
+
+        self.text = "".join(parts)
+
+
+class Transcript:
+    """Compact, array-backed sequence of transcript segments."""
+
+    __slots__ = ("_data", "_rows")
+
+    def __init__(self, segments: Iterable[TranscriptSegment] = (),
+                 _data: Optional[_TranscriptData] = None,
+                 _rows: Optional[Sequence[int]] = None):
+        """
+        Build a transcript from segments.
+
+        Args:
+            segments: Transcript segments in time order
+        """
+        self._data = _data if _data is not None else _TranscriptData(segments)
+        self._rows = _rows if _rows is not None else range(len(self._data.speaker_ids))
+
+    def _view(self, rows: Sequence[int]) -> "Transcript":
+        """Return a view over the same buffers restricted to the given rows."""
+        return Transcript(_data=self._data, _rows=rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __bool__(self) -> bool:
+        return len(self._rows) > 0
+
+    def _segment(self, row: int) -> TranscriptSegment:
+        """Materialize one stored row as a TranscriptSegment."""
+        data = self._data
+        start, end = data.starts[row], data.ends[row]
+        return TranscriptSegment(
+            speaker=data.speakers[data.speaker_ids[row]],
+            start_ms=None if start == _NO_TIME else start,
+            end_ms=None if end == _NO_TIME else end,
+            text=data.text[data.offsets[row]:data.offsets[row + 1]],
+        )
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TranscriptSegment, "Transcript"]:
+        if isinstance(index, slice):
+            return self._view(self._rows[index])
+        return self._segment(self._rows[index])
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        for row in self._rows:
+            yield self._segment(row)
+
+    @property
+    def speakers(self) -> List[str]:
+        """Speakers appearing in this transcript, in order of first appearance."""
+        data = self._data
+        seen = dict.fromkeys(data.speakers[data.speaker_ids[row]] for row in self._rows)
+        return [speaker for speaker in seen if speaker]
+
+    @property
+    def char_count(self) -> int:
+        """Total number of text characters in this transcript."""
+        offsets = self._data.offsets
+        if isinstance(self._rows, range) and self._rows.step == 1:
+            return offsets[self._rows.stop] - offsets[self._rows.start] if self._rows else 0
+        return sum(offsets[row + 1] - offsets[row] for row in self._rows)
+
+    def between(self, start_ms: int, end_ms: int) -> "Transcript":
+        """
+        Return the segments starting within [start_ms, end_ms), without copying.
+
+        Segments without a timestamp are excluded.
+        """
+        starts = self._data.starts
+        if isinstance(self._rows, range) and self._rows.step == 1:
+            lo, hi = self._rows.start, self._rows.stop
+            # Binary search works when timestamps are ascending (the normal case)
+            if all(starts[i] <= starts[i + 1] for i in range(lo, hi - 1)):
+                first = bisect_left(starts, max(start_ms, 0), lo, hi)
+                last = bisect_right(starts, end_ms - 1, lo, hi)
+                return self._view(range(first, last))
+        return self._view(array("i", (
+            row for row in self._rows if start_ms <= starts[row] < end_ms
+        )))
+
+    def by_speaker(self, speaker: str) -> "Transcript":
+        """Return the segments of one speaker, without copying text."""
+        data = self._data
+        try:
+            speaker_id = data.speakers.index(speaker)
+        except ValueError:
+            return self._view(range(0))
+        return self._view(array("i", (
+            row for row in self._rows if data.speaker_ids[row] == speaker_id
+        )))
+
+    def chunks(self, max_chars: int) -> List["Transcript"]:
+        """
+        Split into consecutive views of at most max_chars text characters.
+
+        Splits between speaker turns without copying. Turns longer than
+        max_chars (e.g. unstructured text parsed as one turn) are first cut
+        at line breaks, or mid-line if a line is too long, keeping their
+        speaker and time; only then is the text copied.
+        """
+        offsets = self._data.offsets
+        if any(offsets[row + 1] - offsets[row] > max_chars for row in self._rows):
+            return Transcript(
+                TranscriptSegment(segment.speaker, segment.start_ms, segment.end_ms, piece)
+                for segment in self
+                for piece in _split_text(segment.text, max_chars)
+            ).chunks(max_chars)
+
+        chunks = []
+        start = size = 0
+        for i, row in enumerate(self._rows):
+            length = offsets[row + 1] - offsets[row]
+            if size and size + length > max_chars:
+                chunks.append(self[start:i])
+                start, size = i, 0
+            size += length
+        if size or start < len(self._rows):
+            chunks.append(self[start:])
+        return chunks
+
+    def render(self) -> str:
+        """Render the transcript as prompt text (one "[M:SS] Speaker: text" line per turn)."""
+        return format_segments(self)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    @classmethod
+    def parse(cls, text: str, fmt: Optional[str] = None) -> "Transcript":
+        """
+        Parse transcript text, detecting the format if not given.
+
+        Args:
+            text: Transcript text (tldv page/clipboard text, VTT, SRT or JSON)
+            fmt: "tldv", "vtt", "srt" or "json" (default: auto-detect)
+
+        Returns:
+            Parsed transcript (unstructured text becomes speaker-less segments)
+        """
+        return cls._parse(text, fmt)[0]
+
+    @classmethod
+    def recognize(cls, text: str, fmt: Optional[str] = None) -> Optional["Transcript"]:
+        """
+        Parse transcript text only if it matches a known layout as a whole.
+
+        Use this where the text may not be a transcript at all (a pasted file
+        or clipboard): the caller keeps the raw text when None is returned,
+        so nothing is rewritten or dropped by a partial match.
+
+        Args:
+            text: Transcript text (tldv page/clipboard text, VTT, SRT or JSON)
+            fmt: "tldv", "vtt", "srt" or "json" (default: auto-detect)
+
+        Returns:
+            Parsed transcript, or None if some of the text is not in a known layout
+        """
+        transcript, recognized = cls._parse(text, fmt)
+        return transcript if recognized and transcript else None
+
+    @classmethod
+    def _parse(cls, text: str, fmt: Optional[str]) -> Tuple["Transcript", bool]:
+        """Parse text (see parse). Returns the transcript and whether the whole text was recognized."""
+        stripped = text.lstrip("﻿ \n\r\t")
+        if fmt is None:
+            if stripped.startswith("WEBVTT"):
+                fmt = "vtt"
+            elif stripped[:1] in ("{", "["):
+                fmt = "json"
+            elif _SRT_TIMING.search(stripped[:200]):
+                fmt = "srt"
+            else:
+                fmt = "tldv"
+
+        if fmt == "json":
+            transcript = parse_json(stripped)
+            if transcript is not None:
+                return transcript, True
+            fmt = "tldv"
+        if fmt in ("vtt", "srt"):
+            transcript = parse_cues(stripped)
+            return transcript, bool(transcript)
+        return _parse_tldv(text)
+
+
+# "[1:23] Speaker: text" (format_segments output)
+_BRACKET_LINE = re.compile(r"^\[(\d{1,2}(?::\d{2}){1,2})\]\s*(?:([^:：]{1,40})[:：]\s*)?(.*)$")
+# "Speaker  01:23" / "Speaker (01:23)" / "01:23 Speaker" header lines
+_HEADER_SPEAKER_TIME = re.compile(r"^(.{1,40}?)\s*[\s(（]\s*(\d{1,2}(?::\d{2}){1,2})\s*[)）]?$")
+_HEADER_TIME_SPEAKER = re.compile(r"^(\d{1,2}(?::\d{2}){1,2})\s+(.{1,40})$")
+# "Speaker: text"
+_SPEAKER_LINE = re.compile(r"^([^:：\s][^:：]{0,30})[:：]\s*(.+)$")
+# A speaker name has at least one letter (not "10" in "10:00")
+_SPEAKER_NAME = re.compile(r"[^\W\d_]")
+# VTT/SRT cue timing
+_SRT_TIMING = re.compile(r"(\d{1,2}:\d{2}:\d{2}[.,]\d{1,3})\s*-->\s*(\d{1,2}:\d{2}:\d{2}[.,]\d{1,3})")
+_VOICE_TAG = re.compile(r"^<v(?:\.[^ >]+)?\s+([^>]+)>(.*?)(?:</v>)?$")
+
+
+def _speaker_of(match: "re.Match") -> Optional[str]:
+    """Return the speaker of a _SPEAKER_LINE match, or None if the colon is not a speaker's."""
+    name = match.group(1).strip()
+    if not _SPEAKER_NAME.search(name) or name.lower().startswith("http"):
+        return None
+    # "会議は 10:30 から": the colon belongs to a time, not a speaker
+    if name[-1].isdigit() and match.group(2)[:1].isdigit():
+        return None
+    return name
+
+
+def parse_tldv_text(text: str) -> Transcript:
+    """
+    Parse transcript text copied from the tldv page or clipboard.
+
+    Recognizes "[M:SS] Speaker: text" lines, "Speaker 00:01:23" header lines
+    followed by text, and "Speaker: text" lines. Other lines continue the
+    previous turn (or become speaker-less segments), and header-like lines
+    with no text after them are kept as text, so no input is lost.
+    """
+    return _parse_tldv(text)[0]
+
+
+def _parse_tldv(text: str) -> Tuple[Transcript, bool]:
+    """Parse tldv text (see parse_tldv_text). Returns the transcript and whether every line fit the layout."""
+    segments: List[TranscriptSegment] = []
+    speaker, start, lines = "", None, []
+    header = None  # Header line whose text has not been seen yet
+    recognized = True
+
+    def flush():
+        nonlocal header, recognized
+        if lines:
+            segments.append(TranscriptSegment(speaker, start, None, "\n".join(lines)))
+            lines.clear()
+        elif header is not None:
+            # "12:30 ランチ休憩" on its own is text, not a speaker turn
+            segments.append(TranscriptSegment("", None, None, header))
+            recognized = False
+        header = None
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+
+        match = _BRACKET_LINE.match(line)
+        if match:
+            flush()
+            start = parse_timestamp(match.group(1))
+            speaker = (match.group(2) or "").strip()
+            if match.group(3):
+                lines.append(match.group(3))
+            continue
+
+        match = _HEADER_TIME_SPEAKER.match(line) or _HEADER_SPEAKER_TIME.match(line)
+        if match:
+            first, second = match.groups()
+            if match.re is _HEADER_TIME_SPEAKER:
+                header_start, header_speaker = parse_timestamp(first), second.strip()
+            else:
+                header_speaker, header_start = first.strip(), parse_timestamp(second)
+            if _SPEAKER_NAME.search(header_speaker):
+                flush()
+                speaker, start, header = header_speaker, header_start, line
+                continue
+
+        match = _SPEAKER_LINE.match(line)
+        name = _speaker_of(match) if match else None
+        if name:
+            flush()
+            speaker, start = name, None
+            lines.append(match.group(2))
+            continue
+
+        if not speaker and start is None:
+            recognized = False
+        lines.append(line)
+
+    flush()
+    return Transcript(segments), recognized
+
+
+def parse_cues(text: str) -> Transcript:
+    """Parse WebVTT or SRT subtitles into a transcript."""
+    segments: List[TranscriptSegment] = []
+
+    for block in re.split(r"\n\s*\n", text.replace("\r\n", "\n")):
+        block_lines = [line.strip() for line in block.strip().split("\n")]
+        for i, line in enumerate(block_lines):
+            timing = _SRT_TIMING.search(line)
+            if not timing:
+                continue
+            start, end = parse_timestamp(timing.group(1)), parse_timestamp(timing.group(2))
+            speaker, parts = "", []
+            for cue_line in block_lines[i + 1:]:
+                voice = _VOICE_TAG.match(cue_line)
+                if voice:
+                    speaker, cue_line = voice.group(1).strip(), voice.group(2)
+                else:
+                    named = _SPEAKER_LINE.match(cue_line)
+                    name = _speaker_of(named) if named and not parts else None
+                    if name:
+                        speaker, cue_line = name, named.group(2)
+                parts.append(re.sub(r"<[^>]+>", "", cue_line))
+            cue_text = " ".join(part for part in parts if part)
+            if cue_text:
+                segments.append(TranscriptSegment(speaker, start, end, cue_text))
+            break
+
+    return Transcript(segments)
+
+
+def parse_json(text: str) -> Optional[Transcript]:
+    """Parse a JSON transcript export. Returns None if the JSON is not recognized."""
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return None
+
+    # Imported here: network_capture depends on this module
+    from network_capture import decode_transcript_payload
+
+    segments = decode_transcript_payload(payload)
+    return Transcript(segments) if segments else None
@@ -0,0 +1,161 @@
+"""
+On-disk Transcript Cache
+
+Content-addressed cache of fetched transcripts keyed by tldv meeting ID.
+Transcript bodies are stored once per SHA-256 hash; a small JSON index maps
+meeting IDs to their hash, fetch time and size. The cache is bounded in size
+and evicts the least recently used entries first.
+
+Index changes are merged into the file under its lock, so overlapping runs
+do not lose each other's entries.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from file_lock import atomic_write, file_lock
+
+# Cache location
+CACHE_DIR = Path(__file__).parent.parent / ".transcript_cache"
+
+# Maximum total size of cached transcripts (bytes)
+MAX_CACHE_BYTES = 100 * 1024 * 1024
+
+
+class TranscriptCache:
+    """Stores transcripts on disk, keyed by meeting ID."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the index and transcript blobs
+            max_bytes: Maximum total size of stored transcripts
+        """
+        self.cache_dir = cache_dir
+        self.blob_dir = cache_dir / "blobs"
+        self.index_file = cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self._index: Optional[Dict[str, Dict]] = None
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Load the meeting ID index."""
+        if self._index is None:
+            self._index = {}
+            if self.index_file.exists():
+                try:
+                    self._index = json.loads(self.index_file.read_text())
+                except ValueError:
+                    print("Warning: Transcript cache index is corrupt. Starting fresh.")
+        return self._index
+
+    def _update_index(self, change: Callable[[Dict[str, Dict]], None]) -> None:
+        """Apply a change to the latest on-disk index and write it back under its lock."""
+        with file_lock(self.index_file):
+            self._index = None
+            change(self._load_index())
+            atomic_write(self.index_file, json.dumps(self._index, indent=2))
+
+    def _blob_path(self, digest: str) -> Path:
+        """Return the file path for a content hash."""
+        return self.blob_dir / f"{digest}.txt"
+
+    def get(self, meeting_id: str, max_age: Optional[float] = None) -> Optional[str]:
+        """
+        Return a cached transcript.
+
+        Args:
+            meeting_id: tldv meeting ID
+            max_age: Maximum age in seconds (None: any age)
+
+        Returns:
+            Transcript text, or None if missing, expired or corrupt
+        """
+        index = self._load_index()
+        entry = index.get(meeting_id)
+        if not entry:
+            return None
+
+        if max_age is not None and time.time() - entry["fetched_at"] > max_age:
+            return None
+
+        path = self._blob_path(entry["hash"])
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            self._update_index(lambda index: index.pop(meeting_id, None))
+            return None
+
+        if hashlib.sha256(text.encode("utf-8")).hexdigest() != entry["hash"]:
+            print(f"Warning: Cached transcript for {meeting_id} is corrupt. Discarding.")
+            self._update_index(lambda index: index.pop(meeting_id, None))
+            return None
+
+        now = time.time()
+
+        def touch(index: Dict[str, Dict]) -> None:
+            if meeting_id in index:
+                index[meeting_id]["last_used"] = now
+
+        self._update_index(touch)
+        return text
+
+    def put(self, meeting_id: str, transcript: str) -> str:
+        """
+        Store a transcript.
+
+        Args:
+            meeting_id: tldv meeting ID
+            transcript: Transcript text
+
+        Returns:
+            SHA-256 content hash of the stored transcript
+        """
+        data = transcript.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        path = self._blob_path(digest)
+        if not path.exists():
+            atomic_write(path, data)
+
+        now = time.time()
+
+        def add(index: Dict[str, Dict]) -> None:
+            index[meeting_id] = {
+                "hash": digest,
+                "fetched_at": now,
+                "last_used": now,
+                "size": len(data),
+            }
+            self._evict()
+
+        self._update_index(add)
+        return digest
+
+    def fetched_at(self, meeting_id: str) -> Optional[float]:
+        """Return when a meeting's transcript was fetched (epoch seconds)."""
+        entry = self._load_index().get(meeting_id)
+        return entry["fetched_at"] if entry else None
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits max_bytes."""
+        index = self._load_index()
+
+        sizes = {entry["hash"]: entry["size"] for entry in index.values()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        for meeting_id, entry in sorted(index.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            del index[meeting_id]
+            digest = entry["hash"]
+            # Blobs may be shared by several meeting IDs with identical content
+            if not any(e["hash"] == digest for e in index.values()):
+                self._blob_path(digest).unlink(missing_ok=True)
+                total -= sizes[digest]
@@ -0,0 +1,249 @@
+"""
+In-page Transcript Extraction
+
+Reads transcript segments (speaker, timestamp, text) from the rendered
+transcript DOM with injected scripts. Rows are walked with textContent
+instead of innerText, so no layout is computed, and segments come back as
+compact JSON rather than one flattened string.
+
+tldv only renders the visible window of lines for long transcripts, so the
+container's text is truncated. ScrollingTranscriptReader scrolls the
+container step by step and yields newly rendered segments as it goes.
+Segments are de-duplicated by segment ID (or timestamp and text) within a
+bounded window of recent keys, so memory stays constant regardless of
+meeting length.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
+
+from transcript import TranscriptSegment, parse_timestamp
+
+# Fraction of the visible height scrolled per step
+SCROLL_STEP = 0.8
+
+# Wait after each scroll for the panel to render new rows (seconds)
+RENDER_DELAY = 0.15
+
+# Stop after this many steps without new segments at the bottom of the panel
+IDLE_STEPS = 3
+
+# Safety limit on scroll steps (about 10 hours of dense transcript)
+MAX_STEPS = 5000
+
+# Number of recent segment keys remembered for de-duplication
+DEDUP_WINDOW = 2000
+
+# Finds the transcript container and returns its rows as
+# [key, speaker, time, text] without layout-dependent innerText.
+# Defines: container, selectorIndex, rows.
+_READ_ROWS_JS = """
+var selectors = arguments[0];
+var container = null, selectorIndex = -1;
+for (var i = 0; i < selectors.length && !container; i++) {
+    container = document.querySelector(selectors[i]);
+    selectorIndex = i;
+}
+
+var ROW = "[data-segment-id], [data-start], [data-index], [data-testid*='segment'], " +
+          "[class*='segment'], [class*='Segment']";
+var SPEAKER = "[class*='speaker'], [class*='Speaker'], [data-testid*='speaker']";
+var STAMP = "time, [class*='timestamp'], [class*='Timestamp'], [class*='time']";
+
+function clean(text) { return (text || '').replace(/\\s+/g, ' ').trim(); }
+
+function textOf(row, skip) {
+    var parts = [];
+    var walker = document.createTreeWalker(row, NodeFilter.SHOW_TEXT);
+    for (var node = walker.nextNode(); node; node = walker.nextNode()) {
+        var parent = node.parentElement;
+        if (parent && skip.some(function (el) { return el.contains(parent); })) { continue; }
+        if (parent && /^(SCRIPT|STYLE|BUTTON)$/.test(parent.tagName)) { continue; }
+        parts.push(node.nodeValue);
+    }
+    return clean(parts.join(' '));
+}
+
+var rows = [];
+if (container) {
+    var nodes = container.querySelectorAll(ROW);
+    if (!nodes.length) { nodes = container.children; }
+    for (var j = 0; j < nodes.length; j++) {
+        var row = nodes[j];
+        // Skip parts of a row that match the row selectors themselves
+        var outer = row.parentElement && row.parentElement.closest(ROW);
+        if (outer && outer !== container && container.contains(outer)) { continue; }
+        var speakerEl = row.querySelector(SPEAKER), stampEl = row.querySelector(STAMP);
+        var text = textOf(row, [speakerEl, stampEl].filter(Boolean));
+        if (!text) { continue; }
+        var key = row.getAttribute('data-segment-id') || row.getAttribute('data-index') ||
+                  row.getAttribute('data-start') || '';
+        var stamp = stampEl ? clean(stampEl.textContent) : '';
+        rows.push([key, speakerEl ? clean(speakerEl.textContent) : '',
+                   stamp || row.getAttribute('data-start') || '', text]);
+    }
+}
+"""
+
+# Returns the whole rendered transcript as one JSON string:
+# {selector, rows: [[speaker, time, text]]}, speaker only where it changes.
+SERIALIZE_SEGMENTS_SCRIPT = _READ_ROWS_JS + """
+if (!container) { return null; }
+var out = [], last = null;
+for (var k = 0; k < rows.length; k++) {
+    var speaker = rows[k][1];
+    out.push([speaker === last ? '' : speaker, rows[k][2], rows[k][3]]);
+    if (speaker) { last = speaker; }
+}
+return JSON.stringify({selector: selectorIndex, rows: out});
+"""
+
+# Returns the rendered rows and scrolls the panel one step.
+# Returns {found, selector (index of the matching selector), rows: [[key, speaker, time, text]],
+# done, scrollable} or {found: false}.
+_COLLECT_AND_SCROLL_SCRIPT = _READ_ROWS_JS + """
+var step = arguments[1], doScroll = arguments[2];
+if (!container) { return {found: false}; }
+
+function scroller(el) {
+    var node = el;
+    while (node && node !== document.body) {
+        if (node.scrollHeight > node.clientHeight + 4) {
+            var style = getComputedStyle(node).overflowY;
+            if (style === 'auto' || style === 'scroll') { return node; }
+        }
+        node = node.parentElement;
+    }
+    var inner = el.querySelectorAll('*');
+    for (var k = 0; k < inner.length; k++) {
+        var s = getComputedStyle(inner[k]).overflowY;
+        if ((s === 'auto' || s === 'scroll') && inner[k].scrollHeight > inner[k].clientHeight + 4) {
+            return inner[k];
+        }
+    }
+    return null;
+}
+
+var panel = scroller(container);
+var done = true;
+if (panel) {
+    done = panel.scrollTop + panel.clientHeight >= panel.scrollHeight - 4;
+    if (doScroll && !done) { panel.scrollTop += panel.clientHeight * step; }
+}
+return {found: true, selector: selectorIndex, rows: rows, done: done, scrollable: !!panel};
+"""
+
+
+def read_rendered_segments(driver, selectors: List[str]
+                           ) -> Tuple[Optional[int], List[TranscriptSegment], int]:
+    """
+    Serialize the rendered transcript in one script call.
+
+    Args:
+        driver: Selenium WebDriver positioned on a meeting page
+        selectors: CSS selectors that may match the transcript container
+
+    Returns:
+        (index of the matching selector or None, segments, payload size in characters)
+    """
+    return decode_rendered_segments(driver.execute_script(SERIALIZE_SEGMENTS_SCRIPT, selectors))
+
+
+def decode_rendered_segments(payload: Optional[str]
+                             ) -> Tuple[Optional[int], List[TranscriptSegment], int]:
+    """Decode the JSON returned by SERIALIZE_SEGMENTS_SCRIPT (see read_rendered_segments)."""
+    if not payload:
+        return None, [], 0
+
+    data = json.loads(payload)
+    segments = []
+    speaker = ""
+    for row_speaker, stamp, text in data["rows"]:
+        speaker = row_speaker or speaker
+        segments.append(TranscriptSegment(speaker=speaker, start_ms=parse_timestamp(stamp),
+                                          end_ms=None, text=text))
+    return data["selector"], segments, len(payload)
+
+
+class ScrollingTranscriptReader:
+    """Scrolls a virtualized transcript panel and yields segments as they render."""
+
+    def __init__(self, driver, selectors: List[str]):
+        """
+        Initialize the reader.
+
+        Args:
+            driver: Selenium WebDriver positioned on a meeting page
+            selectors: CSS selectors that may match the transcript container
+        """
+        self.driver = driver
+        self.selectors = selectors
+        self.steps = 0
+        self.segments = 0
+        # True once the end of the panel was reached (not cut off by MAX_STEPS)
+        self.complete = False
+
+    def probe(self) -> Optional[dict]:
+        """Inspect the panel without scrolling. Returns None if no container is found."""
+        state = self.driver.execute_script(
+            _COLLECT_AND_SCROLL_SCRIPT, self.selectors, SCROLL_STEP, False
+        )
+        return state if state.get("found") else None
+
+    def _scroll_to_top(self) -> None:
+        """Start reading from the first line of the transcript."""
+        self.driver.execute_script("""
+            var selectors = arguments[0];
+            for (var i = 0; i < selectors.length; i++) {
+                var el = document.querySelector(selectors[i]);
+                if (!el) { continue; }
+                for (var n = el; n && n !== document.body; n = n.parentElement) {
+                    n.scrollTop = 0;
+                }
+                el.querySelectorAll('*').forEach(function (c) {
+                    if (c.scrollTop) { c.scrollTop = 0; }
+                });
+                return;
+            }
+        """, self.selectors)
+        time.sleep(RENDER_DELAY)
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        """Yield transcript segments in order while scrolling through the panel."""
+        seen: "OrderedDict[str, None]" = OrderedDict()
+        idle = 0
+        # Rows after the first of a speaker's turn have no speaker header
+        last_speaker = ""
+        self._scroll_to_top()
+
+        while self.steps < MAX_STEPS:
+            self.steps += 1
+            state = self.driver.execute_script(
+                _COLLECT_AND_SCROLL_SCRIPT, self.selectors, SCROLL_STEP, True
+            )
+            if not state.get("found"):
+                return
+
+            new = 0
+            for key, speaker, stamp, text in state["rows"]:
+                dedup_key = key or f"{stamp}|{speaker}|{text[:80]}"
+                if dedup_key in seen:
+                    continue
+                seen[dedup_key] = None
+                if len(seen) > DEDUP_WINDOW:
+                    seen.popitem(last=False)
+                new += 1
+                self.segments += 1
+                last_speaker = speaker or last_speaker
+                start_ms = parse_timestamp(stamp)
+                yield TranscriptSegment(speaker=last_speaker, start_ms=start_ms, end_ms=None,
+                                        text=text)
+
+            if state["done"]:
+                idle = idle + 1 if new == 0 else 0
+                if idle >= IDLE_STEPS or not state["scrollable"]:
+                    self.complete = True
+                    return
+            time.sleep(RENDER_DELAY)
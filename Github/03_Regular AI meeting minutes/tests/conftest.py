@@ -0,0 +1,6 @@
+"""Make the flat modules in src/ importable, as the scripts there expect."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
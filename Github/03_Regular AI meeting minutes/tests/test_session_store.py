@@ -0,0 +1,18 @@
+"""Tests for restoring saved session cookies over a profile's own."""
+
+from session_store import newer_cookies
+
+
+def test_newer_profile_cookie_is_kept():
+    saved = [{"name": "session", "value": "old", "domain": ".tldv.io", "expiry": 200}]
+    current = [{"name": "session", "value": "new", "domain": "tldv.io", "path": "/",
+                "expires": 300}]
+    assert newer_cookies(saved, current) == []
+
+
+def test_missing_or_older_profile_cookie_is_replaced():
+    saved = [{"name": "session", "value": "saved", "expiry": 200},
+             {"name": "auth", "value": "saved", "expiry": 200}]
+    current = [{"name": "session", "value": "stale", "domain": "tldv.io", "path": "/",
+                "expires": 100}]
+    assert newer_cookies(saved, current) == saved
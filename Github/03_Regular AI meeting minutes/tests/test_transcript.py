@@ -0,0 +1,62 @@
+"""Tests for transcript parsing: nothing the user wrote may be changed or lost."""
+
+import pytest
+
+from transcript import Transcript, TranscriptSegment, parse_tldv_text
+
+# Text that looks partly like a tldv transcript but is not one
+UNSTRUCTURED = [
+    "10:00",
+    "3:1",
+    "12:30 ランチ休憩",
+    "来週の月曜 10:00",
+    "会議は 10:30 から",
+]
+
+
+@pytest.mark.parametrize("text", UNSTRUCTURED)
+def test_unstructured_text_round_trips(text):
+    assert parse_tldv_text(text).render() == text
+
+
+@pytest.mark.parametrize("text", UNSTRUCTURED)
+def test_unstructured_text_is_not_recognized(text):
+    assert Transcript.recognize(text) is None
+
+
+def test_header_without_text_is_kept():
+    transcript = parse_tldv_text("山中 00:01\n始めます\n12:30 ランチ休憩\n田中 00:10\nはい")
+    assert "12:30 ランチ休憩" in transcript.render()
+    assert transcript.speakers == ["山中", "田中"]
+
+
+def test_tldv_layouts_are_recognized():
+    rendered = "[0:01] 山中: 始めます\n[0:10] 田中: はい"
+    assert Transcript.recognize(rendered).render() == rendered
+
+    headers = Transcript.recognize("山中 00:01\n始めます\n田中 00:10\nはい")
+    assert headers.render() == rendered
+
+    speakers = Transcript.recognize("山中: 始めます\n田中: はい")
+    assert speakers.speakers == ["山中", "田中"]
+
+
+def test_notes_with_a_speaker_line_are_not_recognized():
+    assert Transcript.recognize("議題メモ\n山中: 始めます") is None
+
+
+def test_unstructured_text_chunks_fit_the_limit():
+    text = "\n".join(f"{i}行目のメモです。" * 20 for i in range(1500))
+    chunks = Transcript.parse(text).chunks(30000)
+    assert len(chunks) > 1
+    assert all(chunk.char_count <= 30000 for chunk in chunks)
+    assert "\n".join(chunk.render() for chunk in chunks) == text
+
+
+def test_single_long_turn_is_split_with_its_speaker():
+    transcript = Transcript([TranscriptSegment("山中", 1000, None, "あ" * 250),
+                             TranscriptSegment("田中", 9000, None, "はい")])
+    chunks = transcript.chunks(100)
+    assert [chunk.char_count for chunk in chunks] == [100, 100, 50 + 2]
+    assert all(segment.speaker == "山中" for chunk in chunks[:2] for segment in chunk)
+    assert chunks[0][0].start_ms == 1000
@@ -0,0 +1,44 @@
+"""Tests for the in-page transcript readers, with a fake driver instead of Chrome."""
+
+import json
+
+from transcript import format_segments
+from transcript_stream import ScrollingTranscriptReader, decode_rendered_segments
+
+# [key, speaker, time, text]; follow-up rows of a turn have no speaker header
+ROWS = [
+    ["s1", "山中", "0:00", "始めましょう"],
+    ["s2", "", "0:04", "まず先週の振り返りです"],
+    ["s3", "田中", "0:10", "はい"],
+    ["s4", "", "0:15", "資料を共有します"],
+    ["s5", "", "0:21", "見えていますか"],
+]
+
+
+class FakeDriver:
+    """Returns the fixture rows in pages, like a virtualized panel being scrolled."""
+
+    def __init__(self, rows, page_size=2):
+        self.pages = [rows[i:i + page_size] for i in range(0, len(rows), page_size)]
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        if len(args) < 3:  # scroll to top
+            return None
+        page = self.pages[min(self.calls, len(self.pages) - 1)]
+        self.calls += 1
+        done = self.calls >= len(self.pages)
+        return {"found": True, "rows": page, "done": done, "scrollable": not done}
+
+
+def test_scrolling_reader_carries_speaker_like_rendered_segments():
+    payload = json.dumps({"selector": 0, "rows": [row[1:] for row in ROWS]})
+    _, rendered, _ = decode_rendered_segments(payload)
+
+    reader = ScrollingTranscriptReader(FakeDriver(ROWS), ["div"])
+    scrolled = list(reader)
+
+    assert [s.speaker for s in scrolled] == ["山中", "山中", "田中", "田中", "田中"]
+    assert scrolled == rendered
+    assert format_segments(scrolled) == format_segments(rendered)
+    assert reader.complete